@@ -0,0 +1,227 @@
+""" Load test of the /run API endpoint against a stub Docker Engine.
+
+    The stub Docker Engine serves N local images on /images/json, keeps the /events stream open
+    and runs the containers instantly: create, start, attach (a single output frame), wait and
+    remove. The API server runs in the process, and C clients post /run requests on keep-alive
+    connections. The requests/second is measured with:
+
+    - per request checks: the container engines are started and the installation is checked by
+      listing the images for every request. Without the Docker events that's the only way to
+      notice the images changed by others.
+    - warm state: PlatformState starts the engines and checks the installation only at the first
+      request, the check is redone only after an image event.
+
+    Usage:
+        python -m benchmarks.api_load [--requests 500] [--clients 1 8] [--images 1000]
+"""
+# benchmarks/api_load.py
+
+import argparse
+import http.client
+import json
+import logging
+import socket
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Event, Thread
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from docker import DockerClient
+
+import dem.api.main
+from dem.core.api_server import APIServer
+from dem.core.core import Core
+from dem.core.dev_env import DevEnv
+from dem.core.hosts import Host
+from dem.core.platform_state import PlatformState
+from dem.core.user_output import NoUserOutput
+
+_API_VERSION = "1.43"
+
+class StubDockerEngineHandler(BaseHTTPRequestHandler):
+    """ Serve the endpoints used by the /run requests. """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    images_json = b"[]"
+    container_ids = count()
+    stopped = Event()
+
+    def _send_json(self, status: int, payload: object) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_no_content(self) -> None:
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _read_body(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path.endswith("/images/json"):
+            body = self.images_json
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif path.endswith("/events"):
+            # No image changes during the benchmark, keep the stream open.
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.flush()
+            self.stopped.wait()
+            self.close_connection = True
+        elif path.endswith("/stats"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps({"memory_stats": {"usage": 1024}}).encode() + b"\n")
+            self.close_connection = True
+        elif "/containers/" in path and path.endswith("/json"):
+            container_id = path.split("/containers/")[1][:-len("/json")]
+            self._send_json(200, {"Id": container_id, "Config": {"Tty": False}})
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path
+        self._read_body()
+        if path.endswith("/containers/create"):
+            self._send_json(201, {"Id": f"stub{next(self.container_ids)}", "Warnings": []})
+        elif path.endswith("/start"):
+            self._send_no_content()
+        elif path.endswith("/attach"):
+            # Hijack the connection and send a single stdout frame.
+            output = b"done\n"
+            self.send_response(101, "UPGRADED")
+            self.send_header("Content-Type", "application/vnd.docker.raw-stream")
+            self.send_header("Connection", "Upgrade")
+            self.send_header("Upgrade", "tcp")
+            self.end_headers()
+            self.wfile.write(struct.pack(">BxxxL", 1, len(output)) + output)
+            self.wfile.flush()
+            self.close_connection = True
+        elif path.endswith("/wait"):
+            self._send_json(200, {"StatusCode": 0})
+        else:
+            self.send_error(404)
+
+    def do_DELETE(self) -> None:
+        self._send_no_content()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+class PerRequestState(PlatformState):
+    """ Check everything again for every request. """
+    def start_engines(self, dev_env: DevEnv) -> None:
+        dev_env.start_engines()
+
+    def is_installation_correct(self, dev_env: DevEnv) -> bool:
+        for task in dev_env.tasks.values():
+            task.host.container_engine.invalidate_image_index()
+        return dev_env.is_installation_correct()
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def post_run(port: int, request_count: int) -> None:
+    """ Post the /run requests on a keep-alive connection. """
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    body = json.dumps({"dev_env_name": "bench", "task_name": "build", "extra_args": ""})
+    try:
+        for _ in range(request_count):
+            connection.request("POST", "/run", body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            payload = response.read()
+            if response.status != 200:
+                raise RuntimeError(f"/run failed: {response.status} {payload}")
+    finally:
+        connection.close()
+
+def measure(port: int, request_count: int, client_count: int) -> float:
+    """ Returns with the requests/second. """
+    per_client = [request_count // client_count] * client_count
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=client_count) as executor:
+        for future in [executor.submit(post_run, port, n) for n in per_client]:
+            future.result()
+    return sum(per_client) / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--images", type=int, default=1000)
+    args = parser.parse_args()
+
+    StubDockerEngineHandler.images_json = json.dumps([
+        {"Id": f"sha256:{i}", "RepoTags": [f"bench/image{i}:latest"], "Size": 1024, "Labels": {}}
+        for i in range(args.images)
+    ]).encode()
+    docker_server = ThreadingHTTPServer(("127.0.0.1", 0), StubDockerEngineHandler)
+    docker_server.daemon_threads = True
+    Thread(target=docker_server.serve_forever, daemon=True).start()
+    docker_url = f"tcp://127.0.0.1:{docker_server.server_address[1]}"
+
+    Core.set_user_output(NoUserOutput())
+    host = Host({"name": "local", "address": docker_url})
+    host.container_engine._docker_client = DockerClient(base_url=docker_url, version=_API_VERSION,
+                                                        max_pool_size=64)
+    dev_env = DevEnv({
+        "name": "bench",
+        "installed": "True",
+        "tools": [],
+        "docker_tasks": [{
+            "name": "build", "host_name": "local", "image": "bench/image0:latest",
+            "command": "make", "rm": True, "mount_workdir": False, "connect_to_network": False,
+            "extra_args": "", "enable_api": False
+        }]
+    }, SimpleNamespace(local=host, remotes={}))
+
+    platform = SimpleNamespace(get_dev_env_by_name=lambda name: dev_env if name == "bench" else None,
+                               state=None)
+    dem.api.main.platform = platform
+
+    port = get_free_port()
+    api_server = APIServer(dem.api.main.app, "127.0.0.1", port, keep_alive_timeout_s=60)
+    logging.getLogger("uvicorn.access").disabled = True
+    logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
+    api_server.start()
+    while not api_server.server.started:
+        time.sleep(0.05)
+
+    print(f"{'clients':>7} {'mode':>20} {'requests/s':>12}")
+    try:
+        for client_count in args.clients:
+            for name, state in (("per request checks", PerRequestState()),
+                                ("warm state", PlatformState())):
+                platform.state = state
+                # Warm up the connections and the state.
+                post_run(port, 1)
+                requests_per_s = measure(port, args.requests, client_count)
+                print(f"{client_count:>7} {name:>20} {requests_per_s:>12.0f}")
+                state.close()
+    finally:
+        api_server.stop()
+        StubDockerEngineHandler.stopped.set()
+        docker_server.shutdown()
+
+if __name__ == "__main__":
+    main()
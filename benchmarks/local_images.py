@@ -0,0 +1,117 @@
+""" Benchmark the listing of the local images against a stub Docker Engine.
+
+    The stub Docker Engine serves N images on the /images/json endpoint and answers the per image
+    /images/<id>/json inspect requests. The latency and the peak memory of the high-level
+    images.list() (used before) and of filling the image index of the ContainerEngine (the raw
+    /images/json endpoint, as at the first is_image_local() query) are measured.
+
+    Usage:
+        python -m benchmarks.local_images [--images 1000 5000 10000]
+"""
+# benchmarks/local_images.py
+
+import argparse
+import json
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Callable
+from urllib.parse import urlsplit
+
+from docker import DockerClient
+
+from dem.core.container_engine import ContainerEngine
+
+_API_VERSION = "1.43"
+
+class StubDockerEngineHandler(BaseHTTPRequestHandler):
+    """ Serve the /images/json and the /images/<id>/json endpoints. """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    images: list[dict] = []
+    images_json = b"[]"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path.endswith("/images/json"):
+            payload = self.images_json
+        elif "/images/" in path and path.endswith("/json"):
+            image_id = path.split("/images/")[1][:-len("/json")]
+            index = int(image_id.rsplit(":", 1)[1])
+            image = self.images[index]
+            payload = json.dumps({
+                "Id": image["Id"],
+                "RepoTags": image["RepoTags"],
+                "Config": {"Labels": {}, "Env": ["PATH=/usr/bin"]},
+                "RootFS": {"Layers": [f"sha256:{index:064x}"]}
+            }).encode()
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+def measure(function: Callable[[], object]) -> tuple[float, float, int]:
+    """ Run the function.
+
+        Returns with the elapsed time in seconds, the peak memory in MiB and the result length.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), len(result)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, nargs="+", default=[1000, 5000, 10000])
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDockerEngineHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"tcp://127.0.0.1:{server.server_address[1]}"
+
+    docker_client = DockerClient(base_url=url, version=_API_VERSION)
+    container_engine = ContainerEngine(url)
+    container_engine._docker_client = docker_client
+
+    def fill_image_index() -> dict[str, str]:
+        container_engine.invalidate_image_index()
+        container_engine.is_image_local("bench/image0:latest")
+        return container_engine._local_image_ids
+
+    print(f"{'images':>7} {'method':>24} {'latency [s]':>12} {'peak memory [MiB]':>18} {'tags':>7}")
+    try:
+        for image_count in args.images:
+            StubDockerEngineHandler.images = [
+                {"Id": f"sha256:{i}", "RepoTags": [f"bench/image{i}:latest", f"bench/image{i}:v1.0.0"],
+                 "Size": 1024, "Labels": {}}
+                for i in range(image_count)
+            ]
+            StubDockerEngineHandler.images_json = json.dumps(StubDockerEngineHandler.images).encode()
+
+            methods = {
+                "images.list()": lambda: [tag for image in docker_client.images.list()
+                                          for tag in image.tags],
+                "is_image_local()": fill_image_index,
+            }
+            for name, function in methods.items():
+                elapsed, peak_mib, tag_count = measure(function)
+                print(f"{image_count:>7} {name:>24} {elapsed:>12.3f} {peak_mib:>18.1f} {tag_count:>7}")
+    finally:
+        docker_client.close()
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
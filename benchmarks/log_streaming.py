@@ -0,0 +1,81 @@
+""" Benchmark the streaming of the container output to the terminal.
+
+    A stub container emits N log lines, one line per frame like a chatty build tool flushing its
+    output after every line. The throughput (lines/second) of printing each line through the rich
+    console (used before) and of ContainerEngine's raw passthrough is measured. The output is
+    written to /dev/null.
+
+    Usage:
+        python -m benchmarks.log_streaming [--lines 10000 100000] [--log-prefix "task | "]
+"""
+# benchmarks/log_streaming.py
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+from unittest.mock import MagicMock
+
+from dem.cli.tui.tui_user_output import TUIUserOutput
+from dem.core.container_engine import ContainerEngine
+from dem.core.core import Core
+
+class StubContainer():
+    """ Serve the frames of the attach endpoint like a non-tty container. """
+    def __init__(self, line_count: int) -> None:
+        self.frames = [(f"[{i:>6}] Compiling src/module_{i % 500}.c -> build/module_{i % 500}.o\n".encode(),
+                        None) for i in range(line_count)]
+
+    def attach(self, **kwargs) -> list[tuple[bytes | None, bytes | None]]:
+        return self.frames
+
+def rich_per_line(user_output: TUIUserOutput, container: StubContainer, log_prefix: str) -> None:
+    """ The former implementation: one markup-parsed rich print per frame. """
+    for stdout, _ in container.attach():
+        user_output.msg(log_prefix + stdout.decode().strip())
+
+def raw_passthrough(user_output: TUIUserOutput, container: StubContainer, log_prefix: str) -> None:
+    container_engine = ContainerEngine("unix://stub")
+    container_engine._docker_client = MagicMock()
+    container_engine._docker_client.containers.run.return_value = container
+    Core.set_user_output(user_output)
+    container_engine.run("stub", remove=False, log_prefix=log_prefix)
+
+def measure(function: Callable[[], None]) -> float:
+    """ Run the function with the stdout redirected to /dev/null.
+
+        Returns with the elapsed time in seconds.
+    """
+    original_stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            start = time.perf_counter()
+            function()
+            return time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--log-prefix", default="")
+    args = parser.parse_args()
+
+    user_output = TUIUserOutput()
+    methods = {
+        "rich per line": rich_per_line,
+        "raw passthrough": raw_passthrough,
+    }
+
+    print(f"{'lines':>7} {'method':>16} {'elapsed [s]':>12} {'lines/s':>12}")
+    for line_count in args.lines:
+        container = StubContainer(line_count)
+        for name, method in methods.items():
+            elapsed = measure(lambda: method(user_output, container, args.log_prefix))
+            print(f"{line_count:>7} {name:>16} {elapsed:>12.3f} {line_count / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+""" Benchmark the tag listing of a registry against a local stub Docker Registry.
+
+    The stub registry serves N repositories with a configurable latency per request. The wall-clock
+    time of listing all the tool images is measured for different repository counts and
+    max_concurrency values.
+
+    Usage:
+        python -m benchmarks.registry_tags [--latency-ms 20] [--repos 10 50 100 300]
+                                          [--concurrency 1 8 32]
+"""
+# benchmarks/registry_tags.py
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlsplit
+
+from dem.core.core import Core
+from dem.core.registry import DockerRegistry
+
+class StubRegistryHandler(BaseHTTPRequestHandler):
+    """ Serve the paginated /v2/_catalog and the /v2/<repo>/tags/list endpoints. """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    repo_count = 0
+    latency_s = 0.0
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency_s)
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        link = None
+        if url.path == "/v2/_catalog":
+            # Paginated like the Docker Registry: ?n=<page size>&last=<index of the last repo>
+            page_size = int(query.get("n", [self.repo_count])[0])
+            first = int(query.get("last", [-1])[0]) + 1
+            last = min(first + page_size, self.repo_count)
+            body = {"repositories": [{"name": f"bench/repo{i}"} for i in range(first, last)]}
+            if last < self.repo_count:
+                link = f'</v2/_catalog?n={page_size}&last={last - 1}>; rel="next"'
+        elif url.path.endswith("/tags/list"):
+            body = {"tags": ["latest", "v1.0.0", "v1.1.0"]}
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if link:
+            self.send_header("Link", link)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+def run_benchmark(url: str, max_concurrency: int) -> tuple[float, int]:
+    """ List the repos of the stub registry.
+
+        Returns with the elapsed time in seconds and the number of the listed tool images.
+    """
+    Core.config_file.http_request_timeout_s = 10
+    Core.config_file.max_concurrency = max_concurrency
+    Core.config_file.registry_page_size = 100
+    registry = DockerRegistry({"name": "bench", "url": url})
+
+    start = time.perf_counter()
+    repos = registry.repos
+    return time.perf_counter() - start, len(repos)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--repos", type=int, nargs="+", default=[10, 50, 100, 300])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    StubRegistryHandler.latency_s = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRegistryHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"Stub registry latency: {args.latency_ms} ms/request")
+    print(f"{'repos':>6} {'max_concurrency':>16} {'wall-clock [s]':>15} {'tool images':>12}")
+    try:
+        for repo_count in args.repos:
+            StubRegistryHandler.repo_count = repo_count
+            for max_concurrency in args.concurrency:
+                elapsed, image_count = run_benchmark(url, max_concurrency)
+                print(f"{repo_count:>6} {max_concurrency:>16} {elapsed:>15.3f} {image_count:>12}")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+""" Benchmark the startup of the dem CLI.
+
+    Each command is run N times with `python -X importtime -m dem`, in a temporary HOME so the
+    configuration of the user is not touched. The median wall time, the total import time and the
+    modules with the highest cumulative import time are reported. The command exits with 1 if the
+    median wall time of a command is over the budget.
+
+    Usage:
+        python -m benchmarks.startup [--commands "--help" "list-reg"] [--runs 5] [--budget-ms 600]
+"""
+# benchmarks/startup.py
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+def run_dem(args: list[str], home: str) -> tuple[float, list[tuple[int, str]]]:
+    """ Run dem once.
+
+        Returns with the wall time in ms and the (cumulative import time in us, module) pairs.
+    """
+    env = dict(os.environ, HOME=home)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "dem", *args], env=env,
+                            stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), module))
+    return wall_ms, imports
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", nargs="+", default=["--help", "list-reg", "list-host"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=600)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    over_budget = []
+    with tempfile.TemporaryDirectory() as home:
+        for command in args.commands:
+            # The first run creates the configuration files.
+            run_dem(command.split(), home)
+            runs = [run_dem(command.split(), home) for _ in range(args.runs)]
+            wall_ms = statistics.median(wall for wall, _ in runs)
+            imports = runs[-1][1]
+            # The top level modules (no indentation) add up to the total import time.
+            total_import_ms = sum(cumulative for cumulative, module in imports
+                                  if not module.startswith("  ")) / 1000
+
+            print(f"dem {command}: {wall_ms:.0f} ms wall (median of {args.runs}), "
+                  f"{total_import_ms:.0f} ms import")
+            for cumulative, module in sorted(imports, reverse=True)[:args.top]:
+                print(f"    {cumulative / 1000:>8.1f} ms  {module.rstrip()}")
+
+            if wall_ms > args.budget_ms:
+                over_budget.append(command)
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -4,22 +4,33 @@
 from dem import __command__
 from dem.cli.console import stderr, stdout
 from dem.core.exceptions import RegistryError, ContainerEngineError, InternalError, DataStorageError, \
-                                CatalogError, ToolImageError
+                                CatalogError, ToolImageError, DataStorageConflictError
 import dem.cli.main
-import dem.api.main
 from dem.core.core import Core
 from dem.core.platform import Platform
+from dem.core.data_management import NameIndexJSON
 from dem.cli.tui.tui_user_output import TUIUserOutput
 import docker.errors
 import typer
+import os
+
+# Set by the shell when it requests the completions.
+_COMPLETE_VAR = f"_{__command__.replace('-', '_').upper()}_COMPLETE"
 
 def main() -> None:
     """ Entry point for DEM"""
 
+    if _COMPLETE_VAR in os.environ:
+        # The completions come from the name index, the Platform (the Docker Engine connection 
+        # and the descriptors) is not needed.
+        dem.cli.main.name_index = NameIndexJSON()
+        dem.cli.main.name_index.update()
+        dem.cli.main.typer_cli(prog_name=__command__)
+        return
+
     # Create the Development Platform
     platform = Platform()
     dem.cli.main.platform = platform
-    dem.api.main.platform = platform
 
     # Connect the UI to the user output interface
     Core.set_user_output(TUIUserOutput())
@@ -46,7 +57,8 @@ def main() -> None:
             stdout.print("\nHint: The input repository might not exist in the registry.")
         elif "400" in str(e):
             stdout.print("\nHint: The input parameters might not be valid.")
-    except (ContainerEngineError, InternalError, ToolImageError, CatalogError) as e:
+    except (ContainerEngineError, InternalError, ToolImageError, CatalogError, 
+            DataStorageConflictError) as e:
         stderr.print(f"[red]{str(e)}[/]")
     except DataStorageError as e:
         stderr.print("[red]" + str(e) + "[/]")
@@ -60,7 +72,7 @@ def main() -> None:
     
     finally:
         # Close the API server if it's running
-        if platform.api_server.server.started:
+        if platform.api_server is not None and platform.api_server.server.started:
             platform.api_server.stop()
 
 # Call the main() when run as `python -m`
@@ -1,13 +1,25 @@
 """ This module contains the FastAPI application that serves as the API for the DEM. """
 # dem/api/main.py
 
-from fastapi import HTTPException
+import asyncio
+import codecs
+import json
+import uuid
+from typing import AsyncGenerator
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from dem.core.platform import Platform
-from dem.core.commands.run_cmd import execute as run_execute
+from dem.core.jobs import Job
+from dem.core.exceptions import DevEnvError, JobError, JobQueueFullError
+from dem.core.commands.run_cmd import get_exit_code
 
+app = FastAPI()
 platform: Platform | None = None
 
+# An SSE comment is sent after this much idle time, so the proxies keep the connection open.
+sse_keepalive_interval_s: float = 15
+
 class RunCommandRequest(BaseModel):
     """ Request model for the run command. 
 
@@ -20,23 +32,340 @@ class RunCommandRequest(BaseModel):
     task_name: str
     extra_args: str
 
-@Platform.fastapi_app.post("/run")
+@app.post("/run")
 def run_command(request: RunCommandRequest) -> dict:
     """ Run the given task in the given Development Environment.
+
+        The container engines are started and the installation is checked only at the first 
+        request of the Development Environment (see PlatformState), so the following requests 
+        only pay for running the containers.
     
         Args:
             request -- the request containing the Development Environment name, the task name, 
                         and the extra arguments
             
         Returns:
-            a dictionary containing the status and message
+            a dictionary containing the status, the message, the exit code and the results of the
+            tasks
+
+        Raises:
+            HTTPException -- if the Development Environment or the task doesn't exist (404), the 
+                             Development Environment is not installed (400) or the task couldn't
+                             be run (500)
     """
     dev_env_name = request.dev_env_name
     task_name = request.task_name
-    extra_args = request.extra_args
+
+    dev_env = platform.get_dev_env_by_name(dev_env_name)
+    if dev_env is None:
+        raise HTTPException(status_code=404, 
+                            detail=f"Unknown Development Environment: {dev_env_name}")
+    if not dev_env.is_installed:
+        raise HTTPException(status_code=400, 
+                            detail=f"The {dev_env_name} Development Environment is not installed.")
+    if task_name not in dev_env.tasks:
+        raise HTTPException(status_code=404, 
+                            detail=f"Task {task_name} not found in {dev_env_name}")
 
     try:
-        run_execute(platform, dev_env_name, task_name, extra_args)
-        return {"status": "success", "message": f"Task {task_name} executed in {dev_env_name}"}
+        platform.state.start_engines(dev_env)
+        if not platform.state.is_installation_correct(dev_env):
+            raise DevEnvError(f"The {dev_env_name} Development Environment is not installed correctly.")
+        # The same task might be run by other requests at the same time.
+        results = dev_env.run_tasks([task_name], name_suffix=uuid.uuid4().hex)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+    exit_code = get_exit_code(results)
+    if exit_code == 0:
+        status = "success"
+        message = f"Task {task_name} executed in {dev_env_name}"
+    else:
+        status = "failure"
+        message = f"Task {task_name} exited with code {exit_code} in {dev_env_name}"
+
+    return {
+        "status": status,
+        "message": message,
+        "exit_code": exit_code,
+        "results": {name: result.to_dict() for name, result in results.items()}
+    }
+
+class JobRequest(BaseModel):
+    """ Request model for submitting a job.
+
+        Attributes:
+            dev_env_name -- the name of the Development Environment to run the tasks in
+            task_names -- the names of the tasks to run
+            parallel -- the maximum number of the tasks running at the same time
+            warm -- run the tasks in the warm containers of the Development Environment (such a 
+                    job can't be cancelled after it has been started)
+    """
+    dev_env_name: str
+    task_names: list[str]
+    parallel: int = 1
+    warm: bool = False
+
+def _get_job(job_id: str) -> Job:
+    """ Get the job or respond with 404.
+
+        Args:
+            job_id -- the id of the job
+
+        Returns:
+            the job
+
+        Raises:
+            HTTPException -- if the job doesn't exist
+    """
+    job = platform.job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+@app.post("/jobs", status_code=202)
+def submit_job(request: JobRequest) -> dict:
+    """ Queue the tasks of the Development Environment to run. Respond without waiting for them.
+    
+        Args:
+            request -- the request containing the Development Environment name, the task names
+                       and the run options
+
+        Returns:
+            the state of the queued job
+
+        Raises:
+            HTTPException -- if the Development Environment doesn't exist (404), the tasks can't be
+                             run (400) or the queue is full (429)
+    """
+    dev_env = platform.get_dev_env_by_name(request.dev_env_name)
+    if dev_env is None:
+        raise HTTPException(status_code=404, 
+                            detail=f"Unknown Development Environment: {request.dev_env_name}")
+
+    try:
+        job = platform.job_manager.submit(dev_env, request.task_names, max(1, request.parallel), 
+                                          request.warm)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except JobError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return job.to_dict()
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str) -> dict:
+    """ Get the state of the job.
+    
+        Args:
+            job_id -- the id of the job
+
+        Returns:
+            the state of the job
+    """
+    return _get_job(job_id).to_dict()
+
+async def _iter_job_output(job: Job, follow: bool) -> AsyncGenerator[bytes, None]:
+    """ Generate the output of the job from the beginning.
+
+        Like _iter_job_events(), no thread is held while waiting for the new output.
+
+        Args:
+            job -- the job
+            follow -- wait for the new output until the job finishes
+
+        Returns:
+            the output, stdout and stderr mixed
+    """
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    listener = lambda: loop.call_soon_threadsafe(changed.set)
+    job.add_listener(listener)
+
+    try:
+        index = 0
+        while True:
+            changed.clear()
+            # Checked before the read, so the output written before the finish isn't missed.
+            is_finished = job.is_finished
+            chunks, index, dropped = job.read_output(index)
+
+            if dropped:
+                yield f"[{dropped} output chunks dropped]\n".encode()
+            for data, _ in chunks:
+                yield data
+
+            if not chunks:
+                if is_finished or not follow:
+                    break
+                await changed.wait()
+    finally:
+        job.remove_listener(listener)
+
+@app.get("/jobs/{job_id}/logs")
+async def get_job_logs(job_id: str, follow: bool = True) -> StreamingResponse:
+    """ Stream the output of the job's tasks with a chunked response.
+    
+        Args:
+            job_id -- the id of the job
+            follow -- keep the response open until the job finishes
+
+        Returns:
+            the output from the beginning, stdout and stderr mixed
+    """
+    job = _get_job(job_id)
+    return StreamingResponse(_iter_job_output(job, follow), media_type="text/plain")
+
+@app.delete("/jobs/{job_id}")
+def delete_job(job_id: str) -> dict:
+    """ Cancel the job if it hasn't finished yet, otherwise delete it.
+    
+        Args:
+            job_id -- the id of the job
+
+        Returns:
+            the state of the job
+
+        Raises:
+            HTTPException -- if the job can't be cancelled or deleted (409), e.g. a started warm 
+                             job
+    """
+    job = _get_job(job_id)
+    try:
+        if job.is_finished:
+            platform.job_manager.delete(job_id)
+        else:
+            platform.job_manager.cancel(job_id)
+    except JobError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return job.to_dict()
+
+def _format_sse(event: str, data: dict) -> str:
+    """ Format a Server-Sent Event.
+
+        Args:
+            event -- the event type
+            data -- the data of the event, sent as JSON
+
+        Returns:
+            the event in the text/event-stream format
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _iter_job_events(job: Job) -> AsyncGenerator[str, None]:
+    """ Generate the Server-Sent Events of the job until it finishes.
+
+        The events:
+            status -- the state of the job, at the beginning and when the status changes
+            output -- a chunk of the output: {"stream": "stdout" | "stderr", "data": "..."}
+            dropped -- {"chunks": N} the output the client fell behind on has been dropped
+            end -- the final state of the job
+
+        The output is read from the job at the pace the client receives it, so a slow client
+        doesn't slow down the tasks. No thread is held while waiting for the new output.
+
+        Args:
+            job -- the job
+
+        Returns:
+            the events in the text/event-stream format
+    """
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    listener = lambda: loop.call_soon_threadsafe(changed.set)
+    job.add_listener(listener)
+    decoders = {
+        False: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+        True: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+    }
+
+    try:
+        status = job.status
+        yield _format_sse("status", job.to_dict())
+
+        index = 0
+        while True:
+            changed.clear()
+            # Checked before the read, so the output written before the finish isn't missed.
+            is_finished = job.is_finished
+            chunks, index, dropped = job.read_output(index)
+
+            if dropped:
+                yield _format_sse("dropped", {"chunks": dropped})
+            for data, is_stderr in chunks:
+                yield _format_sse("output", {"stream": "stderr" if is_stderr else "stdout",
+                                             "data": decoders[is_stderr].decode(data)})
+
+            if is_finished and not chunks:
+                break
+            if job.status != status and not job.is_finished:
+                status = job.status
+                yield _format_sse("status", job.to_dict())
+
+            if not chunks:
+                try:
+                    await asyncio.wait_for(changed.wait(), sse_keepalive_interval_s)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+
+        yield _format_sse("end", job.to_dict())
+    finally:
+        job.remove_listener(listener)
+
+@app.get("/jobs/{job_id}/events")
+async def get_job_events(job_id: str) -> StreamingResponse:
+    """ Stream the output and the state changes of the job as Server-Sent Events.
+    
+        Args:
+            job_id -- the id of the job
+
+        Returns:
+            the text/event-stream response, see _iter_job_events() for the events
+    """
+    job = _get_job(job_id)
+    return StreamingResponse(_iter_job_events(job), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+async def _iter_dev_env_events() -> AsyncGenerator[str, None]:
+    """ Generate the Server-Sent Events of the installation status changes until the client 
+        disconnects.
+
+        The events:
+            status -- {"dev_env_name": "...", "is_installation_correct": true | false} a 
+                      Development Environment used through the API became broken (an image of it
+                      has been removed) or got fixed
+
+        Returns:
+            the events in the text/event-stream format
+    """
+    loop = asyncio.get_running_loop()
+    changes: asyncio.Queue[tuple[str, bool]] = asyncio.Queue()
+    listener = lambda dev_env_name, is_correct: loop.call_soon_threadsafe(
+        changes.put_nowait, (dev_env_name, is_correct))
+    platform.state.add_listener(listener)
+
+    try:
+        while True:
+            try:
+                dev_env_name, is_correct = await asyncio.wait_for(changes.get(), 
+                                                                  sse_keepalive_interval_s)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _format_sse("status", {"dev_env_name": dev_env_name, 
+                                         "is_installation_correct": is_correct})
+    finally:
+        platform.state.remove_listener(listener)
+
+@app.get("/dev_envs/events")
+async def get_dev_env_events() -> StreamingResponse:
+    """ Stream the installation status changes of the Development Environments as Server-Sent 
+        Events.
+
+        Only the Development Environments already used through the API are followed.
+
+        Returns:
+            the text/event-stream response, see _iter_dev_env_events() for the events
+    """
+    return StreamingResponse(_iter_dev_env_events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
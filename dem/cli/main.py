@@ -2,24 +2,36 @@
 # dem/cli/main.py
 
 import typer, importlib.metadata
-from typing import Generator, Optional
+from typing import Generator, Iterable, Optional
 from typing_extensions import Annotated
 import os
 from dem import __command__, __app_name__
-from dem.core.commands import cp_cmd, import_cmd, info_cmd, list_cmd, create_cmd, modify_cmd, \
-                            delete_cmd, rename_cmd, run_cmd, export_cmd, clone_cmd, add_reg_cmd, \
-                            list_reg_cmd, del_reg_cmd, add_cat_cmd, list_cat_cmd, del_cat_cmd, \
-                            add_host_cmd, set_default_cmd, uninstall_cmd, install_cmd, assign_cmd, \
-                            init_cmd, list_host_cmd, del_host_cmd, list_tools_cmd, add_task_cmd, \
-                            del_task_cmd
 from dem.cli.console import stdout
 from dem.core.platform import Platform
 from dem.core.exceptions import InternalError
+from dem.core.data_management import NameIndexJSON
+
+# The command modules get imported in the commands, so only the dependencies of the invoked 
+# command are loaded (e.g. textual only for the TUI commands).
 
 typer_cli: typer.Typer = typer.Typer(rich_markup_mode="rich")
 platform: Platform | None = None
+# Set instead of the platform in the shell completion mode.
+name_index: NameIndexJSON | None = None
 
 # Autocomplete functions
+def _match(names: Iterable[str], incomplete: str) -> Generator:
+    """ 
+    Return with the names starting with the incomplete parameter by a Generator.
+
+    Args:
+        names -- the names to complete to
+        incomplete -- the parameter the user supplied so far when the tab was pressed
+    """
+    for name in names:
+        if name.startswith(incomplete) or (incomplete == ""):
+            yield name
+
 def autocomplete_dev_env_name(incomplete: str) -> Generator:
     """ 
     Autocomplete the input Dev Env name with the available matching local Dev Envs.
@@ -29,10 +41,10 @@ def autocomplete_dev_env_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    if platform is not None:
-        for dev_env in platform.local_dev_envs:
-            if dev_env.name.startswith(incomplete) or (incomplete == ""):
-                yield dev_env.name
+    if name_index is not None:
+        yield from _match(name_index.get_dev_env_names(), incomplete)
+    elif platform is not None:
+        yield from _match([dev_env.name for dev_env in platform.local_dev_envs], incomplete)
 
 def autocomplete_installed_dev_env_name(incomplete: str) -> Generator:
     """ 
@@ -43,10 +55,11 @@ def autocomplete_installed_dev_env_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    if platform is not None:
-        for dev_env in platform.local_dev_envs:
-            if dev_env.is_installed and (dev_env.name.startswith(incomplete) or (incomplete == "")):
-                yield dev_env.name
+    if name_index is not None:
+        yield from _match(name_index.get_dev_env_names(installed_only=True), incomplete)
+    elif platform is not None:
+        yield from _match([dev_env.name for dev_env in platform.local_dev_envs 
+                           if dev_env.is_installed], incomplete)
 
 def autocomplete_cat_name(incomplete: str) -> Generator:
     """ 
@@ -57,10 +70,11 @@ def autocomplete_cat_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    if platform is not None:
-        for catalog in platform.dev_env_catalogs.catalogs:
-            if catalog.name.startswith(incomplete) or (incomplete == ""):
-                yield catalog.name
+    if name_index is not None:
+        yield from _match(name_index.get_names("catalogs"), incomplete)
+    elif platform is not None:
+        yield from _match([catalog.name for catalog in platform.dev_env_catalogs.catalogs], 
+                          incomplete)
 
 def autocomplete_reg_name(incomplete: str) -> Generator:
     """ 
@@ -71,10 +85,12 @@ def autocomplete_reg_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    if platform is not None:
-        for registry_config in platform.registries.list_registry_configs():
-            if registry_config["name"].startswith(incomplete) or (incomplete == ""):
-                yield registry_config["name"]
+    if name_index is not None:
+        yield from _match(name_index.get_names("registries"), incomplete)
+    elif platform is not None:
+        yield from _match([registry_config["name"] 
+                           for registry_config in platform.registries.list_registry_configs()], 
+                          incomplete)
 
 def autocomplete_host_name(incomplete: str) -> Generator:
     """ 
@@ -85,10 +101,11 @@ def autocomplete_host_name(incomplete: str) -> Generator:
     Args:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
-    if platform is not None:
-        for host_config in platform.hosts.list_host_configs():
-            if host_config["name"].startswith(incomplete) or (incomplete == ""):
-                yield host_config["name"]
+    if name_index is not None:
+        yield from _match(name_index.get_names("hosts"), incomplete)
+    elif platform is not None:
+        yield from _match([host_config["name"] 
+                           for host_config in platform.hosts.list_host_configs()], incomplete)
 
 def autocomplete_task_name(ctx: typer.Context, incomplete: str) -> Generator:
     """ 
@@ -100,12 +117,18 @@ def autocomplete_task_name(ctx: typer.Context, incomplete: str) -> Generator:
         incomplete -- the parameter the user supplied so far when the tab was pressed
     """
     dev_env_name = ctx.params.get("dev_env_name", None)
-    if platform is not None and dev_env_name is not None:
+    if dev_env_name is None:
+        return
+
+    if name_index is not None:
+        yield from _match(name_index.get_task_names(dev_env_name), incomplete)
+    elif platform is not None:
         for dev_env in platform.local_dev_envs:
             if dev_env.name == dev_env_name:
-                for task_name in dev_env.custom_tasks:
-                    if task_name.startswith(incomplete) or (incomplete == ""):
-                        yield task_name
+                task_names = list(dev_env.tasks)
+                task_names += [task_name for task_name in dev_env.custom_tasks 
+                               if task_name not in task_names]
+                yield from _match(task_names, incomplete)
 
 # DEM commands
 @typer_cli.command()
@@ -120,6 +143,7 @@ def add_task(dev_env_name: Annotated[str, typer.Argument(help="Name of the Devel
     command must be surrounded by quotes.
     """
     if platform:
+        from dem.core.commands import add_task_cmd
         add_task_cmd.execute(platform, dev_env_name, task_name, command)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -133,6 +157,7 @@ def del_task(dev_env_name: Annotated[str, typer.Argument(help="Name of the Devel
     Delete a task from the Development Environment.
     """
     if platform:
+        from dem.core.commands import del_task_cmd
         del_task_cmd.execute(platform, dev_env_name, task_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -148,6 +173,7 @@ def set_default(dev_env_name: Annotated[str,
     Environment is specified.
     """
     if platform:
+        from dem.core.commands import set_default_cmd
         set_default_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -166,6 +192,7 @@ def list_(cat: Annotated[bool, typer.Option(help="List the Dev Envs available fr
     catalogs will be used.
     """
     if platform and ctx:
+        from dem.core.commands import list_cmd
         list_cmd.execute(platform, cat, ctx.args)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -173,6 +200,8 @@ def list_(cat: Annotated[bool, typer.Option(help="List the Dev Envs available fr
 @typer_cli.command(context_settings={"allow_extra_args": True})
 def list_tools(reg: Annotated[bool, typer.Option(help="List the available tools in the registries.",
                                                   show_default=False)] = False,
+               refresh: Annotated[bool, typer.Option(help="Ignore the cached registry data.",
+                                                      show_default=False)] = False,
                ctx: Annotated[typer.Context, typer.Option()] = None) -> None:
     """
     List the available tools.
@@ -182,9 +211,12 @@ def list_tools(reg: Annotated[bool, typer.Option(help="List the available tools
     --reg: List the available tools in the registries. Specify the registry's name to list the tools
     from. More then one registry can be specified. If no registry is specified, all the available
     registries will be used.
+
+    --refresh: Request the registries even if their cached data is still valid.
     """
     if platform and ctx:
-        list_tools_cmd.execute(platform, reg, ctx.args)
+        from dem.core.commands import list_tools_cmd
+        list_tools_cmd.execute(platform, reg, ctx.args, refresh)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
@@ -204,6 +236,7 @@ def info(dev_env_name: Annotated[str, typer.Argument(help="Name of the Developme
     Note: Autocomplete only works with the locally avialable Dev Envs.
     """
     if platform and ctx:
+        from dem.core.commands import info_cmd
         info_cmd.execute(platform, dev_env_name, cat, ctx.args)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -216,6 +249,7 @@ def cp(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development
     Create a copy of a local Dev Env.
     """
     if platform:
+        from dem.core.commands import cp_cmd
         cp_cmd.execute(platform, dev_env_name, new_dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -226,6 +260,7 @@ def create(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     Create a new Development Environment.
     """
     if platform:
+        from dem.core.commands import create_cmd
         create_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -238,6 +273,7 @@ def export(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     Export the Development Environment.
     """
     if platform:
+        from dem.core.commands import export_cmd
         export_cmd.execute(platform, dev_env_name,path_to_export)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -248,6 +284,7 @@ def import_(path_to_dev_env: Annotated[str, typer.Argument(help="Path to the Dev
     Import the Development Environment.
     """
     if platform:
+        from dem.core.commands import import_cmd
         import_cmd.execute(platform, path_to_dev_env)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -258,6 +295,7 @@ def clone(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env
     Copy the Dev Env's descriptor from the catalog to the local descriptor storage.
     """
     if platform:
+        from dem.core.commands import clone_cmd
         clone_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -270,6 +308,7 @@ def rename(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     Rename the Development Environment.
     """
     if platform:
+        from dem.core.commands import rename_cmd
         rename_cmd.execute(platform, dev_env_name,new_dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -283,6 +322,7 @@ def modify(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     If the tool type is not specified, the Dev Env settings panel will be opened.
     """
     if platform:
+        from dem.core.commands import modify_cmd
         modify_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -295,18 +335,26 @@ def delete(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
     If the Dev Env is installed, the user will be asked whether they want to uninstall it. 
     """
     if platform:
+        from dem.core.commands import delete_cmd
         delete_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
 @typer_cli.command()
 def install(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to install.",
-                                                       autocompletion=autocomplete_dev_env_name)]) -> None:
+                                                       autocompletion=autocomplete_dev_env_name)],
+            force_pull: Annotated[bool, typer.Option(help="Pull the Tool Images even if they are already available.",
+                                                     show_default=False)] = False) -> None:
     """
     Install the Development Environment.
+
+    Only the Tool Images that are not available on the hosts get pulled.
+
+    --force-pull: Pull all the Tool Images even if they are already available.
     """
     if platform is not None:
-        install_cmd.execute(platform, dev_env_name)
+        from dem.core.commands import install_cmd
+        install_cmd.execute(platform, dev_env_name, force_pull)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
     
@@ -318,6 +366,7 @@ def uninstall(dev_env_name: Annotated[str, typer.Argument(help="Name of the Deve
     anymore by any of the available local Development Environments, the DEM will delete it.
     """
     if platform:
+        from dem.core.commands import uninstall_cmd
         uninstall_cmd.execute(platform, dev_env_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")  
@@ -332,6 +381,7 @@ def assign(dev_env_name: Annotated[str, typer.Argument(help="Name of the Dev Env
     If the project path is not specified, the current working directory will be used.
     """
     if platform:
+        from dem.core.commands import assign_cmd
         assign_cmd.execute(platform, dev_env_name, project_path)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -344,28 +394,87 @@ def init(project_path: Annotated[str, typer.Argument(help="Path of the project."
     If the project path is not specified, the current working directory will be used.
     """
     if platform:
+        from dem.core.commands import init_cmd
         init_cmd.execute(platform, project_path)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
-@typer_cli.command()
+@typer_cli.command(context_settings={"allow_extra_args": True})
 def run(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to run the task in. If not set, the default Dev Env will be used.",
                                                     autocompletion=autocomplete_installed_dev_env_name)] = "",
         task_name: Annotated[str, typer.Argument(help="The name of the task to run.",
                                                  autocompletion=autocomplete_task_name)] = "",
-        extra_args: Annotated[str, typer.Option(help="Additional arguments to pass to the task")] = "") -> None:
+        extra_args: Annotated[str, typer.Option(help="Additional arguments to pass to the task")] = "",
+        parallel: Annotated[int, typer.Option(help="Maximum number of tasks running at the same time.",
+                                              min=1)] = 1,
+        warm: Annotated[bool, typer.Option(help="Run the tasks in the warm containers of the Dev Env.",
+                                           show_default=False)] = False,
+        ctx: Annotated[typer.Context, typer.Option()] = None) -> None:
     """
     Run the task of the Development Environment. The Dev Env must be installed.
 
     If the Dev Env is not specified, the default Dev Env will be used. If the default Dev Env is not
     set, an error message will be printed.
+
+    More than one task can be specified after the Dev Env name. The dependencies of the tasks are
+    run first.
+
+    --parallel: The tasks not depending on each other are run at the same time, at most this many.
+
+    --warm: Run the tasks in long-lived containers instead of creating a new container for each 
+    run. Stop them with the stop-warm command.
+
+    The exit code is the first non-zero exit code of the tasks.
     """
-    if platform:
+    if platform and ctx:
         # If only a single parameter is supplied, we assume it's the task name
         if not task_name and dev_env_name:
             task_name = dev_env_name
             dev_env_name = ""
-        run_cmd.execute(platform, dev_env_name, task_name, extra_args)
+        from dem.core.commands import run_cmd
+        results = run_cmd.execute(platform, dev_env_name, [task_name] + ctx.args, extra_args, 
+                                  parallel, warm)
+        exit_code = run_cmd.get_exit_code(results)
+        if exit_code != 0:
+            raise typer.Exit(exit_code)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command()
+def stop_warm(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment. If not set, the warm containers of all the Dev Envs will be stopped.",
+                                                          autocompletion=autocomplete_dev_env_name)] = "") -> None:
+    """
+    Stop and remove the warm containers on all the hosts.
+    """
+    if platform:
+        from dem.core.commands import stop_warm_cmd
+        stop_warm_cmd.execute(platform, dev_env_name)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command()
+def serve(host: Annotated[str, typer.Option(help="Address to bind to.",
+                                            show_default=False)] = None,
+          port: Annotated[int, typer.Option(help="Port to bind to.",
+                                            show_default=False)] = None,
+          threads: Annotated[int, typer.Option(help="Number of the threads serving the blocking requests.",
+                                               min=1, show_default=False)] = None,
+          max_concurrent_requests: Annotated[int, typer.Option(help="Maximum number of concurrent requests, 0 means unlimited.",
+                                                               min=0, show_default=False)] = None,
+          keep_alive_timeout: Annotated[int, typer.Option(help="Idle keep-alive connection timeout in seconds.",
+                                                          min=1, show_default=False)] = None,
+          graceful_shutdown_timeout: Annotated[int, typer.Option(help="Time to wait for the in-flight requests on shutdown in seconds.",
+                                                                 min=0, show_default=False)] = None) -> None:
+    """
+    Run the DEM API server until Ctrl+C is pressed.
+
+    The options not set are taken from the configuration file. On shutdown the server stops 
+    accepting new requests and waits for the in-flight requests and the running jobs to finish.
+    """
+    if platform:
+        from dem.core.commands import serve_cmd
+        serve_cmd.execute(platform, host, port, threads, max_concurrent_requests, 
+                          keep_alive_timeout, graceful_shutdown_timeout)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
@@ -384,6 +493,7 @@ def add_reg(name: Annotated[str, typer.Argument(help="Unique name for the regist
     https://registry.hub.docker.com, or it can be http://localhost:5000 for a self-hosted one.
     """
     if platform:
+        from dem.core.commands import add_reg_cmd
         add_reg_cmd.execute(platform, name, url, namespace)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -394,6 +504,7 @@ def list_reg() -> None:
     List the available registries.
     """
     if platform:
+        from dem.core.commands import list_reg_cmd
         list_reg_cmd.execute(platform)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -405,6 +516,7 @@ def del_reg(registry_name: Annotated[str, typer.Argument(help="Name of the regis
     Delete a registry.
     """
     if platform:
+        from dem.core.commands import del_reg_cmd
         del_reg_cmd.execute(platform, registry_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -420,6 +532,7 @@ def add_cat(name: Annotated[str, typer.Argument(help="Name of the Development En
     The URL must point to an HTTP(S) server where the Catalog json file is available.
     """
     if platform:
+        from dem.core.commands import add_cat_cmd
         add_cat_cmd.execute(platform, name, url)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -430,6 +543,7 @@ def list_cat() -> None:
     List the available catalogs.
     """
     if platform:
+        from dem.core.commands import list_cat_cmd
         list_cat_cmd.execute(platform)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -441,6 +555,7 @@ def del_cat(catalog_name: Annotated[str, typer.Argument(help="Name of the Develo
     Delete a catalog.
     """
     if platform:
+        from dem.core.commands import del_cat_cmd
         del_cat_cmd.execute(platform, catalog_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -452,6 +567,7 @@ def add_host(name: Annotated[str, typer.Argument(help="Name of the host")],
     Add a new host.
     """
     if platform:
+        from dem.core.commands import add_host_cmd
         add_host_cmd.execute(platform, name, address)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -462,6 +578,7 @@ def list_host() -> None:
     List the available hosts.
     """
     if platform is not None:
+        from dem.core.commands import list_host_cmd
         list_host_cmd.execute(platform)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -473,6 +590,7 @@ def del_host(host_name: Annotated[str, typer.Argument(help="Name of the host to
     Delete a host.
     """
     if platform:
+        from dem.core.commands import del_host_cmd
         del_host_cmd.execute(platform, host_name)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
@@ -5,12 +5,17 @@ from dem.cli.console import stdout, stderr
 from dem.core.user_output import UserOutput
 
 import typer
+from threading import Lock
 from typing import Generator
 from rich.progress import Progress, TaskID, TextColumn, BarColumn, TaskProgressColumn
 from rich.status import Status
 
 class PullProgressBar():
-    """ Visualize the status of the pull command on a progress bar."""
+    """ Visualize the status of the pull command on a progress bar.
+    
+        Multiple images can be pulled at the same time. In that case the items of the generator 
+        have an "image" key and each layer of each image gets its own progress bar.
+    """
     def __init__(self, generator: Generator) -> None:
         """ Init the class
         
@@ -28,11 +33,15 @@ class PullProgressBar():
                 item -- current item from the generator
                 status -- which process's status the progress bar shows
         """
-        task = self.tasks.get(id)
+        image = item.get("image")
+        # The same layer can be part of several images pulled at the same time.
+        key = (image, id) if image else id
+        task = self.tasks.get(key)
 
         if task is None:
-            task = self.progress.add_task(str(id), id=id)
-            self.tasks[id] = task
+            label = f"{image} {id}" if image else id
+            task = self.progress.add_task(str(label), id=label)
+            self.tasks[key] = task
 
         progress_detail = item.get("progressDetail")
         current = None
@@ -53,15 +62,17 @@ class PullProgressBar():
             """
         status = item.get("status")
         id = item.get("id")
+        image = item.get("image")
+        prefix = f"{image}: " if image else ""
 
         if status:
             if id:
                 if item.get("progressDetail"):
                     self._update_progress_bar(id, item, status)
                 else:
-                    self.progress.console.print(str(id) + ": " + str(status))
+                    self.progress.console.print(prefix + str(id) + ": " + str(status))
             else:
-                self.progress.console.print(str(status))
+                self.progress.console.print(prefix + str(status))
 
     def run_generator(self):
         with Progress(TextColumn("[progress.layer_id]{task.fields[id]}"), 
@@ -73,6 +84,10 @@ class PullProgressBar():
 
 class TUIUserOutput(UserOutput):
     """ Provides the interface between the core modules and the rich based TUI."""
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._raw_output_lock = Lock()
+
     def msg(self, text: str, is_title: bool = False) -> None:
         """ Send a message.
         
@@ -85,6 +100,28 @@ class TUIUserOutput(UserOutput):
         else:
             stdout.print(text)
 
+    def raw_output(self, data: bytes, is_stderr: bool = False) -> None:
+        """ Pass output through to the user without any processing.
+
+            The data bypasses the rich console and gets written to the binary buffer of its file.
+        
+            Args:
+                data -- the output to write
+                is_stderr -- the data belongs to the stderr
+        """
+        file = stderr.file if is_stderr else stdout.file
+
+        with self._raw_output_lock:
+            # The text printed by the console so far must precede the data.
+            file.flush()
+            buffer = getattr(file, "buffer", None)
+            if buffer is not None:
+                buffer.write(data)
+                buffer.flush()
+            else:
+                file.write(data.decode(errors="replace"))
+                file.flush()
+
     def error(self, text: str) -> None:
         """ Send and error message
         
@@ -1,22 +1,64 @@
 """ Uvircorn server for the FastAPI based DEM API. """
 # dem/api/server.py
 
+import anyio.to_thread
 import uvicorn
 from uvicorn._types import ASGIApplication
 from typing import Callable, Any
 from threading import Thread
 
+class _ThreadpoolServer(uvicorn.Server):
+    """ Uvicorn server with a configurable threadpool for the blocking request handlers.
+
+        The sync endpoints run in the default thread limiter of anyio, which belongs to the event
+        loop of the server, so it can only be resized from inside the loop.
+    """
+
+    def __init__(self, config: uvicorn.Config, threadpool_size: int) -> None:
+        """ Init the class.
+
+            Args:
+                config -- the uvicorn configuration
+                threadpool_size -- the maximum number of the blocking handlers running at once
+        """
+        super().__init__(config)
+        self.threadpool_size = threadpool_size
+
+    async def serve(self, sockets=None) -> None:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = self.threadpool_size
+        await super().serve(sockets=sockets)
+
 class APIServer():
-    """ Uvicorn server for the FastAPI based DEM API. """
+    """ Uvicorn server for the FastAPI based DEM API.
+
+        The server runs in a single process, because the jobs are kept in its memory. The blocking
+        request handlers (e.g. /run) run on the threadpool of the server.
+    """
+
+    def __init__(self, app: ASGIApplication | Callable[..., Any] | str, host: str = "0.0.0.0",
+                 port: int = 8000, threadpool_size: int = 40, max_concurrent_requests: int = 0,
+                 keep_alive_timeout_s: int = 5, graceful_shutdown_timeout_s: int = 300) -> None:
+        """ Initialize the APIServer.
 
-    def __init__(self, app: ASGIApplication | Callable[..., Any] | str) -> None:
-        """ Initialize the APIServer. 
-        
             Args:
-                app: the FastAPI application to run in the server.
+                app -- the FastAPI application to run in the server
+                host -- the address to bind to
+                port -- the port to bind to
+                threadpool_size -- the maximum number of the blocking handlers running at once
+                max_concurrent_requests -- the maximum number of the concurrent connections and
+                                           requests, above it the server responds with 503, 0
+                                           means unlimited
+                keep_alive_timeout_s -- close the idle keep-alive connections after this time
+                graceful_shutdown_timeout_s -- the time to wait for the in-flight requests on
+                                               shutdown before cancelling them
         """
-        config: uvicorn.Config = uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")
-        self.server: uvicorn.Server = uvicorn.Server(config)
+        self.host = host
+        self.port = port
+        config: uvicorn.Config = uvicorn.Config(app, host=host, port=port, log_level="info",
+                                                limit_concurrency=max_concurrent_requests or None,
+                                                timeout_keep_alive=keep_alive_timeout_s,
+                                                timeout_graceful_shutdown=graceful_shutdown_timeout_s)
+        self.server: uvicorn.Server = _ThreadpoolServer(config, threadpool_size)
         self.thread: Thread = Thread(target=self._server_run_in_thread)
 
     def _server_run_in_thread(self) -> None:
@@ -27,7 +69,15 @@ class APIServer():
         """ Start the server. """
         self.thread.start()
 
+    def wait(self) -> None:
+        """ Block until the server stops. """
+        self.thread.join()
+
     def stop(self) -> None:
-        """ Stop the server. """
+        """ Stop the server.
+
+            The server stops accepting new connections and waits for the in-flight requests to
+            finish (at most for the graceful shutdown timeout).
+        """
         self.server.handle_exit(None, None)
-        self.thread.join()
\ No newline at end of file
+        self.thread.join()
@@ -54,10 +54,12 @@ def execute(platform: Platform, dev_env_name: str) -> None:
         return
 
     local_dev_env: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
-    if local_dev_env:
-        handle_existing_local_dev_env(platform, local_dev_env)
+    # Write the dev_env.json once for the uninstall of the overwritten Dev Env and the clone.
+    with platform.dev_env_json.batch():
+        if local_dev_env:
+            handle_existing_local_dev_env(platform, local_dev_env)
 
-    platform.local_dev_envs.append(catalog_dev_env)
-    platform.flush_dev_env_properties()
+        platform.local_dev_envs.append(catalog_dev_env)
+        platform.flush_dev_env_properties()
 
     stdout.print("[green]The Dev Env successfully cloned.[/]")
\ No newline at end of file
@@ -19,14 +19,17 @@ def execute(platform: Platform, dev_env_name: str) -> None:
             typer.confirm("The Development Environment is installed. Do you want to uninstall it?", 
                           abort=True)
 
-            try:
-                for status in platform.uninstall_dev_env(dev_env_to_delete):
-                    stdout.print(status)
-            except PlatformError as e:
-                stderr.print(f"[red]{str(e)}[/]")
-                return
+        # Write the dev_env.json once for the uninstall and the deletion.
+        with platform.dev_env_json.batch():
+            if dev_env_to_delete.is_installed:
+                try:
+                    for status in platform.uninstall_dev_env(dev_env_to_delete):
+                        stdout.print(status)
+                except PlatformError as e:
+                    stderr.print(f"[red]{str(e)}[/]")
+                    return
 
-        stdout.print("Deleting the Development Environment descriptor...")
-        platform.local_dev_envs.remove(dev_env_to_delete)
-        platform.flush_dev_env_properties()
+            stdout.print("Deleting the Development Environment descriptor...")
+            platform.local_dev_envs.remove(dev_env_to_delete)
+            platform.flush_dev_env_properties()
         stdout.print(f"[green]Successfully deleted the {dev_env_name}![/]")
\ No newline at end of file
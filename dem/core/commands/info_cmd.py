@@ -133,18 +133,22 @@ def cat_dev_env_info(platform: Platform, dev_env_name: str, selected_cats: list[
             dev_env_name -- the name of the Development Environment to print information about
             selected_cats -- the selected catalog names, empty list means all catalogs
     """
-    for catalog in platform.dev_env_catalogs.catalogs:
-        if catalog.name in selected_cats or not selected_cats:
-            catalog.request_dev_envs()
-            dev_env = catalog.get_dev_env_by_name(dev_env_name)
-            if dev_env:
-                try:
-                    dev_env.start_engines()
-                    dev_env.assign_tool_image_instances(platform.tool_images)
-                except DevEnvError as e:
-                    stderr.print(f"[red]{e}[/]\n")
-                print_cat_dev_env_info(dev_env, catalog.name)
-                break
+    # The catalogs are requested concurrently. The first catalog (in the configured order) that 
+    # contains the Development Environment is used as soon as it's known.
+    for catalog, error in platform.dev_env_catalogs.request_all(selected_cats):
+        if error:
+            stderr.print(f"[red]{error}[/]")
+            continue
+
+        dev_env = catalog.get_dev_env_by_name(dev_env_name)
+        if dev_env:
+            try:
+                dev_env.start_engines()
+                dev_env.assign_tool_image_instances(platform.tool_images)
+            except DevEnvError as e:
+                stderr.print(f"[red]{e}[/]\n")
+            print_cat_dev_env_info(dev_env, catalog.name)
+            break
     else:
         stderr.print(f"[red]Error: Unknown Development Environment: {dev_env_name}[/]\n")
 
@@ -24,26 +24,28 @@ def execute(platform: Platform, project_path: str) -> None:
         stderr.print(f"[red]Error: No Dev Env is assigned to this project. You can assign one with `dem assign`.")
         return
 
-    for local_dev_env in platform.local_dev_envs:
-        if local_dev_env.name == dev_env.name:
-            stdout.print(f"[yellow]Warning: The {dev_env.name} Development Environment is already initialized.[/]")
-            typer.confirm("Would you like to re-init the Dev Env? All local changes will be lost!", abort=True)
+    # Write the dev_env.json once for the uninstall of the re-initialized Dev Env and the init.
+    with platform.dev_env_json.batch():
+        for local_dev_env in platform.local_dev_envs:
+            if local_dev_env.name == dev_env.name:
+                stdout.print(f"[yellow]Warning: The {dev_env.name} Development Environment is already initialized.[/]")
+                typer.confirm("Would you like to re-init the Dev Env? All local changes will be lost!", abort=True)
 
-            if local_dev_env.is_installed:
-                typer.confirm("The Development Environment is installed, so it can't be deleted. Do you want to uninstall it first?", 
-                              abort=True)
+                if local_dev_env.is_installed:
+                    typer.confirm("The Development Environment is installed, so it can't be deleted. Do you want to uninstall it first?", 
+                                  abort=True)
+                    
+                    try:
+                        for status in platform.uninstall_dev_env(local_dev_env):
+                            stdout.print(status)
+                    except PlatformError as e:
+                        stderr.print(f"[red]{str(e)}[/]")
+                        return
                 
-                try:
-                    for status in platform.uninstall_dev_env(local_dev_env):
-                        stdout.print(status)
-                except PlatformError as e:
-                    stderr.print(f"[red]{str(e)}[/]")
-                    return
-            
-            platform.local_dev_envs.remove(local_dev_env)
-            break
+                platform.local_dev_envs.remove(local_dev_env)
+                break
 
-    platform.local_dev_envs.append(dev_env)
-    platform.flush_dev_env_properties()
+        platform.local_dev_envs.append(dev_env)
+        platform.flush_dev_env_properties()
     stdout.print(f"[green]Successfully initialized the {dev_env.name} Dev Env for the project at {project_path}![/]")
     stdout.print(f"\nNow you can install the Dev Env with the `dem install {dev_env.name}` command.")
\ No newline at end of file
@@ -6,13 +6,14 @@ from dem.core.platform import Platform
 from dem.core.exceptions import DevEnvError, PlatformError
 from dem.cli.console import stderr, stdout
 
-def execute(platform: Platform, dev_env_name: str) -> None:
+def execute(platform: Platform, dev_env_name: str, force_pull: bool = False) -> None:
     """
         Install the given Development Environment.
         
         Args:
             platform -- the platform
             dev_env_name -- the name of the Development Environment to install
+            force_pull -- pull the Tool Images even if they are already available
     """
 
     platform.assign_tool_image_instances_to_all_dev_envs()
@@ -26,7 +27,7 @@ def execute(platform: Platform, dev_env_name: str) -> None:
     else:
         try:
             dev_env_to_install.start_engines()
-            platform.install_dev_env(dev_env_to_install)            
+            platform.install_dev_env(dev_env_to_install, force_pull)
         except (PlatformError, DevEnvError) as e:
             stderr.print(f"[red]{e}[/]")
         else:
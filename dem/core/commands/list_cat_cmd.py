@@ -2,7 +2,6 @@
 # dem/cli/command/list_cat_cmd.py
 
 from dem.core.platform import Platform
-from dem.core.exceptions import CatalogError
 from dem.cli.console import stdout, stderr
 from rich.table import Table
 
@@ -20,11 +19,9 @@ def execute(platform: Platform) -> None:
         stdout.print("[yellow]No Development Environment Catalogs are available![/]")
         return
 
-    for catalog in platform.dev_env_catalogs.catalogs:
-        try:
-            catalog.request_dev_envs()
-        except CatalogError as e:
-            stderr.print(f"[red]{str(e)}[/]")
+    for catalog, error in platform.dev_env_catalogs.request_all():
+        if error:
+            stderr.print(f"[red]{str(error)}[/]")
 
         table.add_row(catalog.name, catalog.url)
 
@@ -87,8 +87,11 @@ def list_all_cat_dev_envs(platform: Platform) -> None:
         stdout.print("[yellow]No Development Environment Catalogs are available!")
         return
         
-    for catalog in platform.dev_env_catalogs.catalogs:
-        list_actual_cat_dev_envs(catalog)
+    for catalog, error in platform.dev_env_catalogs.request_all():
+        if error:
+            stderr.print(f"[red]{error}[/]")
+        else:
+            list_actual_cat_dev_envs(catalog)
 
 def list_selected_cat_dev_envs(platform: Platform, selected_cats: List[str]) -> None:
     """ List the Development Environments from the specified catalogs.
@@ -97,10 +100,15 @@ def list_selected_cat_dev_envs(platform: Platform, selected_cats: List[str]) ->
             platform -- the Platform
             selected_cats -- the specified catalogs
     """
+    errors = {catalog.name: error 
+              for catalog, error in platform.dev_env_catalogs.request_all(selected_cats)}
     for cat_name in selected_cats:
         for catalog in platform.dev_env_catalogs.catalogs:
             if catalog.name == cat_name:
-                list_actual_cat_dev_envs(catalog)
+                if errors.get(cat_name):
+                    stderr.print(f"[red]{errors[cat_name]}[/]")
+                else:
+                    list_actual_cat_dev_envs(catalog)
                 break
         else:
             stderr.print(f"[red]Error: Catalog '{cat_name}' not found![/]")
@@ -108,13 +108,14 @@ def list_tools_from_all_regs(platform: Platform) -> None:
     stdout.print(f"\n [italic]Available Tool Images from all registries[/]")
     stdout.print(table)
 
-def execute(platform: Platform, reg: bool, selected_regs: list[str]) -> None:
+def execute(platform: Platform, reg: bool, selected_regs: list[str], refresh: bool = False) -> None:
     """ List the available tools.
         
         Args:
             platform -- the Platform
             reg -- the flag to list the tools from the registries
             selected_regs -- the selected registry names
+            refresh -- ignore the cached registry data and request the registries
         
         Exceptions:
             typer.Abort -- if no tool images are available either locally or in the registries or 
@@ -122,7 +123,12 @@ def execute(platform: Platform, reg: bool, selected_regs: list[str]) -> None:
     """
     if not reg:
         list_local_tools(platform)
-    elif selected_regs:
+        return
+
+    if refresh:
+        platform.registries.invalidate_cache(selected_regs)
+
+    if selected_regs:
         list_tools_from_selected_regs(platform, selected_regs)
     else:
         list_tools_from_all_regs(platform)
\ No newline at end of file
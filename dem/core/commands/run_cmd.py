@@ -4,6 +4,8 @@
 from dem.core.dev_env import DevEnv
 from dem.core.platform import Platform
 from dem.core.task import Task
+from dem.core.container_engine import RunResult
+from dem.core.exceptions import DevEnvError
 from dem.cli.console import stdout, stderr
 import typer
 
@@ -25,14 +27,55 @@ def dev_env_health_check(platform: Platform, dev_env: DevEnv) -> None:
         platform.install_dev_env(dev_env)
         stdout.print(f"[green]DEM successfully fixed the {dev_env.name} Development Environment![/]")
 
-def execute(platform: Platform, dev_env_name: str, task_name: str, cmd_extra_args: str) -> None:
-    """ Run a task.
+def print_summary(execution_order: list[str], results: dict[str, RunResult]) -> None:
+    """ Print the exit code and the duration of the tasks.
+    
+        Args:
+            execution_order -- the names of the tasks to run
+            results -- the results of the finished tasks
+    """
+    stdout.print("")
+    for task_name in execution_order:
+        result = results.get(task_name, None)
+        if result is None:
+            stdout.print(f"[yellow]{task_name}: not started[/]")
+        elif result.exit_code == 0:
+            stdout.print(f"[green]{task_name}: exit code 0 ({result.duration_s:.1f} s)[/]")
+        else:
+            stdout.print(f"[red]{task_name}: exit code {result.exit_code} ({result.duration_s:.1f} s)[/]")
+
+def get_exit_code(results: dict[str, RunResult] | None) -> int:
+    """ Get the exit code of the run command.
+    
+        Args:
+            results -- the results of the run tasks, None if the tasks couldn't be run
+
+        Returns:
+            the first non-zero exit code of the tasks, 1 if the tasks couldn't be run, 0 otherwise
+    """
+    if results is None:
+        return 1
+    for result in results.values():
+        if result.exit_code != 0:
+            return result.exit_code
+    return 0
+
+def execute(platform: Platform, dev_env_name: str, task_names: list[str], cmd_extra_args: str,
+            parallel: int = 1, warm: bool = False) -> dict[str, RunResult] | None:
+    """ Run tasks.
+
+        The dependencies of the tasks are run too. The independent tasks are run at the same time.
     
         Args:
             platform -- the Platform
             dev_env_name -- the Development Environment name
-            task_name -- the task name
+            task_names -- the names of the tasks to run
             cmd_extra_args -- the extra arguments for the command
+            parallel -- the maximum number of the tasks running at the same time
+            warm -- run the tasks in the warm containers of the Development Environment
+
+        Returns:
+            the results of the finished tasks, None if the tasks couldn't be run
 
         Raises:
             typer.Abort -- if the Development Environment has missing tool images
@@ -42,24 +85,45 @@ def execute(platform: Platform, dev_env_name: str, task_name: str, cmd_extra_arg
             dev_env_name = platform.default_dev_env_name
         else:
             stderr.print("[red]Error: Only one parameter is supplied but no default Dev Env is set! Please specify the Dev Env to run the task in or set a default one![/]")
-            return
+            return None
 
     dev_env: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
     if dev_env is None:
         stderr.print("[red]Error: Unknown Development Environment: " + dev_env_name + "[/]")
-        return
+        return None
     
     if not dev_env.is_installed:
         stderr.print(f"[red]Error: Development Environment [bold]{dev_env_name}[/bold] is not installed![/]")
-        return
+        return None
+
+    for task_name in task_names:
+        if task_name not in dev_env.tasks:
+            stderr.print(f"[red]Error: Task [bold]{task_name}[/bold] not found in Development Environment [bold]{dev_env_name}[/bold]![/]")
+            return None
+
+    try:
+        execution_order = dev_env.get_task_execution_order(task_names)
+    except DevEnvError as e:
+        stderr.print(f"[red]{e}[/]")
+        return None
 
     dev_env.start_engines()
     dev_env_health_check(platform, dev_env)
 
-    task: Task | None = dev_env.tasks.get(task_name, None)
+    if len(execution_order) == 1:
+        task: Task = dev_env.tasks[execution_order[0]]
+        stdout.print(f"[green]Running task [bold]{task.name}[/bold] in Development Environment [bold]{dev_env_name}[/bold] on host {task.host_name}...[/]\n")  
+        result = task.run(warm=warm)
+        if result.exit_code != 0:
+            stderr.print(f"[red]Error: Task [bold]{task.name}[/bold] exited with code {result.exit_code}.[/]")
+        return {task.name: result}
+
+    stdout.print(f"[green]Running tasks [bold]{', '.join(execution_order)}[/bold] in Development Environment [bold]{dev_env_name}[/bold] (parallel: {parallel})...[/]\n")
+    try:
+        results = dev_env.run_tasks(task_names, parallel, warm)
+    except DevEnvError as e:
+        stderr.print(f"[red]{e}[/]")
+        return None
 
-    if task:
-        stdout.print(f"[green]Running task [bold]{task_name}[/bold] in Development Environment [bold]{dev_env_name}[/bold] on host {task.host_name}...[/]\n")  
-        task.run()
-    else:
-        stderr.print(f"[red]Error: Task [bold]{task_name}[/bold] not found in Development Environment [bold]{dev_env_name}[/bold]![/]")
\ No newline at end of file
+    print_summary(execution_order, results)
+    return results
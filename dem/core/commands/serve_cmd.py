@@ -0,0 +1,55 @@
+"""serve CLI command implementation."""
+# dem/cli/command/serve_cmd.py
+
+from dem.core.platform import Platform
+from dem.core.api_server import APIServer
+from dem.cli.console import stdout, stderr
+
+def execute(platform: Platform, host: str | None = None, port: int | None = None,
+            threadpool_size: int | None = None, max_concurrent_requests: int | None = None,
+            keep_alive_timeout_s: int | None = None,
+            graceful_shutdown_timeout_s: int | None = None) -> None:
+    """ Run the API server until it gets interrupted.
+
+        The options not set are taken from the configuration file. On shutdown the server stops
+        accepting new requests, then the in-flight requests and the running jobs are waited for.
+
+        Args:
+            platform -- the Platform
+            host -- the address to bind to
+            port -- the port to bind to
+            threadpool_size -- the maximum number of the blocking handlers running at once
+            max_concurrent_requests -- the maximum number of the concurrent requests, 0 means
+                                       unlimited
+            keep_alive_timeout_s -- close the idle keep-alive connections after this time
+            graceful_shutdown_timeout_s -- the time to wait for the in-flight requests on shutdown
+    """
+    config_file = platform.config_file
+    platform.api_server = APIServer(
+        platform.fastapi_app,
+        host if host is not None else config_file.api_host,
+        port if port is not None else config_file.api_port,
+        threadpool_size if threadpool_size is not None else config_file.api_threadpool_size,
+        max_concurrent_requests if max_concurrent_requests is not None \
+            else config_file.api_max_concurrent_requests,
+        keep_alive_timeout_s if keep_alive_timeout_s is not None \
+            else config_file.api_keep_alive_timeout_s,
+        graceful_shutdown_timeout_s if graceful_shutdown_timeout_s is not None \
+            else config_file.api_graceful_shutdown_timeout_s
+    )
+
+    platform.api_server.start()
+    try:
+        platform.api_server.wait()
+    except KeyboardInterrupt:
+        stdout.print("Shutting down the API server. Waiting for the in-flight requests...")
+        platform.api_server.stop()
+
+    if not platform.api_server.server.started:
+        stderr.print(f"[red]Error: Failed to start the API server on {platform.api_server.host}:{platform.api_server.port}.[/]")
+        return
+
+    stdout.print("Waiting for the running jobs to finish...")
+    platform.job_manager.shutdown(wait=True)
+    platform.state.close()
+    stdout.print("[green]The API server has stopped.[/]")
@@ -0,0 +1,25 @@
+"""stop-warm CLI command implementation."""
+# dem/cli/command/stop_warm_cmd.py
+
+from dem.core.platform import Platform
+from dem.core.exceptions import ContainerEngineError
+from dem.cli.console import stdout, stderr
+
+def execute(platform: Platform, dev_env_name: str) -> None:
+    """ Stop and remove the warm containers on all the hosts.
+    
+        Args:
+            platform -- the Platform
+            dev_env_name -- only the warm containers of this Development Environment, all if empty
+    """
+    for host in [platform.hosts.local, *platform.hosts.remotes.values()]:
+        try:
+            removed = host.container_engine.stop_warm_containers(dev_env_name)
+        except ContainerEngineError as e:
+            stderr.print(f"[red]Error: Unable to stop the warm containers on host {host.name}: {e}[/]")
+            continue
+
+        if removed:
+            stdout.print(f"[green]Stopped {removed} warm container(s) on host {host.name}.[/]")
+        else:
+            stdout.print(f"No warm containers on host {host.name}.")
@@ -2,63 +2,544 @@
 # dem/core/container_engine.py
 
 from dem.core.core import Core
+from dem.core.data_management import HostMetadataJSON
 from dem.core.exceptions import ContainerEngineError
 from docker import DockerClient
 from docker.models.containers import Container
+from docker.models.images import Image
 import docker.errors
-from typing import Any
+import requests.exceptions
+from queue import Queue, Empty
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Generator, Iterable
+import json
+import time
+
+class RunResult():
+    """ The result of a container run.
+
+        Attributes:
+            exit_code -- the exit code of the container's command
+            duration_s -- the time from the start of the container until it stopped in seconds
+            output_size -- the bytes of output the container produced
+            memory_peak -- the highest memory usage of the container in bytes, None if the Docker 
+                           Engine didn't report it
+    """
+    def __init__(self, exit_code: int, duration_s: float, output_size: int, 
+                 memory_peak: int | None) -> None:
+        """ Init the class.
+        
+            Args:
+                exit_code -- the exit code of the container's command
+                duration_s -- the run duration in seconds
+                output_size -- the bytes of output the container produced
+                memory_peak -- the highest memory usage in bytes
+        """
+        self.exit_code = exit_code
+        self.duration_s = duration_s
+        self.output_size = output_size
+        self.memory_peak = memory_peak
+
+    def to_dict(self) -> dict:
+        """ Return the result as a dict."""
+        return {
+            "exit_code": self.exit_code,
+            "duration_s": self.duration_s,
+            "output_size": self.output_size,
+            "memory_peak": self.memory_peak
+        }
 
 class ContainerEngine(Core):
-    """ Operations on the Docker Container Engine."""
+    """ Operations on the Docker Container Engine.
+    
+        The Docker client is started at the first operation (or with an explicit start()). The 
+        API version of a Docker Engine is cached per address in the process and in the 
+        host_metadata.json file across runs, so the clients are created with a pinned version 
+        instead of probing the engine. The metadata gets refreshed in the background when it's 
+        older than _host_metadata_max_age_s, and the version is negotiated again if the client 
+        can't be created with the pinned one.
+
+        The local images are listed from the Docker Engine only once and kept in an index (the 
+        image IDs by tag), which gets invalidated when an image is pulled or removed. A 
+        long-running process can watch the Docker events (add_event_listener()), then the index 
+        is kept up-to-date from the image events, including the changes made by others (e.g. 
+        docker pull), without listing the images again.
+
+        The output of the containers is passed through to the user output as raw bytes. The 
+        frames received while the previous batch was being written get written together.
+
+        A warm container is a long-lived container per Dev Env, image and network, labeled with
+        _warm_labels. The commands are executed in it, so they don't pay the container creation 
+        and start. The warm container stops and removes itself if no command has been run in it
+        for warm_container_idle_timeout_s (the last activity is the mtime of _warm_marker). While
+        the Docker events are watched, the warm containers are remembered until they die, so they
+        don't have to be looked up and checked before each command.
+
+        Class attributes:
+            _api_versions -- the API versions by Docker Engine address
+            _host_metadata_max_age_s -- the metadata older than this gets refreshed
+            _output_batch_size -- the maximum size of a container output batch in bytes
+            _warm_label -- the label of the warm containers
+            _warm_marker -- the file in the warm containers touched at each activity
+            _cancel_poll_interval_s -- how often the cancellation of a run is checked
+            _events_retry_interval_s -- the time to wait before reconnecting to the event stream
+            _image_events -- the image events that change the tags of the local images
+    """
+    _api_versions: dict[str, str] = {}
+    _host_metadata_max_age_s = 24 * 60 * 60
+    _output_batch_size = 64 * 1024
+    _warm_label = "dem.warm"
+    _warm_marker = "/tmp/.dem_warm"
+    _cancel_poll_interval_s = 0.2
+    _events_retry_interval_s = 1.0
+    _image_events = {"pull", "tag", "untag", "delete", "load", "import"}
 
     def __init__(self, docker_server_url: str) -> None:
         """ Init the class."""
         self._docker_client: DockerClient | None = None
         self._docker_server_url: str = docker_server_url
+        # The client was created with the cached API version and hasn't reached the engine yet.
+        self._is_version_pinned = False
+        # The image IDs by tag.
+        self._local_image_ids: dict[str, str] | None = None
+        self._image_index_lock = Lock()
+        self._start_lock = Lock()
+        self._warm_lock = Lock()
+        self._warm_containers: dict[tuple[str, str, str], Container] = {}
+        self._event_listeners: list[Callable[[dict], None]] = []
+        self._events_lock = Lock()
+        self._events_stop = Event()
+        self._events_stream = None
+        self._events_thread: Thread | None = None
     
-    def start(self) -> None:
+    def start(self, check_connection: bool = False) -> None:
         """ Start the Docker client.
 
+            The client gets created with the API version cached for the engine, so the version 
+            doesn't need to be negotiated. Such a client doesn't contact the engine, the cached
+            version gets checked by the first request (see _call()).
+
+            Args:
+                check_connection -- check that the Docker Engine is reachable
+
             Raises:
                 ContainerEngineError -- if the Docker client can't be started
         """
-        if self._docker_client is None:
+        with self._start_lock:
+            if self._docker_client is None:
+                self._create_docker_client()
+
+        if check_connection and self._is_version_pinned:
+            self._call(lambda docker_client: docker_client.ping())
+
+    def _create_docker_client(self) -> None:
+        """ Create the Docker client with the cached API version, or negotiate the version if it's
+            not cached. The _start_lock must be held.
+
+            Raises:
+                ContainerEngineError -- if the Docker client can't be created
+        """
+        with self.host_metadata_json.lock:
+            host_metadata = dict(self.host_metadata_json.get_entry(self._docker_server_url))
+        version = self._api_versions.get(self._docker_server_url, 
+                                         host_metadata.get("api_version", "auto"))
+
+        try:
+            self._docker_client = DockerClient(base_url=self._docker_server_url, version=version)
+        except docker.errors.DockerException as e:
+            if version == "auto":
+                raise ContainerEngineError(f"Unable to connect to the Docker Engine: {e}")
+            # The cached version might be outdated, negotiate it again.
+            try:
+                self._docker_client = DockerClient(base_url=self._docker_server_url, 
+                                                   version="auto")
+            except docker.errors.DockerException as e:
+                raise ContainerEngineError(f"Unable to connect to the Docker Engine: {e}")
+            version = "auto"
+        self._is_version_pinned = version != "auto"
+
+        api_version = self._docker_client.api.api_version
+        self._api_versions[self._docker_server_url] = api_version
+
+        if (host_metadata.get("api_version") != api_version or 
+            time.time() - host_metadata.get("last_seen", 0) > self._host_metadata_max_age_s):
+            self._refresh_host_metadata()
+
+    def _renegotiate(self, docker_client: DockerClient) -> bool:
+        """ Drop the cached API version and create the client again with a negotiated version.
+
+            Args:
+                docker_client -- the client that failed
+
+            Returns:
+                False if the version of the failed client had been negotiated or already worked, 
+                so negotiating it again wouldn't help
+
+            Raises:
+                ContainerEngineError -- if the Docker Engine is not reachable
+        """
+        with self._start_lock:
+            if self._docker_client is not docker_client:
+                # Another thread has already created it again.
+                return True
+            if not self._is_version_pinned:
+                return False
+
+            self._api_versions.pop(self._docker_server_url, None)
+            with self.host_metadata_json.lock:
+                self.host_metadata_json.get_entry(self._docker_server_url).pop("api_version", 
+                                                                                       None)
             try:
-                self._docker_client = DockerClient(base_url=self._docker_server_url, version="auto")
+                self._docker_client = DockerClient(base_url=self._docker_server_url, 
+                                                   version="auto")
             except docker.errors.DockerException as e:
                 raise ContainerEngineError(f"Unable to connect to the Docker Engine: {e}")
+            self._is_version_pinned = False
+            self._api_versions[self._docker_server_url] = self._docker_client.api.api_version
+            self._refresh_host_metadata()
+
+        return True
+
+    @staticmethod
+    def _is_api_version_error(error: docker.errors.APIError) -> bool:
+        """ Returns with True if the engine refused the API version of the client."""
+        return error.status_code == 400 and "version" in str(error.explanation).lower()
+
+    def _call(self, request: Callable[[DockerClient], Any]) -> Any:
+        """ Send a request with the Docker client.
+
+            If the client with the cached API version can't reach the engine or the engine refuses 
+            the version, the version gets negotiated again and the request gets retried once.
+
+            Args:
+                request -- sends the request with the client passed to it
+
+            Returns:
+                the result of the request
+
+            Raises:
+                ContainerEngineError -- if the Docker Engine is not reachable
+        """
+        docker_client = self._get_docker_client()
+        try:
+            result = request(docker_client)
+        except requests.exceptions.ConnectionError as e:
+            if not self._renegotiate(docker_client):
+                raise ContainerEngineError(f"Unable to connect to the Docker Engine: {e}")
+        except docker.errors.APIError as e:
+            if not self._is_api_version_error(e) or not self._renegotiate(docker_client):
+                raise
+        else:
+            self._is_version_pinned = False
+            return result
+
+        try:
+            return request(self._docker_client)
+        except requests.exceptions.ConnectionError as e:
+            raise ContainerEngineError(f"Unable to connect to the Docker Engine: {e}")
+
+    @property
+    def host_metadata_json(self) -> HostMetadataJSON:
+        """ The host metadata cache shared by all the container engines. It gets loaded only at 
+            the first access.
+        """
+        return HostMetadataJSON.get_shared()
+
+    def _refresh_host_metadata(self) -> None:
+        """ Request the metadata from the Docker Engine and store it in the host metadata cache.
+            The _start_lock must be held.
+
+            It's called right after the client has been created, so the metadata is saved before 
+            the client gets used. If the engine doesn't support the API version of the client, the
+            client gets recreated with the version of the engine.
+        """
+        try:
+            # The unversioned endpoint works with any API version.
+            engine_version = self._docker_client.api.version(api_version=False)
+        except (docker.errors.DockerException, requests.exceptions.RequestException):
+            return
+
+        api_version = engine_version.get("ApiVersion")
+        if api_version and api_version != self._docker_client.api.api_version:
+            try:
+                self._docker_client = DockerClient(base_url=self._docker_server_url, 
+                                                   version=api_version)
+            except docker.errors.DockerException:
+                return
+            self._api_versions[self._docker_server_url] = api_version
+
+        with self.host_metadata_json.lock:
+            host_metadata = self.host_metadata_json.get_entry(self._docker_server_url)
+            host_metadata.update({
+                "api_version": self._docker_client.api.api_version,
+                "engine_version": engine_version.get("Version"),
+                "os": engine_version.get("Os"),
+                "arch": engine_version.get("Arch"),
+                "last_seen": time.time(),
+            })
+            self.host_metadata_json.flush()
+
+    def _get_docker_client(self) -> DockerClient:
+        """ Get the Docker client. Start it if it's not started yet.
+
+            Return with the Docker client.
+
+            Raises:
+                ContainerEngineError -- if the Docker client can't be started
+        """
+        if self._docker_client is None:
+            self.start()
+        return self._docker_client
+
+    def _list_local_images(self) -> dict[str, str]:
+        """ List the local images directly from the Docker Engine.
+
+            The raw /images/json endpoint is used and only the Id and RepoTags fields of the 
+            response are kept. (The high-level images.list() would inspect every image one by one.)
+
+            Return with the image IDs by tag.
+        """
+        local_images = {}
+        for image in self._call(lambda docker_client: docker_client.api.images(filters=None)):
+            for tag in image.get("RepoTags") or []:
+                if tag and tag != "<none>:<none>":
+                    local_images[tag] = image["Id"]
+        return local_images
+
+    def _get_image_index(self) -> dict[str, str]:
+        """ Get the image index. List the local images from the Docker Engine if the index is not 
+            valid. The _image_index_lock must be held.
+
+            Return with the image IDs by tag.
+        """
+        if self._local_image_ids is None:
+            self._local_image_ids = self._list_local_images()
+
+        return self._local_image_ids
+
+    def invalidate_image_index(self) -> None:
+        """ Drop the image index, so the local images get listed again at the next query."""
+        with self._image_index_lock:
+            self._local_image_ids = None
+
+    def _update_image_index(self, event: dict) -> None:
+        """ Apply an image event of the Docker Engine to the image index.
+
+            The image of the event gets inspected to get its current tags, so the index is kept
+            up-to-date without listing all the images again. The index gets invalidated if the
+            change can't be followed.
+
+            Args:
+                event -- the decoded image event
+        """
+        action = event.get("Action", "")
+        image_id = event.get("Actor", {}).get("ID", "")
+        if action not in self._image_events or not image_id:
+            self.invalidate_image_index()
+            return
+
+        with self._image_index_lock:
+            if self._local_image_ids is None:
+                # It will be listed at the next query anyway.
+                return
+
+        tags: list[str] = []
+        if action != "delete":
+            try:
+                image = self._call(lambda docker_client: docker_client.api.inspect_image(image_id))
+            except docker.errors.NotFound:
+                pass
+            except (docker.errors.APIError, ContainerEngineError):
+                self.invalidate_image_index()
+                return
+            else:
+                # The pull events refer to the image by its tag.
+                image_id = image["Id"]
+                tags = [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+
+        with self._image_index_lock:
+            if self._local_image_ids is None:
+                return
+            for tag, tagged_image_id in list(self._local_image_ids.items()):
+                if tagged_image_id == image_id or tag == image_id:
+                    del self._local_image_ids[tag]
+            for tag in tags:
+                self._local_image_ids[tag] = image_id
+
+    def add_event_listener(self, listener: Callable[[dict], None]) -> None:
+        """ Register a function to be called with the events of the Docker Engine.
+
+            The image and the container die events get watched on a background thread started 
+            with the first listener. While the events are watched, the image index gets updated 
+            at each image event instead of listing all the images again. The listener gets called
+            from that thread after the image index has been updated. It's also called with an 
+            empty dict after each connection to the event stream, because the events before it 
+            might have been missed.
+
+            Args:
+                listener -- the function to call with the decoded event
+        """
+        with self._events_lock:
+            self._event_listeners.append(listener)
+            if self._events_thread is None:
+                self._events_stop.clear()
+                self._events_thread = Thread(target=self._watch_events, daemon=True)
+                self._events_thread.start()
+
+    def remove_event_listener(self, listener: Callable[[dict], None]) -> None:
+        """ Unregister an event listener. The watching stops with the last listener.
+
+            Args:
+                listener -- the function registered with add_event_listener()
+        """
+        with self._events_lock:
+            self._event_listeners.remove(listener)
+            if self._event_listeners or self._events_thread is None:
+                return
+            self._events_stop.set()
+            if self._events_stream is not None:
+                self._events_stream.close()
+            thread = self._events_thread
+            self._events_thread = None
+        thread.join()
+
+    def _notify_event_listeners(self, event: dict) -> None:
+        """ Call the event listeners. A failing listener doesn't stop the others.
+
+            Args:
+                event -- the decoded event
+        """
+        with self._events_lock:
+            listeners = list(self._event_listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                pass
+
+    def _watch_events(self) -> None:
+        """ Follow the events of the Docker Engine until the watching is stopped. 
+        
+            The connection gets retried after _events_retry_interval_s if it's lost.
+        """
+        filters = {
+            "type": ["image", "container"],
+            "event": sorted(self._image_events | {"die"})
+        }
+        while not self._events_stop.is_set():
+            try:
+                stream = self._call(lambda docker_client: docker_client.api.events(decode=True, 
+                                                                                   filters=filters))
+                with self._events_lock:
+                    if self._events_stop.is_set():
+                        stream.close()
+                        return
+                    self._events_stream = stream
+
+                # The changes before the connection are unknown.
+                self.invalidate_image_index()
+                self._forget_warm_containers()
+                self._notify_event_listeners({})
+
+                for event in stream:
+                    if event.get("Type") == "image":
+                        self._update_image_index(event)
+                    elif event.get("Type") == "container":
+                        self._forget_warm_containers(event.get("Actor", {}).get("ID", ""))
+                    self._notify_event_listeners(event)
+            except Exception:
+                # The connection is lost or the stream got closed.
+                pass
+            finally:
+                with self._events_lock:
+                    self._events_stream = None
+            self._events_stop.wait(self._events_retry_interval_s)
 
     def get_local_tool_images(self) -> list[str]:
         """ Get local tool images.
         
-            Return with the list of the locally avialable tool image names.
+            Return with the sorted list of the locally avialable tool image names.
+        """
+        with self._image_index_lock:
+            return sorted(self._get_image_index())
+
+    def is_image_local(self, image: str) -> bool:
+        """ Check whether the image is available locally.
+
+            Args:
+                image -- the tag of the image
+
+            Return with True if the image is available locally.
         """
-        local_image_tags = []
+        with self._image_index_lock:
+            return image in self._get_image_index()
 
-        for image in self._docker_client.images.list():
-            for tag in image.tags:
-                if tag:
-                    local_image_tags.append(tag)
+    def is_image_up_to_date(self, image: str) -> bool:
+        """ Check whether the local image has the same digest as the image in the registry.
 
-        return local_image_tags
+            The digest of the remote manifest is requested by the Docker Engine with a HEAD request,
+            so the image doesn't get downloaded.
+
+            Args:
+                image -- the tag of the local image
+
+            Return with False if the registry has a newer image. If the digests can't be compared
+            (e.g. the registry is not available), the local image is considered up-to-date.
+        """
+        try:
+            local_digests = self._call(
+                lambda docker_client: docker_client.api.inspect_image(image)).get("RepoDigests") or []
+            remote_digest = self._call(
+                lambda docker_client: docker_client.api.inspect_distribution(image))["Descriptor"]["digest"]
+        except (docker.errors.APIError, KeyError):
+            return True
+
+        return any(local_digest.endswith("@" + remote_digest) for local_digest in local_digests)
+
+    def pull_stream(self, repository: str) -> Generator[dict, None, None]:
+        """ Pull a repository and yield the progress reported by the Docker Engine.
+
+            Args:
+                repository -- repository to pull
+
+            Yields the decoded progress items of the pull.
+
+            Raises:
+                ContainerEngineError -- if the pull fails
+        """
+        try:
+            stream = self._call(lambda docker_client: docker_client.api.pull(repository, stream=True, 
+                                                                             decode=True))
+            for item in stream:
+                if "error" in item:
+                    raise ContainerEngineError(f"Failed to pull {repository}: {item['error']}")
+                yield item
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(f"Failed to pull {repository}: {e}")
+        finally:
+            self.invalidate_image_index()
 
     def pull(self, repository: str) -> None:
         """ Pull a repository from the axemsolutions registry.
         
             Args:
                 repository -- repository to pull
+
+            Raises:
+                ContainerEngineError -- if the pull fails
         """
-        resp = self._docker_client.api.pull(repository, stream=True, decode=True)
-        self.user_output.progress_generator(resp)
+        self.user_output.progress_generator(self.pull_stream(repository))
 
     def run(self, image: str, command: str | list | None = None, stdout: bool = True, 
-            stderr: bool = True, remove: bool = True, **kwargs: dict[str, Any]) -> None:
+            stderr: bool = True, remove: bool = True, log_prefix: str = "",
+            output: Callable[[bytes, bool], None] | None = None, cancel_event: Event | None = None,
+            **kwargs: dict[str, Any]) -> RunResult:
         """ Run the container. 
         
-            The container always gets started in detach mode. If the -d option is enabled the 
-            function returns after the container has been started. If not enabled DEM streams 
-            the logs from the container to the user output while it is running. This effectively 
-            results in the same behaviour as the docker run command's -d option.
+            The container always gets started in detach mode. DEM streams the output of the 
+            container to the user output while it is running, then waits for the container to 
+            stop and gets its exit code. This effectively results in the same behaviour as the 
+            docker run command without the -d option.
 
             Args:
                 image -- the image to run
@@ -66,20 +547,393 @@ class ContainerEngine(Core):
                 stdout -- stream stdout
                 stderr -- stream stderr
                 remove -- remove the container after it has stopped
+                log_prefix -- the prefix of the streamed log lines
+                output -- receives the output (data, is_stderr) instead of the user output
+                cancel_event -- the container gets killed when this event is set
                 kwargs -- additional arguments - see the docker-py documentation for more details
+
+            Returns:
+                the result of the run
+
+            Raises:
+                ContainerEngineError -- if the container's output can't be streamed or it can't be
+                                        waited for
         """
+        start_time = time.monotonic()
         # Run the container in detached mode
-        container: Container = self._docker_client.containers.run(image, command, detach=True, stdout=True, stderr=True,
-                                                                  **kwargs)
+        container: Container = self._call(
+            lambda docker_client: docker_client.containers.run(image, command, detach=True, 
+                                                               stdout=True, stderr=True, **kwargs))
+        memory_usage = self._watch_memory_usage(container)
+
+        stopped = Event()
+        if cancel_event is not None:
+            Thread(target=self._kill_on_cancel, args=(container, cancel_event, stopped), 
+                   daemon=True).start()
 
-        # Attach to the container's logs and stream them in real-time
-        for line in container.logs(stdout=stdout, stderr=stderr, stream=True):
-            self.user_output.msg(line.decode().strip())
+        try:
+            # Attach to the container's output and stream it in real-time
+            output_size = self._stream_output(
+                lambda: container.attach(stdout=stdout, stderr=stderr, stream=True, logs=True, 
+                                         demux=True), 
+                log_prefix, output)
+
+            try:
+                exit_code = container.wait()["StatusCode"]
+            except docker.errors.APIError as e:
+                raise ContainerEngineError(f"Failed to wait for the container: {e}")
+        except BaseException:
+            stopped.set()
+            # The container might still be running. Left behind, its name would block the next run.
+            if remove:
+                try:
+                    container.remove(force=True)
+                except docker.errors.APIError:
+                    pass
+            raise
+        finally:
+            stopped.set()
+        duration_s = time.monotonic() - start_time
 
         # Remove the container if the remove option is enabled
         if remove:
             container.remove()
 
+        return RunResult(exit_code, duration_s, output_size, memory_usage.get("peak"))
+
+    def _kill_on_cancel(self, container: Container, cancel_event: Event, stopped: Event) -> None:
+        """ Kill the container if the cancel event gets set before it stops.
+
+            Args:
+                container -- the container
+                cancel_event -- the event requesting the cancellation
+                stopped -- the event set when the container has stopped
+        """
+        while not stopped.wait(self._cancel_poll_interval_s):
+            if cancel_event.is_set():
+                try:
+                    container.kill()
+                except docker.errors.APIError:
+                    # It has stopped in the meantime.
+                    pass
+                return
+
+    def _watch_memory_usage(self, container: Container) -> dict[str, int]:
+        """ Follow the memory usage of the container on a separate thread until it stops.
+
+            Args:
+                container -- the container
+
+            Returns:
+                the dict where the highest reported usage is stored under the "peak" key
+        """
+        memory_usage: dict[str, int] = {}
+
+        def watch() -> None:
+            try:
+                for stats in container.stats(stream=True, decode=True):
+                    usage = stats.get("memory_stats", {}).get("usage")
+                    if usage is not None and usage > memory_usage.get("peak", 0):
+                        memory_usage["peak"] = usage
+            except Exception:
+                # The memory usage is only informative.
+                pass
+
+        Thread(target=watch, daemon=True).start()
+        return memory_usage
+
+    def _is_warm_container_healthy(self, container: Container) -> bool:
+        """ Check that a command can be executed in the warm container.
+
+            The check counts as activity, so the container doesn't expire right after it.
+
+            Args:
+                container -- the warm container
+
+            Returns:
+                True if the container is healthy
+        """
+        try:
+            return container.exec_run(["/bin/sh", "-c", f"touch {self._warm_marker}"]).exit_code == 0
+        except docker.errors.APIError:
+            return False
+
+    def _get_image_entrypoint(self, image: str) -> list[str]:
+        """ Get the ENTRYPOINT of the image. The image gets pulled if it's not available locally,
+            like at run().
+
+            Args:
+                image -- the image
+
+            Returns:
+                the entrypoint, an empty list if the image doesn't have one
+        """
+        def get_image(docker_client: DockerClient) -> Image:
+            try:
+                return docker_client.images.get(image)
+            except docker.errors.ImageNotFound:
+                return docker_client.images.pull(image)
+
+        return self._call(get_image).attrs["Config"].get("Entrypoint") or []
+
+    def _get_warm_container(self, image: str, dev_env_name: str, network: str | None) -> Container:
+        """ Get the warm container of the Dev Env and image. Start it if there is no healthy one.
+
+            The keepalive loop replaces the ENTRYPOINT of the image, so the entrypoint gets stored
+            in the dem.warm.entrypoint label, and run_warm() runs the commands through it. The 
+            unhealthy warm containers get removed.
+
+            Args:
+                image -- the image of the container
+                dev_env_name -- the name of the Dev Env the container belongs to
+                network -- the network to connect the container to
+
+            Returns:
+                the running warm container
+
+            Raises:
+                ContainerEngineError -- if the warm container can't be started
+        """
+        labels = {
+            self._warm_label: "true",
+            f"{self._warm_label}.dev_env": dev_env_name,
+            f"{self._warm_label}.image": image,
+            f"{self._warm_label}.network": network or "",
+        }
+        key = (dev_env_name, image, network or "")
+
+        with self._warm_lock:
+            container = self._warm_containers.get(key, None)
+            if container is not None:
+                return container
+
+            # The containers without the entrypoint label were started by an older version.
+            filters = {"label": [f"{key}={value}" for key, value in labels.items()] + 
+                                [f"{self._warm_label}.entrypoint"], 
+                       "status": "running"}
+            for container in self._call(
+                lambda docker_client: docker_client.containers.list(filters=filters)):
+                if self._is_warm_container_healthy(container):
+                    self._remember_warm_container(key, container)
+                    return container
+                try:
+                    container.remove(force=True)
+                except docker.errors.APIError:
+                    # It has stopped and removed itself in the meantime.
+                    pass
+
+            idle_timeout_s = self.config_file.warm_container_idle_timeout_s
+            keepalive = (f"touch {self._warm_marker}; "
+                         f"while [ $(( $(date +%s) - $(stat -c %Y {self._warm_marker}) )) -lt {idle_timeout_s} ]; "
+                         f"do sleep 5; done")
+            try:
+                labels[f"{self._warm_label}.entrypoint"] = json.dumps(
+                    self._get_image_entrypoint(image))
+                container = self._call(
+                    lambda docker_client: docker_client.containers.run(
+                        image, [keepalive], entrypoint=["/bin/sh", "-c"], detach=True, 
+                        auto_remove=True, labels=labels, network=network))
+            except docker.errors.DockerException as e:
+                raise ContainerEngineError(f"Unable to start the warm container of {image}: {e}")
+            self._remember_warm_container(key, container)
+            return container
+
+    def _remember_warm_container(self, key: tuple[str, str, str], container: Container) -> None:
+        """ Remember the warm container while its death gets noticed from the Docker events. The
+            _warm_lock must be held.
+
+            Args:
+                key -- the Dev Env name, the image and the network of the container
+                container -- the warm container
+        """
+        with self._events_lock:
+            if self._events_stream is not None:
+                self._warm_containers[key] = container
+
+    def _forget_warm_containers(self, container_id: str = "") -> None:
+        """ Forget the remembered warm container.
+
+            Args:
+                container_id -- the ID of the container, all of them if empty
+        """
+        with self._warm_lock:
+            for key, container in list(self._warm_containers.items()):
+                if not container_id or container.id == container_id:
+                    del self._warm_containers[key]
+
+    def run_warm(self, image: str, command: str, dev_env_name: str, network: str | None = None,
+                 user: str | None = None, log_prefix: str = "", 
+                 output: Callable[[bytes, bool], None] | None = None) -> RunResult:
+        """ Run the command in the warm container of the Dev Env and image.
+
+            The warm container gets started if it isn't running yet. The command gets executed 
+            through the ENTRYPOINT of the image, like at run(). The output of the command is
+            streamed to the user output like at run().
+
+            Args:
+                image -- the image of the container
+                command -- the command to run with bash
+                dev_env_name -- the name of the Dev Env the container belongs to
+                network -- the network to connect the container to
+                user -- the user to run the command as
+                log_prefix -- the prefix of the streamed log lines
+                output -- receives the output (data, is_stderr) instead of the user output
+
+            Returns:
+                the result of the run (the memory peak is not reported)
+
+            Raises:
+                ContainerEngineError -- if the command can't be run in the warm container
+        """
+        start_time = time.monotonic()
+
+        # The marker is kept fresh while the command runs, so a long command doesn't let the 
+        # container expire. The command is passed in an environment variable to avoid quoting it.
+        wrapped_command = (f"touch {self._warm_marker}; "
+                           f"(while sleep 5; do touch {self._warm_marker}; done) & keepalive=$!; "
+                           f"/bin/bash -c \"$DEM_TASK_COMMAND\"; exit_code=$?; "
+                           f"kill $keepalive; touch {self._warm_marker}; exit $exit_code")
+        def create_exec() -> str:
+            container = self._get_warm_container(image, dev_env_name, network)
+            # Getting the warm container might have negotiated the API version again.
+            entrypoint = json.loads(container.labels[f"{self._warm_label}.entrypoint"])
+            api = self._get_docker_client().api
+            try:
+                return api.exec_create(container.id, 
+                                       [*entrypoint, "/bin/bash", "-c", wrapped_command], 
+                                       user=user or "", 
+                                       environment={"DEM_TASK_COMMAND": command})["Id"]
+            except docker.errors.APIError:
+                self._forget_warm_containers(container.id)
+                raise
+
+        try:
+            try:
+                exec_id = create_exec()
+            except docker.errors.APIError:
+                # The remembered warm container might have just expired, look it up again.
+                exec_id = create_exec()
+            api = self._get_docker_client().api
+            output_size = self._stream_output(
+                lambda: api.exec_start(exec_id, stream=True, demux=True), log_prefix, output)
+            exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(f"Failed to run the command in the warm container: {e}")
+
+        return RunResult(exit_code, time.monotonic() - start_time, output_size, None)
+
+    def stop_warm_containers(self, dev_env_name: str = "") -> int:
+        """ Stop and remove the warm containers.
+
+            Args:
+                dev_env_name -- only the warm containers of this Dev Env, all if empty
+
+            Returns:
+                the number of the removed containers
+        """
+        labels = [f"{self._warm_label}=true"]
+        if dev_env_name:
+            labels.append(f"{self._warm_label}.dev_env={dev_env_name}")
+
+        self._forget_warm_containers()
+        removed = 0
+        containers = self._call(
+            lambda docker_client: docker_client.containers.list(all=True, filters={"label": labels}))
+        for container in containers:
+            try:
+                container.remove(force=True)
+            except docker.errors.NotFound:
+                # It has just expired and removed itself.
+                continue
+            removed += 1
+        return removed
+
+    def _stream_output(self, open_stream: Callable[[], Iterable[tuple[bytes | None, bytes | None]]], 
+                       log_prefix: str, output: Callable[[bytes, bool], None] | None = None) -> int:
+        """ Pass the output of a container through to the user output until the stream ends.
+
+            The frames are read on a separate thread, so the frames arriving while a batch is 
+            being written get written together with a single call. The consecutive frames of the 
+            same stream are joined, so the order of the stdout and stderr output is kept.
+
+            Args:
+                open_stream -- opens the demultiplexed (stdout, stderr) output stream
+                log_prefix -- the prefix of the lines, only complete lines get written if not empty
+                output -- receives the output (data, is_stderr), the user output if None
+
+            Returns:
+                the bytes of output the container produced
+        """
+        # Bounded, so a slow terminal slows down the reading of the container output.
+        frames: Queue = Queue(maxsize=1024)
+
+        def read_frames() -> None:
+            try:
+                for frame in open_stream():
+                    frames.put(frame)
+            except Exception as e:
+                frames.put(e)
+            finally:
+                frames.put(None)
+
+        Thread(target=read_frames, daemon=True).start()
+
+        if output is None:
+            output = self.user_output.raw_output
+        prefix = log_prefix.encode()
+        # The incomplete last lines of stdout (False) and stderr (True) waiting for the prefix.
+        incomplete_lines = {False: b"", True: b""}
+
+        def write(data: bytes, is_stderr: bool) -> None:
+            if prefix:
+                data = incomplete_lines[is_stderr] + data
+                complete, separator, incomplete_lines[is_stderr] = data.rpartition(b"\n")
+                if not separator:
+                    return
+                data = b"".join(prefix + line for line in (complete + separator).splitlines(True))
+            output(data, is_stderr)
+
+        output_size = 0
+        is_done = False
+        while not is_done:
+            batch: list[bytes] = []
+            batch_size = 0
+            is_batch_stderr = False
+            frame = frames.get()
+            while True:
+                if frame is None:
+                    is_done = True
+                    break
+                if isinstance(frame, Exception):
+                    raise ContainerEngineError(f"Failed to stream the output of the container: {frame}")
+
+                for is_stderr, data in ((False, frame[0]), (True, frame[1])):
+                    if not data:
+                        continue
+                    if batch and is_stderr != is_batch_stderr:
+                        write(b"".join(batch), is_batch_stderr)
+                        batch, batch_size = [], 0
+                    batch.append(data)
+                    batch_size += len(data)
+                    output_size += len(data)
+                    is_batch_stderr = is_stderr
+
+                if batch_size >= self._output_batch_size:
+                    break
+                try:
+                    frame = frames.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                write(b"".join(batch), is_batch_stderr)
+
+        for is_stderr, data in incomplete_lines.items():
+            if data:
+                output(prefix + data + b"\n", is_stderr)
+
+        return output_size
+
     def remove(self, image: str) -> None:
         """ Remove a tool image.
 
@@ -90,11 +944,14 @@ class ContainerEngine(Core):
                 ContainerEngineError -- if the image is used by a container
         """
         try:
-            self._docker_client.images.remove(image)
+            self._call(lambda docker_client: docker_client.images.remove(image))
         except docker.errors.ImageNotFound:
+            self.invalidate_image_index()
             self.user_output.msg(f"[yellow]The {image} doesn't exist. Unable to remove it.[/]\n")
         except docker.errors.APIError:
             raise ContainerEngineError(f"The {image} is used by a container. Unable to remove it.\n")
+        else:
+            self.invalidate_image_index()
 
     def create_network(self, network_name: str) -> None:
         """ Create a Docker network.
@@ -102,7 +959,7 @@ class ContainerEngine(Core):
             Args:
                 network_name -- the name of the network
         """
-        self._docker_client.networks.create(network_name)
+        self._call(lambda docker_client: docker_client.networks.create(network_name))
 
     def remove_network(self, network_name: str) -> None:
         """ Remove a Docker network.
@@ -111,7 +968,7 @@ class ContainerEngine(Core):
                 network_name -- the name of the network
         """
         try:
-            network = self._docker_client.networks.get(network_name)
+            network = self._call(lambda docker_client: docker_client.networks.get(network_name))
         except docker.errors.NotFound:
             self.user_output.msg(f"[yellow]The {network_name} doesn't exist. Unable to remove it.[/]\n")
             return
@@ -3,15 +3,19 @@
 
 from dem.core.user_output import UserOutput, NoUserOutput
 from dem.core.data_management import ConfigFile
+from dem.core.http_client import HTTPClient
 
 class Core():
     """ Base class for all core classes.
     
         Class attributes:
             user_output -- interface to the UI (must be a descendant of the UserOutput class)
+            config_file -- the config.json file
+            http_client -- pooled HTTP client shared by the registries and catalogs
     """
     user_output: UserOutput = NoUserOutput()
     config_file: ConfigFile = ConfigFile()
+    http_client: HTTPClient = HTTPClient()
 
     """ Set the user output class for all core descendant core classes.
     
@@ -1,27 +1,235 @@
 """json file handling."""
 # dem/core/data_management.py
 
-from typing import Any
+from typing import Any, Generator
+from contextlib import contextmanager
 from dem.core.properties import __config_dir_path__
-from dem.core.exceptions import DataStorageError
+from dem.core.exceptions import DataStorageError, DataStorageConflictError
 from pathlib import PurePath
+from threading import get_ident, Lock, RLock
+import hashlib
 import os
 import json
 
+try:
+    import fcntl
+except ImportError:
+    # No advisory file locks on this platform (e.g. Windows).
+    fcntl = None
+
+# Marks a missing key while merging.
+_MISSING = object()
+
 class BaseJSON():
     """ This class acts as an abstracted buffer over a json file. 
     
         If the buffer is not up-to-date it can be updated with update() which is a read from the 
         json file. If the buffer has newer data it can be written to file with flush().
 
+        A flush is skipped if the content is the same as the one last read or written. The flushes
+        inside batch() are coalesced into a single write at its end.
+
+        The file is written atomically: the content goes to a temporary file, which gets synced 
+        to the disk and renamed over the json file. A crash or an interrupt during the write 
+        leaves the previous content in place. The writes of the dem processes (e.g. the API server
+        and a CLI command) are serialized with an exclusive lock on the .lock file next to the 
+        json file. If the file holds user data and it was modified by another process since it 
+        was last read or written, the changes of the buffer get merged into the newer content 
+        instead of overwriting it. If both changed the same value, the write is refused and the 
+        buffer gets reloaded, so the change can be applied again.
+
         Class attributes: 
             _config_dir -- points to the json files' directory
             _path -- path to the json file (must be set in the descending classes)
             _default_json -- default json content
+            _keep_backups -- keep the previous versions of the file (set in the descending classes)
+            _check_conflicts -- merge the changes of other processes instead of overwriting them 
+                                (set in the descending classes)
+            backup_count -- the number of the previous versions to keep as <file>.1 (the newest) 
+                            ... <file>.N
         """
     _config_dir = os.path.expanduser('~') + __config_dir_path__
     _path = ""
     _default_json = ""
+    _keep_backups = False
+    _check_conflicts = False
+    backup_count = 0
+
+    @contextmanager
+    def _lock(self) -> Generator:
+        """ Hold the exclusive lock of the json file."""
+        if fcntl is None:
+            yield
+            return
+
+        with open(f"{self._path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rotate_backups(self) -> None:
+        """ Shift the backups by one and keep the current version of the json file as the newest 
+            backup. The lock must be held.
+        """
+        if not os.path.exists(self._path):
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            backup_path = f"{self._path}.{index}"
+            if os.path.exists(backup_path):
+                os.replace(backup_path, f"{self._path}.{index + 1}")
+
+        newest_backup_path = f"{self._path}.1"
+        try:
+            os.unlink(newest_backup_path)
+        except FileNotFoundError:
+            pass
+        # The json file gets replaced, not modified, so a hard link keeps its current version.
+        try:
+            os.link(self._path, newest_backup_path)
+        except OSError:
+            with open(self._path, "r") as json_file, open(newest_backup_path, "w") as backup_file:
+                backup_file.write(json_file.read())
+
+    @staticmethod
+    def _merge(base: Any, ours: Any, theirs: Any) -> Any:
+        """ Three-way merge of the deserialized json values. The objects get merged by key, the 
+            lists of named objects (e.g. the Dev Envs and the registries) by name.
+
+            Args:
+                base -- the common ancestor
+                ours -- the value changed by this process
+                theirs -- the value changed by another process
+
+            Returns:
+                the merged value, _MISSING if the key got deleted
+
+            Raises:
+                ValueError -- if both changed the same value differently
+        """
+        if ours == base:
+            return theirs
+        if theirs == base or theirs == ours:
+            return ours
+
+        values = (base, ours, theirs)
+        if all(isinstance(value, list) for value in values):
+            named_values = []
+            for value in values:
+                names = [item.get("name") if isinstance(item, dict) else None for item in value]
+                if None in names or len(set(names)) != len(names):
+                    raise ValueError("The list items can't be matched.")
+                named_values.append(dict(zip(names, value)))
+            return list(BaseJSON._merge(*named_values).values())
+
+        if all(isinstance(value, dict) for value in values):
+            merged = {}
+            for key in list(theirs) + [key for key in ours if key not in theirs]:
+                value = BaseJSON._merge(base.get(key, _MISSING), ours.get(key, _MISSING), 
+                                        theirs.get(key, _MISSING))
+                if value is not _MISSING:
+                    merged[key] = value
+            return merged
+
+        raise ValueError("The value was changed by both.")
+
+    def _merge_concurrent_changes(self, content: str) -> str:
+        """ Merge the content into the json file if it was modified by another process since it was
+            last read or written. The lock must be held.
+
+            Args:
+                content -- the serialized json
+
+            Returns:
+                the content to write
+
+            Raises:
+                DataStorageConflictError -- if both modified the same value
+        """
+        if not self._check_conflicts or self._synced_content is None:
+            return content
+
+        try:
+            with open(self._path, "r") as json_file:
+                current_content = json_file.read()
+        except FileNotFoundError:
+            return content
+
+        if self._hash(current_content) == self._content_hash:
+            return content
+
+        try:
+            merged = self._merge(json.loads(self._synced_content), json.loads(content), 
+                                 json.loads(current_content))
+        except ValueError:
+            raise DataStorageConflictError(f"The {os.path.basename(self._path)} file was modified "
+                                           "by another process. The changes were not saved, "
+                                           "please try again.")
+        return json.dumps(merged, indent=4)
+
+    def _write(self, content: str) -> None:
+        """ Write the content to the json file atomically.
+
+            Args:
+                content -- the serialized json
+
+            Raises:
+                DataStorageConflictError -- if the file was modified by another process and the 
+                                            changes can't be merged
+        """
+        dir_path = os.path.dirname(self._path)
+        # Unique for the writer, the lock only serializes the writers of the same json file.
+        tmp_path = f"{self._path}.{os.getpid()}.{get_ident()}.tmp"
+        with self._lock():
+            content = self._merge_concurrent_changes(content)
+
+            if self._keep_backups and self.backup_count > 0:
+                self._rotate_backups()
+
+            try:
+                with open(tmp_path, "w") as tmp_file:
+                    tmp_file.write(content)
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+        # Persist the rename too. Not all the platforms and file systems support it.
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _hash(content: str) -> bytes:
+        """ Returns with the hash of the serialized json."""
+        return hashlib.sha256(content.encode()).digest()
+
+    def _written(self) -> None:
+        """ Called after the buffer has been written to the json file. """
+        pass
+
+    def _synced(self, content: str) -> None:
+        """ Remember the content last read or written.
+
+            Args:
+                content -- the serialized json
+        """
+        self._synced_content = content
+        self._content_hash = self._hash(content)
 
     def _create_default_json(self) -> dict:
         """ If the .json doesn't exist, then create the default one.
@@ -32,9 +240,8 @@ class BaseJSON():
         if not is_path_exist:
             os.makedirs(self._config_dir)
 
-        json_file = open(self._path, "w")
-        json_file.write(self._default_json)
-        json_file.close()
+        self._write(self._default_json)
+        self._synced(self._default_json)
 
         return json.loads(self._default_json)
 
@@ -43,6 +250,12 @@ class BaseJSON():
             Later this variable can be used to access the deserialized data. 
         """
         self.deserialized: dict[str, Any] = {}
+        # The content last read or written and its hash, None if unknown. The changes of the 
+        # buffer are relative to it.
+        self._synced_content: str | None = None
+        self._content_hash: bytes | None = None
+        self._batch_depth = 0
+        self._is_dirty = False
 
     def update(self) -> None:
         """ Update the buffer with the content from the json file."""
@@ -51,21 +264,65 @@ class BaseJSON():
         except FileNotFoundError:
             self.deserialized = self._create_default_json()
         else:
-            self.deserialized = json.load(json_file)
+            content = json_file.read()
             json_file.close()
+            self.deserialized = json.loads(content)
+            self._synced(content)
 
     def flush(self) -> None:
-        """ Write the buffer content to the json file."""
-        json_file = open(self._path, "w")
-        json.dump(self.deserialized, json_file, indent=4)
-        json_file.close()
+        """ Write the buffer content to the json file.
+        
+            Inside a batch() the buffer only gets marked dirty. The write is skipped if the content
+            hasn't changed.
+        """
+        if self._batch_depth > 0:
+            self._is_dirty = True
+            return
+
+        self._is_dirty = False
+        # Serialize first, so an invalid content doesn't touch the file.
+        content = json.dumps(self.deserialized, indent=4)
+        if self._hash(content) == self._content_hash:
+            return
+        try:
+            self._write(content)
+        except DataStorageConflictError:
+            # Continue from the current content, so the change can be applied again.
+            self.update()
+            raise
+        # The changes of other processes merged by the write are not in the buffer, so they must 
+        # not be treated as its changes at the next write.
+        self._synced(content)
+        self._written()
+
+    @contextmanager
+    def batch(self) -> Generator:
+        """ Coalesce the flushes into a single write (unit of work).
+
+            The flushes inside the batch only mark the buffer dirty, a dirty buffer gets written 
+            when the outermost batch ends. It's written on an exception too, as the flushes would
+            have written it. Not thread-safe, meant for the duration of a single command.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._is_dirty:
+                self.flush()
 
     def restore(self) -> None:
         """ Restore the json file to its default content."""
+        # Overwrite the file regardless of its content.
+        self._synced_content = None
+        self._content_hash = None
         self.deserialized = self._create_default_json()
 
 class LocalDevEnvJSON(BaseJSON):
     """ Serialize and deserialize the dev_env.json file."""
+    _keep_backups = True
+    _check_conflicts = True
+
     def __init__(self) -> None:
         """ Init the class."""
         self._path = PurePath(self._config_dir + "/dev_env.json")
@@ -84,8 +341,118 @@ class LocalDevEnvJSON(BaseJSON):
         except json.decoder.JSONDecodeError as e:
             raise DataStorageError(f"The dev_env.json file is corrupted.\n{str(e)}") from e
 
+    def _written(self) -> None:
+        """ Update the name index."""
+        NameIndexJSON().rebuild()
+
+class CacheJSON(BaseJSON):
+    """ Serialize and deserialize a cache file, which stores its entries in one section, keyed by 
+        a name.
+
+        The cached data can be requested again any time, so a corrupted file gets replaced with 
+        the default one. The subclasses only set the file name and the section.
+
+        The whole process shares one instance of each cache, use get_shared() to access it. The 
+        instance gets loaded at the first access. Hold its lock while the entries are accessed 
+        from multiple threads.
+
+        Class attributes:
+            _shared_lock -- guards the creation of the shared instances
+    """
+    _shared_lock = Lock()
+
+    def __init__(self, file_name: str, section: str) -> None:
+        """ Init the class.
+        
+            Args:
+                file_name -- the name of the cache file in the config directory
+                section -- the key of the section that stores the entries
+        """
+        self._path = PurePath(self._config_dir + "/" + file_name)
+        self._section = section
+        self._default_json = json.dumps({section: {}}, indent=4) + "\n"
+        self.lock = RLock()
+        super().__init__()
+
+    @classmethod
+    def get_shared(cls) -> "CacheJSON":
+        """ Get the instance of the cache shared by the whole process. Create and load it at the
+            first call.
+        
+            Returns with the shared instance.
+        """
+        with CacheJSON._shared_lock:
+            # Look up in the class' own dictionary, so each subclass has its own instance.
+            shared = cls.__dict__.get("_shared")
+            if shared is None:
+                shared = cls()
+                shared.update()
+                cls._shared = shared
+            return shared
+
+    def update(self) -> None:
+        """ Update the buffer with the content from the json file.
+        
+            A corrupted file gets replaced with the default one.
+        """
+        try:
+            super().update()
+        except json.decoder.JSONDecodeError:
+            self.deserialized = self._create_default_json()
+
+    def get_entry(self, name: str) -> dict:
+        """ Get the cache entry. Create an empty one if it doesn't exist yet.
+        
+            Args:
+                name -- the name of the entry
+
+            Returns with the cache entry.
+        """
+        return self.deserialized.setdefault(self._section, {}).setdefault(name, {})
+
+    def delete_entry(self, name: str) -> None:
+        """ Delete the cache entry.
+
+            Args:
+                name -- the name of the entry
+        """
+        self.deserialized.get(self._section, {}).pop(name, None)
+
+class RegistryCacheJSON(CacheJSON):
+    """ Serialize and deserialize the registry_cache.json file.
+    
+        The file stores the repositories of the registries and the ETags of the endpoint responses,
+        keyed by the registry name.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        super().__init__("registry_cache.json", "registries")
+
+class CatalogCacheJSON(CacheJSON):
+    """ Serialize and deserialize the catalog_cache.json file.
+    
+        The file stores the last downloaded content of the Development Environment Catalogs with
+        their validators (ETag and Last-Modified), keyed by the catalog name.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        super().__init__("catalog_cache.json", "catalogs")
+
+class HostMetadataJSON(CacheJSON):
+    """ Serialize and deserialize the host_metadata.json file.
+    
+        The file stores the metadata of the Docker Engines (API version, engine version, OS, 
+        architecture and when it was last seen), keyed by the address of the engine.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        super().__init__("host_metadata.json", "hosts")
+
 class ConfigFile(BaseJSON):
     """ Serialize and deserialize the config.json file."""
+    _keep_backups = True
+    _check_conflicts = True
+
     def __init__(self) -> None:
         """ Init the class."""
         self._path = PurePath(self._config_dir + "/config.json")
@@ -105,7 +472,27 @@ class ConfigFile(BaseJSON):
             ],
             "hosts": [],
             "http_request_timeout_s": 2,
-            "use_native_system_cert_store": False
+            "use_native_system_cert_store": False,
+            "max_concurrency": 8,
+            "registry_page_size": 100,
+            "registry_cache_ttl_s": 600,
+            "http_pool_size": 10,
+            "http_max_retries": 2,
+            "http_retry_backoff_factor": 0.5,
+            "max_parallel_pulls": 4,
+            "check_image_digests": False,
+            "warm_container_idle_timeout_s": 600,
+            "api_max_running_jobs": 4,
+            "api_max_queued_jobs": 32,
+            "api_max_finished_jobs": 100,
+            "api_max_job_output_kib": 16384,
+            "api_host": "0.0.0.0",
+            "api_port": 8000,
+            "api_threadpool_size": 40,
+            "api_max_concurrent_requests": 0,
+            "api_keep_alive_timeout_s": 5,
+            "api_graceful_shutdown_timeout_s": 300,
+            "json_backup_count": 0
         }
         self._default_json = json.dumps(self._default_options, indent=4)
         super().__init__()
@@ -148,5 +535,261 @@ class ConfigFile(BaseJSON):
             self.use_native_system_cert_store = self._default_options["use_native_system_cert_store"]
             flush_needed = True
 
+        self.max_concurrency: int | None = self.deserialized.get("max_concurrency", None)
+        if self.max_concurrency is None:
+            self.deserialized["max_concurrency"] = self._default_options["max_concurrency"]
+            self.max_concurrency = self._default_options["max_concurrency"]
+            flush_needed = True
+
+        self.registry_page_size: int | None = self.deserialized.get("registry_page_size", None)
+        if self.registry_page_size is None:
+            self.deserialized["registry_page_size"] = self._default_options["registry_page_size"]
+            self.registry_page_size = self._default_options["registry_page_size"]
+            flush_needed = True
+
+        self.registry_cache_ttl_s: float | None = self.deserialized.get("registry_cache_ttl_s", None)
+        if self.registry_cache_ttl_s is None:
+            self.deserialized["registry_cache_ttl_s"] = self._default_options["registry_cache_ttl_s"]
+            self.registry_cache_ttl_s = self._default_options["registry_cache_ttl_s"]
+            flush_needed = True
+
+        self.http_pool_size: int | None = self.deserialized.get("http_pool_size", None)
+        if self.http_pool_size is None:
+            self.deserialized["http_pool_size"] = self._default_options["http_pool_size"]
+            self.http_pool_size = self._default_options["http_pool_size"]
+            flush_needed = True
+
+        self.http_max_retries: int | None = self.deserialized.get("http_max_retries", None)
+        if self.http_max_retries is None:
+            self.deserialized["http_max_retries"] = self._default_options["http_max_retries"]
+            self.http_max_retries = self._default_options["http_max_retries"]
+            flush_needed = True
+
+        self.http_retry_backoff_factor: float | None = self.deserialized.get("http_retry_backoff_factor", None)
+        if self.http_retry_backoff_factor is None:
+            self.deserialized["http_retry_backoff_factor"] = self._default_options["http_retry_backoff_factor"]
+            self.http_retry_backoff_factor = self._default_options["http_retry_backoff_factor"]
+            flush_needed = True
+
+        self.max_parallel_pulls: int | None = self.deserialized.get("max_parallel_pulls", None)
+        if self.max_parallel_pulls is None:
+            self.deserialized["max_parallel_pulls"] = self._default_options["max_parallel_pulls"]
+            self.max_parallel_pulls = self._default_options["max_parallel_pulls"]
+            flush_needed = True
+
+        self.check_image_digests: bool | None = self.deserialized.get("check_image_digests", None)
+        if self.check_image_digests is None:
+            self.deserialized["check_image_digests"] = self._default_options["check_image_digests"]
+            self.check_image_digests = self._default_options["check_image_digests"]
+            flush_needed = True
+
+        self.warm_container_idle_timeout_s: int | None = self.deserialized.get("warm_container_idle_timeout_s", None)
+        if self.warm_container_idle_timeout_s is None:
+            self.deserialized["warm_container_idle_timeout_s"] = self._default_options["warm_container_idle_timeout_s"]
+            self.warm_container_idle_timeout_s = self._default_options["warm_container_idle_timeout_s"]
+            flush_needed = True
+
+        self.api_max_running_jobs: int | None = self.deserialized.get("api_max_running_jobs", None)
+        if self.api_max_running_jobs is None:
+            self.deserialized["api_max_running_jobs"] = self._default_options["api_max_running_jobs"]
+            self.api_max_running_jobs = self._default_options["api_max_running_jobs"]
+            flush_needed = True
+
+        self.api_max_queued_jobs: int | None = self.deserialized.get("api_max_queued_jobs", None)
+        if self.api_max_queued_jobs is None:
+            self.deserialized["api_max_queued_jobs"] = self._default_options["api_max_queued_jobs"]
+            self.api_max_queued_jobs = self._default_options["api_max_queued_jobs"]
+            flush_needed = True
+
+        self.api_max_finished_jobs: int | None = self.deserialized.get("api_max_finished_jobs", None)
+        if self.api_max_finished_jobs is None:
+            self.deserialized["api_max_finished_jobs"] = self._default_options["api_max_finished_jobs"]
+            self.api_max_finished_jobs = self._default_options["api_max_finished_jobs"]
+            flush_needed = True
+
+        self.api_max_job_output_kib: int | None = self.deserialized.get("api_max_job_output_kib", None)
+        if self.api_max_job_output_kib is None:
+            self.deserialized["api_max_job_output_kib"] = self._default_options["api_max_job_output_kib"]
+            self.api_max_job_output_kib = self._default_options["api_max_job_output_kib"]
+            flush_needed = True
+
+        self.api_host: str | None = self.deserialized.get("api_host", None)
+        if self.api_host is None:
+            self.deserialized["api_host"] = self._default_options["api_host"]
+            self.api_host = self._default_options["api_host"]
+            flush_needed = True
+
+        self.api_port: int | None = self.deserialized.get("api_port", None)
+        if self.api_port is None:
+            self.deserialized["api_port"] = self._default_options["api_port"]
+            self.api_port = self._default_options["api_port"]
+            flush_needed = True
+
+        self.api_threadpool_size: int | None = self.deserialized.get("api_threadpool_size", None)
+        if self.api_threadpool_size is None:
+            self.deserialized["api_threadpool_size"] = self._default_options["api_threadpool_size"]
+            self.api_threadpool_size = self._default_options["api_threadpool_size"]
+            flush_needed = True
+
+        self.api_max_concurrent_requests: int | None = self.deserialized.get("api_max_concurrent_requests", None)
+        if self.api_max_concurrent_requests is None:
+            self.deserialized["api_max_concurrent_requests"] = self._default_options["api_max_concurrent_requests"]
+            self.api_max_concurrent_requests = self._default_options["api_max_concurrent_requests"]
+            flush_needed = True
+
+        self.api_keep_alive_timeout_s: int | None = self.deserialized.get("api_keep_alive_timeout_s", None)
+        if self.api_keep_alive_timeout_s is None:
+            self.deserialized["api_keep_alive_timeout_s"] = self._default_options["api_keep_alive_timeout_s"]
+            self.api_keep_alive_timeout_s = self._default_options["api_keep_alive_timeout_s"]
+            flush_needed = True
+
+        self.api_graceful_shutdown_timeout_s: int | None = self.deserialized.get("api_graceful_shutdown_timeout_s", None)
+        if self.api_graceful_shutdown_timeout_s is None:
+            self.deserialized["api_graceful_shutdown_timeout_s"] = self._default_options["api_graceful_shutdown_timeout_s"]
+            self.api_graceful_shutdown_timeout_s = self._default_options["api_graceful_shutdown_timeout_s"]
+            flush_needed = True
+
+        self.json_backup_count: int | None = self.deserialized.get("json_backup_count", None)
+        if self.json_backup_count is None:
+            self.deserialized["json_backup_count"] = self._default_options["json_backup_count"]
+            self.json_backup_count = self._default_options["json_backup_count"]
+            flush_needed = True
+
         if flush_needed:
-            self.flush()
\ No newline at end of file
+            self.flush()
+
+    def _written(self) -> None:
+        """ Update the name index."""
+        NameIndexJSON().rebuild()
+
+class NameIndexJSON(BaseJSON):
+    """ Serialize and deserialize the name_index.json file.
+    
+        The file stores the names offered by the shell completion: the Dev Envs (with their 
+        installed flag and task names), the registries, the catalogs and the hosts. The completion
+        reads only this file, so it doesn't need the Platform (the Docker Engine and the 
+        descriptors). The index gets rebuilt when the dev_env.json or the config.json is written, 
+        and when it's older than them (e.g. they were edited by hand).
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/name_index.json")
+        self._default_json = """{
+    "dev_envs": {},
+    "registries": [],
+    "catalogs": [],
+    "hosts": []
+}
+"""
+        super().__init__()
+
+    def _get_indexed_paths(self) -> list[PurePath]:
+        """ Returns with the paths of the indexed json files."""
+        return [LocalDevEnvJSON()._path, ConfigFile()._path]
+
+    def _is_stale(self) -> bool:
+        """ Returns with True if the index is missing or older than an indexed json file."""
+        try:
+            index_mtime = os.stat(self._path).st_mtime_ns
+        except FileNotFoundError:
+            return True
+
+        for path in self._get_indexed_paths():
+            try:
+                if os.stat(path).st_mtime_ns > index_mtime:
+                    return True
+            except FileNotFoundError:
+                continue
+        return False
+
+    def _load_indexed_json(self, path: PurePath) -> dict:
+        """ Load an indexed json file.
+        
+            Args:
+                path -- the path of the json file
+
+            Returns with the deserialized content, empty if the file is missing or corrupted.
+        """
+        try:
+            with open(path, "r") as json_file:
+                deserialized = json.load(json_file)
+        except (OSError, json.decoder.JSONDecodeError):
+            return {}
+        return deserialized if isinstance(deserialized, dict) else {}
+
+    def update(self) -> None:
+        """ Update the buffer with the content from the json file.
+        
+            The index gets rebuilt if it's missing, corrupted or older than the indexed files.
+        """
+        if self._is_stale():
+            self.rebuild()
+            return
+
+        try:
+            super().update()
+        except json.decoder.JSONDecodeError:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """ Rebuild the index from the dev_env.json and the config.json files.
+        
+            The index is only a cache for the completion, so failing to write it is not an error.
+        """
+        dev_env_json_path, config_file_path = self._get_indexed_paths()
+        dev_env_json = self._load_indexed_json(dev_env_json_path)
+        # Without the config.json the defaults are in use.
+        config = self._load_indexed_json(config_file_path) or ConfigFile()._default_options
+
+        dev_envs = {}
+        for descriptor in dev_env_json.get("development_environments", []):
+            task_names = [task["name"] for task in descriptor.get("docker_tasks", [])]
+            task_names += [task_name for task_name in descriptor.get("custom_tasks", [])
+                           if task_name not in task_names]
+            dev_envs[descriptor["name"]] = {
+                "installed": descriptor.get("installed", "False") == "True",
+                "tasks": task_names
+            }
+
+        self.deserialized = {
+            "dev_envs": dev_envs,
+            "registries": [registry["name"] for registry in config.get("registries", [])],
+            "catalogs": [catalog["name"] for catalog in config.get("catalogs", [])],
+            "hosts": [host["name"] for host in config.get("hosts", [])]
+        }
+
+        try:
+            self.flush()
+        except OSError:
+            pass
+
+    def get_dev_env_names(self, installed_only: bool = False) -> list[str]:
+        """ Get the names of the local Development Environments.
+        
+            Args:
+                installed_only -- only the installed Dev Envs
+
+            Returns with the Dev Env names.
+        """
+        return [name for name, dev_env in self.deserialized.get("dev_envs", {}).items()
+                if dev_env["installed"] or not installed_only]
+
+    def get_task_names(self, dev_env_name: str) -> list[str]:
+        """ Get the task names of the Development Environment.
+        
+            Args:
+                dev_env_name -- the name of the Dev Env
+
+            Returns with the task names, empty if the Dev Env doesn't exist.
+        """
+        return self.deserialized.get("dev_envs", {}).get(dev_env_name, {}).get("tasks", [])
+
+    def get_names(self, key: str) -> list[str]:
+        """ Get the names of the registries, catalogs or hosts.
+        
+            Args:
+                key -- "registries", "catalogs" or "hosts"
+
+            Returns with the names.
+        """
+        return self.deserialized.get(key, [])
@@ -4,7 +4,11 @@
 from dem.core.tool_images import ToolImage, ToolImages
 from dem.core.hosts import Hosts
 from dem.core.task import DockerTask, Task
+from dem.core.container_engine import RunResult
 from dem.core.exceptions import DevEnvError, ContainerEngineError
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from threading import Event
+from typing import Callable
 import json
 import os
 
@@ -38,7 +42,7 @@ class DevEnv:
             else:
                 task_descriptor["run_as_current_user"] = False
 
-            task = DockerTask(task_descriptor, hosts)
+            task = DockerTask(task_descriptor, hosts, self.name)
             self.tasks[task.name] = task
 
     @classmethod
@@ -109,7 +113,7 @@ class DevEnv:
             tasks.
         """
         for task in self.tasks.values():
-            if task.image not in task.host.container_engine.get_local_tool_images():
+            if not task.host.container_engine.is_image_local(task.image):
                 return False
         return True
 
@@ -146,20 +150,148 @@ class DevEnv:
 
     def start_engines(self) -> None:
         """ Start the container engines of the Development Environment.  
+
+            Each host is started once, all the hosts at the same time. The hosts are checked to be
+            reachable, even if their clients were created with a cached API version.
         
             Raises:
                 DevEnvError -- if the container engine couldn't be started on a host
         """
+        hosts = list({id(task.host): task.host for task in self.tasks.values()}.values())
         failed_engines: str = []
-        for task in self.tasks.values():
-            try: 
-                task.host.container_engine.start()
-            except ContainerEngineError:
-                failed_engines.append(task.host.name)
+        if hosts:
+            with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+                futures = [(host, executor.submit(host.container_engine.start, check_connection=True)) 
+                           for host in hosts]
+                for host, future in futures:
+                    try:
+                        future.result()
+                    except ContainerEngineError:
+                        failed_engines.append(host.name)
 
         if failed_engines:
             raise DevEnvError(f"Failed to start the container engine on the following hosts: {failed_engines}")
 
+    def get_task_execution_order(self, task_names: list[str]) -> list[str]:
+        """ Get the tasks to run in an order that satisfies their dependencies.
+
+            The dependencies of the tasks get included even if they were not requested.
+
+            Args:
+                task_names -- the names of the requested tasks
+
+            Returns:
+                the names of the tasks to run, each task after its dependencies
+
+            Raises:
+                DevEnvError -- if a task is unknown or the dependencies are circular
+        """
+        execution_order: list[str] = []
+        # The tasks whose dependencies are being resolved. A task found here again means a cycle.
+        visiting: list[str] = []
+
+        def visit(task_name: str) -> None:
+            if task_name in execution_order:
+                return
+            if task_name in visiting:
+                cycle = " -> ".join(visiting[visiting.index(task_name):] + [task_name])
+                raise DevEnvError(f"Circular task dependency: {cycle}")
+            task = self.tasks.get(task_name, None)
+            if task is None:
+                if visiting:
+                    raise DevEnvError(f"The {visiting[-1]} task depends on the unknown {task_name} task.")
+                raise DevEnvError(f"Unknown task: {task_name}")
+
+            visiting.append(task_name)
+            for dependency in task.depends_on:
+                visit(dependency)
+            visiting.pop()
+            execution_order.append(task_name)
+
+        for task_name in task_names:
+            visit(task_name)
+
+        return execution_order
+
+    def run_tasks(self, task_names: list[str], parallel: int = 1, warm: bool = False,
+                  output: Callable[[bytes, bool], None] | None = None, 
+                  cancel_event: Event | None = None, 
+                  name_suffix: str = "") -> dict[str, RunResult]:
+        """ Run the tasks and their dependencies.
+
+            A task gets started as soon as all of its dependencies have finished successfully, so 
+            the independent tasks run at the same time on their hosts. The log lines of the tasks
+            are prefixed with the task name. After a task fails (it can't be run or exits with a 
+            non-zero code) no new task gets started, but the already running ones are waited for.
+
+            Args:
+                task_names -- the names of the requested tasks
+                parallel -- the maximum number of the tasks running at the same time
+                warm -- run the tasks in the warm containers of the Dev Env
+                output -- receives the output (data, is_stderr) of the tasks instead of the user 
+                          output
+                cancel_event -- when set, the running tasks get stopped and no new task gets 
+                                started
+                name_suffix -- appended to the names of the task containers, so the runs of the 
+                               same tasks at the same time don't conflict
+
+            Returns:
+                the results of the finished tasks in the order they finished
+
+            Raises:
+                DevEnvError -- if a task is unknown, the dependencies are circular or a task 
+                               couldn't be run
+        """
+        execution_order = self.get_task_execution_order(task_names)
+        prefix_width = max(len(task_name) for task_name in execution_order)
+
+        pending: list[str] = list(execution_order)
+        results: dict[str, RunResult] = {}
+        succeeded: set[str] = set()
+        failed_tasks: dict[str, str] = {}
+        running: dict[Future, str] = {}
+        max_running = max(1, parallel)
+        executor = ThreadPoolExecutor(max_workers=max_running)
+        try:
+            while pending or running:
+                if (len(succeeded) == len(results) and not failed_tasks and 
+                    not (cancel_event and cancel_event.is_set())):
+                    # Only the tasks that can start right away get submitted, so the ones waiting
+                    # for a free slot are not started after a failure or a cancellation.
+                    ready = [task_name for task_name in pending
+                             if set(self.tasks[task_name].depends_on) <= succeeded]
+                    for task_name in ready[:max_running - len(running)]:
+                        pending.remove(task_name)
+                        log_prefix = f"{task_name:<{prefix_width}} | "
+                        future = executor.submit(self.tasks[task_name].run, log_prefix, warm, 
+                                                 output, cancel_event, name_suffix)
+                        running[future] = task_name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_name = running.pop(future)
+                    try:
+                        results[task_name] = future.result()
+                    except Exception as e:
+                        failed_tasks[task_name] = str(e)
+                    else:
+                        if results[task_name].exit_code == 0:
+                            succeeded.add(task_name)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if failed_tasks:
+            errors = "\n".join(f"{task_name}: {error}" for task_name, error in failed_tasks.items())
+            message = f"The following tasks failed:\n{errors}"
+            if pending:
+                message += f"\nThe following tasks were not started: {', '.join(pending)}"
+            raise DevEnvError(message)
+
+        return results
+
 def convert_to_tool_descriptor(tool_images: list[str]) -> list[dict]:
     """ Convert the tool images to tool descriptors.
     
@@ -3,11 +3,18 @@
 
 from dem.core.dev_env import DevEnv
 from dem.core.core import Core
+from dem.core.data_management import CatalogCacheJSON
 from dem.core.exceptions import CatalogError
+from concurrent.futures import Future
+from queue import Empty, SimpleQueue
+from threading import Thread
+from typing import Generator
 import requests
+import json
 
 class DevEnvCatalog(Core):
-    """ Development Environment Catalog. """
+    """ Development Environment Catalog."""
+
     def __init__(self, catalog_config: dict) -> None:
         """ Init the class. 
 
@@ -20,31 +27,118 @@ class DevEnvCatalog(Core):
         self.url: str = catalog_config["url"]
         self.name: str = catalog_config["name"]
         self.dev_envs: list[DevEnv] = []
+        self._is_requested = False
+
+    @property
+    def catalog_cache_json(self) -> CatalogCacheJSON:
+        """ The catalog cache shared by all the catalogs. It gets loaded only at the first access."""
+        return CatalogCacheJSON.get_shared()
+
+    def _get_cache(self) -> dict:
+        """ Get the cache of the catalog. The cache gets cleared if it belongs to a different url.
+
+            Returns with the cache of the catalog.
+        """
+        cache = self.catalog_cache_json.get_entry(self.name)
+        if cache.get("url") != self.url:
+            cache.clear()
+            cache["url"] = self.url
+        return cache
+
+    def _request_catalog_body(self, cache: dict) -> tuple[str, dict | None]:
+        """ Request the content of the catalog.
+
+            The request is conditional if the catalog is already cached, so an unchanged catalog
+            doesn't get downloaded again. If the catalog can't be reached, the cached content is 
+            used.
+
+            Args:
+                cache -- the cache of the catalog
+
+            Returns with the content of the catalog and with the validators (ETag and 
+            Last-Modified) of the new content. The validators are None if the cached content is 
+            used.
+
+            Raises:
+                CatalogError -- if the communication with the catalog fails and it's not cached
+        """
+        headers = {}
+        if "etag" in cache:
+            headers["If-None-Match"] = cache["etag"]
+        if "last_modified" in cache:
+            headers["If-Modified-Since"] = cache["last_modified"]
+
+        try:
+            response: requests.Response = self.http_client.get(self.url, headers=headers,
+                                                               timeout=self.config_file.http_request_timeout_s)
+        except Exception as e:
+            error_msg = f"Error in communication with the [bold]{self.name}[/bold] Development Environment Catalog.\n{str(e)}"
+        else:
+            if response.status_code == requests.codes.not_modified and "body" in cache:
+                return cache["body"], None
+
+            if response.status_code == requests.codes.ok:
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                return response.text, validators
+
+            error_msg = (f"Error in communication with the [bold]{self.name}[/bold] Development Environment Catalog. " + 
+                         "Failed to retrieve Development Environments." + 
+                         "\nResponse status code: " + str(response.status_code) + 
+                         "\nDoes the URL point to a valid Development Environment Catalog?\n")
+
+        if "body" not in cache:
+            raise CatalogError(error_msg)
+
+        self.user_output.msg(f"[yellow]{error_msg}\nUsing the cached content of the {self.name} catalog, which might be outdated.[/]")
+        return cache["body"], None
 
     def request_dev_envs(self) -> None:
         """ Request the Development Environments from the catalog. 
+
+            The catalog is requested only once per run, the next calls don't have any effect.
         
             Raises:
                 CatalogError -- if the communication with the catalog fails
         """
-        try:
-            deser_json_response: requests.Response = requests.get(self.url, 
-                                                                timeout=self.config_file.http_request_timeout_s)
-        except Exception as e:
-            raise CatalogError(f"Error in communication with the [bold]{self.name}[/bold] Development Environment Catalog.\n{str(e)}")
+        if self._is_requested:
+            return
+
+        with self.catalog_cache_json.lock:
+            cache = dict(self._get_cache())
 
-        if deser_json_response.status_code != requests.codes.ok:
-            raise CatalogError(f"Error in communication with the [bold]{self.name}[/bold] Development Environment Catalog. " + 
-                               "Failed to retrieve Development Environments." + 
-                               "\nResponse status code: " + str(deser_json_response.status_code) + 
-                               "\nDoes the URL point to a valid Development Environment Catalog?\n")
+        body, validators = self._request_catalog_body(cache)
 
         try:
-            for dev_env_descriptor in deser_json_response.json()["development_environments"]:
-                self.dev_envs.append(DevEnv(dev_env_descriptor))
+            self.dev_envs = [DevEnv(dev_env_descriptor) 
+                             for dev_env_descriptor in json.loads(body)["development_environments"]]
         except Exception as e:
             raise CatalogError(f"The {self.name} Development Environment Catalog is corrupted.\n{str(e)}")
 
+        self._is_requested = True
+
+        if validators is not None:
+            self._update_cache(body, validators)
+
+    def _update_cache(self, body: str, validators: dict) -> None:
+        """ Store the new content of the catalog in the catalog cache.
+
+            Args:
+                body -- the content of the catalog
+                validators -- the ETag and Last-Modified of the content
+        """
+        with self.catalog_cache_json.lock:
+            cache = self._get_cache()
+            cache["body"] = body
+            for validator, value in validators.items():
+                if value:
+                    cache[validator] = value
+                else:
+                    cache.pop(validator, None)
+            self.catalog_cache_json.flush()
+
     def get_dev_env_by_name(self, dev_env_name: str) -> DevEnv | None:
         """ Get the Development Environment by name.
         
@@ -66,6 +160,66 @@ class DevEnvCatalogs(Core):
         for catalog_config in self.config_file.catalogs:
             self.catalogs.append(DevEnvCatalog(catalog_config))
 
+    def request_all(self, selected_cats: list[str] = []) -> Generator[tuple[DevEnvCatalog, CatalogError | None], None, None]:
+        """ Request the Development Environments from the catalogs concurrently.
+
+            At most max_concurrency catalogs are requested at a time. The catalogs are yielded in
+            their configured order, each as soon as it and the catalogs before it have answered, 
+            so the caller can stop early without waiting for the rest. A failing catalog doesn't 
+            affect the others.
+
+            The requests run on daemon threads. If the caller stops early, the catalogs not 
+            requested yet get skipped, and the requests in progress aren't waited for: they 
+            finish in the background or get abandoned when the process exits. The catalog cache file 
+            gets replaced atomically, so an abandoned request leaves the cache as it was, and the
+            catalog gets downloaded again the next time.
+
+            Args:
+                selected_cats -- the selected catalog names, empty list means all catalogs
+
+            Yields the catalogs with the error of their request (None if the request succeeded).
+        """
+        catalogs = [catalog for catalog in self.catalogs 
+                    if not selected_cats or catalog.name in selected_cats]
+        if not catalogs:
+            return
+
+        futures = [(catalog, Future()) for catalog in catalogs]
+        pending = SimpleQueue()
+        for catalog, future in futures:
+            pending.put((catalog, future))
+
+        def request_pending() -> None:
+            while True:
+                try:
+                    catalog, future = pending.get_nowait()
+                except Empty:
+                    return
+                # The cancelled futures belong to the catalogs the caller doesn't need anymore.
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    catalog.request_dev_envs()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(None)
+
+        for _ in range(max(1, min(len(catalogs), self.config_file.max_concurrency))):
+            Thread(target=request_pending, daemon=True).start()
+
+        try:
+            for catalog, future in futures:
+                try:
+                    future.result()
+                except CatalogError as e:
+                    yield catalog, e
+                else:
+                    yield catalog, None
+        finally:
+            for _, future in futures:
+                future.cancel()
+
     def add_catalog(self, name: str, url:str) -> None:
         """ Add a new catalog.
         
@@ -109,4 +263,8 @@ class DevEnvCatalogs(Core):
             raise CatalogError(f"The {name} Development Environment Catalog doesn't exist.")
 
         self.config_file.catalogs.remove(catalog.config)
-        self.config_file.flush()
\ No newline at end of file
+        self.config_file.flush()
+
+        with catalog.catalog_cache_json.lock:
+            catalog.catalog_cache_json.delete_entry(name)
+            catalog.catalog_cache_json.flush()
\ No newline at end of file
@@ -9,6 +9,14 @@ class DataStorageError(Exception):
     def __init__(self, message: str = "") -> None:
         super().__init__(self.base_message + message)
 
+class DataStorageConflictError(Exception):
+    """Raised when a file was modified by another process since it was read."""
+
+    base_message = "Conflicting file change: "
+
+    def __init__(self, message: str) -> None:
+        super().__init__(self.base_message + message)
+
 class RegistryError(Exception):
     """Raised when the communication with registry fails."""
 
@@ -63,4 +71,16 @@ class DevEnvError(Exception):
     base_message = "Development Environment error: "
 
     def __init__(self, message: str) -> None:
-        super().__init__(self.base_message + message)
\ No newline at end of file
+        super().__init__(self.base_message + message)
+
+class JobError(Exception):
+    """ Raised when there is a problem with a job. """
+
+    base_message = "Job error: "
+
+    def __init__(self, message: str) -> None:
+        super().__init__(self.base_message + message)
+
+class JobQueueFullError(JobError):
+    """ Raised when a job can't be queued because the queue is full. """
+    pass
@@ -28,8 +28,8 @@ class Hosts(Core):
             "name": "local",
             "address": "unix://var/run/docker.sock"
         }
+        # The container engine gets connected at the first use.
         self.local = Host(local_host_config)
-        self.local.container_engine.start()
 
         for host_config in self.config_file.hosts:
             host = Host(host_config)
@@ -0,0 +1,102 @@
+"""Pooled HTTP client for the registry and catalog communication."""
+# dem/core/http_client.py
+
+from threading import Lock
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class HTTPClient():
+    """ HTTP client with one keep-alive session (connection pool) per host.
+
+        The consecutive requests to the same registry or catalog reuse the already open connections,
+        so only the first request pays the TCP and TLS handshake. The client can be used from
+        multiple threads at the same time.
+
+        Class attributes:
+            _retry_status_codes -- the responses with these status codes are retried
+    """
+    _retry_status_codes = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_size: int = 10, max_retries: int = 0,
+                 retry_backoff_factor: float = 0.0) -> None:
+        """ Init the class.
+
+            Args:
+                pool_size -- the maximum number of connections kept open per host
+                max_retries -- the number of retries for the failed requests
+                retry_backoff_factor -- the backoff factor between the retries in seconds
+        """
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = Lock()
+        self.configure(pool_size, max_retries, retry_backoff_factor)
+
+    def configure(self, pool_size: int, max_retries: int, retry_backoff_factor: float) -> None:
+        """ Set the connection pool and the retry parameters.
+
+            The already open sessions get closed, so the new parameters are used for all the
+            following requests.
+
+            Args:
+                pool_size -- the maximum number of connections kept open per host
+                max_retries -- the number of retries for the failed requests
+                retry_backoff_factor -- the backoff factor between the retries in seconds
+        """
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """ Create a new session with the configured connection pool and retry strategy.
+
+            Returns with the new session.
+        """
+        retry = Retry(total=self.max_retries, read=0, backoff_factor=self.retry_backoff_factor,
+                      status_forcelist=self._retry_status_codes, allowed_methods=("GET", "HEAD"),
+                      raise_on_status=False)
+        # Block when the pool is exhausted instead of opening and discarding extra connections.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry,
+                              pool_block=True)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_session(self, url: str) -> requests.Session:
+        """ Get the session of the host the url points to. Create it if it doesn't exist yet.
+
+            Args:
+                url -- the url to request
+
+            Returns with the session of the host.
+        """
+        split_url = urlsplit(url)
+        host = f"{split_url.scheme}://{split_url.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """ Send a GET request.
+
+            Args:
+                url -- the url to request
+                kwargs -- additional arguments - see the requests documentation for more details
+
+            Returns with the response.
+        """
+        return self._get_session(url).get(url, **kwargs)
+
+    def close(self) -> None:
+        """ Close all the open sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
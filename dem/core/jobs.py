@@ -0,0 +1,352 @@
+"""Asynchronous execution of the tasks for the API."""
+# dem/core/jobs.py
+
+from dem.core.container_engine import RunResult
+from dem.core.dev_env import DevEnv
+from dem.core.exceptions import DevEnvError, JobError, JobQueueFullError
+from dem.core.platform_state import PlatformState
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Condition, Event, Lock
+from typing import Callable
+import time
+import uuid
+
+class Job():
+    """ A request to run tasks of a Development Environment.
+
+        The output of the tasks is kept in the job, so it can be read while the tasks are running
+        and after they have finished. The readers read from the stored output at their own pace, 
+        so a slow reader never blocks the tasks. Only the last max_output_size bytes are kept, the
+        readers falling behind that get notified about the dropped chunks.
+
+        Class attributes:
+            QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED -- the states of the job
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, dev_env: DevEnv, task_names: list[str], parallel: int = 1,
+                 warm: bool = False, max_output_size: int = 16 * 1024 * 1024) -> None:
+        """ Init the class.
+
+            Args:
+                dev_env -- the Development Environment to run the tasks in
+                task_names -- the names of the tasks to run
+                parallel -- the maximum number of the tasks running at the same time
+                warm -- run the tasks in the warm containers of the Development Environment
+                max_output_size -- the maximum size of the stored output in bytes
+        """
+        self.id: str = uuid.uuid4().hex
+        self.dev_env = dev_env
+        self.task_names = task_names
+        self.parallel = parallel
+        self.warm = warm
+        self.status: str = Job.QUEUED
+        self.exit_code: int | None = None
+        self.results: dict[str, RunResult] = {}
+        self.error: str = ""
+        self.created_at: float = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.cancel_event = Event()
+        self.future: Future | None = None
+        self._output: list[tuple[bytes, bool]] = []
+        # The index of the first stored chunk counted from the beginning of the output.
+        self._output_start = 0
+        self._output_size = 0
+        self._max_output_size = max_output_size
+        self._condition = Condition()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def is_finished(self) -> bool:
+        """ True if the job won't change anymore."""
+        return self.status in (Job.SUCCEEDED, Job.FAILED, Job.CANCELLED)
+
+    def _notify(self) -> None:
+        """ Wake up the readers. The condition must be held."""
+        self._condition.notify_all()
+        for listener in self._listeners:
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """ Register a function to be called when the output or the status changes.
+
+            The listener gets called from the thread of the job, so it must be fast and 
+            thread-safe (e.g. waking up an asyncio event with call_soon_threadsafe).
+
+            Args:
+                listener -- the function to call
+        """
+        with self._condition:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """ Unregister a listener.
+
+            Args:
+                listener -- the function registered with add_listener()
+        """
+        with self._condition:
+            self._listeners.remove(listener)
+
+    def start(self) -> None:
+        """ Mark the job as running."""
+        with self._condition:
+            self.status = Job.RUNNING
+            self.started_at = time.time()
+            self._notify()
+
+    def finish(self, status: str, exit_code: int | None = None, error: str = "") -> None:
+        """ Mark the job as finished.
+
+            Args:
+                status -- the final status
+                exit_code -- the exit code of the tasks
+                error -- the reason of the failure
+        """
+        with self._condition:
+            self.status = status
+            self.exit_code = exit_code
+            self.error = error
+            self.finished_at = time.time()
+            self._notify()
+
+    def write_output(self, data: bytes, is_stderr: bool) -> None:
+        """ Store the output of the tasks.
+
+            Args:
+                data -- the output
+                is_stderr -- the data belongs to the stderr
+        """
+        with self._condition:
+            self._output.append((data, is_stderr))
+            self._output_size += len(data)
+
+            if self._output_size > self._max_output_size:
+                # Drop the oldest chunks, but keep the last one even if it's too big.
+                drop = 0
+                while self._output_size > self._max_output_size and drop < len(self._output) - 1:
+                    self._output_size -= len(self._output[drop][0])
+                    drop += 1
+                del self._output[:drop]
+                self._output_start += drop
+
+            self._notify()
+
+    def read_output(self, index: int) -> tuple[list[tuple[bytes, bool]], int, int]:
+        """ Read the output stored since the index without waiting.
+
+            Args:
+                index -- the index of the first chunk to read, counted from the beginning
+
+            Returns:
+                the (data, is_stderr) chunks, the index of the next chunk and the number of the 
+                chunks dropped since the index
+        """
+        with self._condition:
+            dropped = max(0, self._output_start - index)
+            index += dropped
+            chunks = self._output[index - self._output_start:]
+            return chunks, index + len(chunks), dropped
+
+    def to_dict(self) -> dict:
+        """ Return the state of the job as a dict."""
+        return {
+            "id": self.id,
+            "dev_env_name": self.dev_env.name,
+            "task_names": self.task_names,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "results": {task_name: result.to_dict() for task_name, result in self.results.items()}
+        }
+
+class JobManager():
+    """ Run the jobs on a bounded number of threads.
+
+        The jobs that can't be started right away wait in a bounded queue. The finished jobs are
+        kept for querying until max_finished_jobs is reached, then the oldest ones get dropped. 
+        Each job stores at most max_job_output_size bytes of output, so the memory held by the 
+        finished jobs is bounded by their product.
+    """
+
+    def __init__(self, max_running_jobs: int, max_queued_jobs: int,
+                 platform_state: PlatformState | None = None, max_finished_jobs: int = 100,
+                 max_job_output_size: int = 16 * 1024 * 1024) -> None:
+        """ Init the class.
+
+            Args:
+                max_running_jobs -- the maximum number of the jobs running at the same time
+                max_queued_jobs -- the maximum number of the jobs waiting to be started
+                platform_state -- the state shared with the other requests, a new one if not set
+                max_finished_jobs -- the number of the finished jobs kept
+                max_job_output_size -- the maximum size of the stored output of a job in bytes
+        """
+        self.max_queued_jobs = max_queued_jobs
+        self.max_finished_jobs = max_finished_jobs
+        self.max_job_output_size = max_job_output_size
+        self.platform_state = platform_state if platform_state is not None else PlatformState()
+        self._jobs: dict[str, Job] = {}
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_running_jobs,
+                                            thread_name_prefix="dem-job")
+
+    def submit(self, dev_env: DevEnv, task_names: list[str], parallel: int = 1,
+               warm: bool = False) -> Job:
+        """ Queue a job.
+
+            Args:
+                dev_env -- the Development Environment to run the tasks in
+                task_names -- the names of the tasks to run
+                parallel -- the maximum number of the tasks running at the same time
+                warm -- run the tasks in the warm containers of the Development Environment
+
+            Returns:
+                the queued job
+
+            Raises:
+                JobError -- if the tasks can't be run in the Development Environment
+                JobQueueFullError -- if the queue is full
+        """
+        if not dev_env.is_installed:
+            raise JobError(f"The {dev_env.name} Development Environment is not installed.")
+        try:
+            dev_env.get_task_execution_order(task_names)
+        except DevEnvError as e:
+            raise JobError(str(e))
+
+        with self._lock:
+            queued_jobs = sum(1 for job in self._jobs.values() if job.status == Job.QUEUED)
+            if queued_jobs >= self.max_queued_jobs:
+                raise JobQueueFullError(f"The queue is full ({queued_jobs} jobs are waiting).")
+
+            job = Job(dev_env, task_names, parallel, warm, self.max_job_output_size)
+            self._jobs[job.id] = job
+            self._drop_old_jobs()
+            job.future = self._executor.submit(self._run, job)
+
+        return job
+
+    def _drop_old_jobs(self) -> None:
+        """ Drop the oldest finished jobs above the limit. The lock must be held."""
+        finished_jobs = [job for job in self._jobs.values() if job.is_finished]
+        for job in finished_jobs[:max(0, len(finished_jobs) - self.max_finished_jobs)]:
+            del self._jobs[job.id]
+
+    def _run(self, job: Job) -> None:
+        """ Run the tasks of the job.
+
+            Args:
+                job -- the job to run
+        """
+        if job.cancel_event.is_set():
+            job.finish(Job.CANCELLED)
+            return
+        job.start()
+
+        try:
+            self.platform_state.start_engines(job.dev_env)
+            if not self.platform_state.is_installation_correct(job.dev_env):
+                raise JobError(f"The {job.dev_env.name} Development Environment is not installed correctly.")
+            # The same tasks might be run by other jobs at the same time.
+            job.results = job.dev_env.run_tasks(job.task_names, job.parallel, job.warm,
+                                                job.write_output, job.cancel_event, job.id)
+        except Exception as e:
+            status = Job.CANCELLED if job.cancel_event.is_set() else Job.FAILED
+            job.finish(status, error=str(e))
+            return
+
+        exit_code = next((result.exit_code for result in job.results.values()
+                          if result.exit_code != 0), 0)
+        if job.cancel_event.is_set():
+            job.finish(Job.CANCELLED, exit_code)
+        elif exit_code == 0:
+            job.finish(Job.SUCCEEDED, exit_code)
+        else:
+            job.finish(Job.FAILED, exit_code)
+
+    def get(self, job_id: str) -> Job | None:
+        """ Get a job.
+
+            Args:
+                job_id -- the id of the job
+
+            Returns:
+                the job, None if it doesn't exist
+        """
+        with self._lock:
+            return self._jobs.get(job_id, None)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """ Cancel a job.
+
+            A queued job doesn't get started, the containers of a running job get killed. The 
+            commands running in the warm containers can't be stopped, so a warm job can only be 
+            cancelled while it's queued.
+
+            Args:
+                job_id -- the id of the job
+
+            Returns:
+                the job, None if it doesn't exist
+
+            Raises:
+                JobError -- if the job runs in the warm containers and has already been started
+        """
+        job = self.get(job_id)
+        if job is None or job.is_finished:
+            return job
+
+        if job.warm:
+            if job.future is None or not job.future.cancel():
+                raise JobError(f"The job {job_id} runs in the warm containers, it can't be "
+                               "cancelled after it has been started.")
+            job.cancel_event.set()
+            job.finish(Job.CANCELLED)
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            job.finish(Job.CANCELLED)
+        return job
+
+    def delete(self, job_id: str) -> Job | None:
+        """ Delete a finished job.
+
+            Args:
+                job_id -- the id of the job
+
+            Returns:
+                the deleted job, None if it doesn't exist
+
+            Raises:
+                JobError -- if the job hasn't finished yet
+        """
+        with self._lock:
+            job = self._jobs.get(job_id, None)
+            if job is None:
+                return None
+            if not job.is_finished:
+                raise JobError(f"The job {job_id} hasn't finished yet.")
+            del self._jobs[job_id]
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ Stop accepting the jobs and cancel the queued ones.
+
+            Args:
+                wait -- wait for the running jobs to finish
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == Job.QUEUED and job.future is not None and job.future.cancel():
+                    job.cancel_event.set()
+                    job.finish(Job.CANCELLED)
+        self._executor.shutdown(wait=wait)
@@ -2,18 +2,25 @@
 """
 
 import os, truststore
-from typing import Any, Generator
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Lock
+from typing import Any, Generator, TYPE_CHECKING
 from dem.core.core import Core
 from dem.core.properties import __supported_dev_env_major_version__
 from dem.core.exceptions import DataStorageError, PlatformError, ContainerEngineError, DevEnvError
 from dem.core.dev_env_catalog import DevEnvCatalogs
-from dem.core.data_management import LocalDevEnvJSON
+from dem.core.data_management import BaseJSON, LocalDevEnvJSON
 from dem.core.registry import Registries
 from dem.core.tool_images import ToolImages, ToolImage
 from dem.core.dev_env import DevEnv
-from dem.core.hosts import Hosts
-from dem.core.api_server import APIServer
-from fastapi import FastAPI
+from dem.core.hosts import Hosts, Host
+from dem.core.jobs import JobManager
+from dem.core.platform_state import PlatformState
+
+if TYPE_CHECKING:
+    from dem.core.api_server import APIServer
+    from fastapi import FastAPI
 
 class Platform(Core):
     """ Representation of the Development Platform:
@@ -27,9 +34,8 @@ class Platform(Core):
         platform variable.
 
         Attributes:
-            fastapi_app -- the FastAPI application
+            api_server -- the API server, set by the serve command
     """
-    fastapi_app = FastAPI()
 
     def _dev_env_json_version_check(self, dev_env_json_major_version: int) -> None:
         """ Check that the json file is supported.
@@ -53,6 +59,10 @@ class Platform(Core):
         self._tool_images = None
         self._container_engine = None
         self._registries = None
+        self._job_manager: JobManager | None = None
+        self._state: PlatformState | None = None
+        # The API server accesses the lazy properties below from many threads.
+        self._api_lock = Lock()
 
         # Load the configuration file
         self.config_file.update()
@@ -61,7 +71,8 @@ class Platform(Core):
         self.default_dev_env_name: str = ""
         self.local_dev_envs: list[DevEnv] = []
         self.are_tool_images_assigned: bool = False
-        self.api_server = APIServer(self.fastapi_app)
+        # Created by the serve command, so the CLI doesn't load the server's dependencies.
+        self.api_server: "APIServer | None" = None
 
         # Set this to true in the platform instance to get the tool image info from the registries
         self.get_tool_image_info_from_registries = False
@@ -71,6 +82,11 @@ class Platform(Core):
         if self.config_file.use_native_system_cert_store:
             truststore.inject_into_ssl()
 
+        self.http_client.configure(self.config_file.http_pool_size, 
+                                   self.config_file.http_max_retries,
+                                   self.config_file.http_retry_backoff_factor)
+        BaseJSON.backup_count = self.config_file.json_backup_count
+
     def load_dev_envs(self) -> None:
         """ Load the Development Environments from the dev_env.json file.
         
@@ -132,6 +148,47 @@ class Platform(Core):
 
         return self._dev_env_catalogs
 
+    @property
+    def fastapi_app(self) -> "FastAPI":
+        """ The FastAPI application of the DEM API, connected to this platform.
+
+            The API module (and FastAPI) gets imported only at the first access.
+        """
+        import dem.api.main
+        dem.api.main.platform = self
+        return dem.api.main.app
+
+    @property
+    def job_manager(self) -> JobManager:
+        """ The manager of the jobs submitted through the API.
+
+            The JobManager() gets instantiated only at the first access.
+        """
+        with self._api_lock:
+            if self._job_manager is None:
+                self._job_manager = JobManager(self.config_file.api_max_running_jobs, 
+                                               self.config_file.api_max_queued_jobs,
+                                               self._get_state(),
+                                               self.config_file.api_max_finished_jobs,
+                                               self.config_file.api_max_job_output_kib * 1024)
+
+            return self._job_manager
+
+    def _get_state(self) -> PlatformState:
+        """ Get the state, create it if needed. The _api_lock must be held."""
+        if self._state is None:
+            self._state = PlatformState()
+        return self._state
+
+    @property
+    def state(self) -> PlatformState:
+        """ The state of the Development Environments shared by the requests of the API server.
+
+            The PlatformState() gets instantiated only at the first access.
+        """
+        with self._api_lock:
+            return self._get_state()
+
     def get_deserialized(self) -> dict:
             """ Create the deserialized json. 
             
@@ -160,31 +217,129 @@ class Platform(Core):
             if dev_env.name == dev_env_name:
                 return dev_env
 
-    def install_dev_env(self, dev_env_to_install: DevEnv) -> None:
-        """ Install the Dev Env by pulling the required images.
-        
+    def _is_pull_needed(self, host: Host, image: str) -> bool:
+        """ Check whether the image needs to be pulled to the host.
+
             Args:
-                dev_env_to_install -- the Development Environment to install
+                host -- the host
+                image -- the image
+
+            Return with True if the image is not available on the host, or if the check_image_digests
+            option is enabled and the registry has a newer image.
+        """
+        if not host.container_engine.is_image_local(image):
+            return True
+
+        return self.config_file.check_image_digests and \
+            not host.container_engine.is_image_up_to_date(image)
+
+    def _get_pull_plan(self, dev_env: DevEnv, force_pull: bool = False) -> list[tuple[Host, str]]:
+        """ Collect the images to pull for the Development Environment.
+
+            An image required by several tasks on the same host is pulled only once. The images 
+            already available on the host are skipped, unless force_pull is set.
+
+            Args:
+                dev_env -- the Development Environment
+                force_pull -- pull the images even if they are available
+
+            Return with the (host, image) pairs in the order of the tasks.
 
             Raises:
-                PlatformError -- if the install fails
+                PlatformError -- if a Tool Image is not assigned or a host is not available
         """
-        for task in dev_env_to_install.tasks.values():
+        pull_plan: dict[tuple[str, str], tuple[Host, str]] = {}
+        for task in dev_env.tasks.values():
             tool_image_name: str = task.image
-            try:
-                tool_image = dev_env_to_install.assigned_tool_images[tool_image_name]
-            except KeyError:
+            if tool_image_name not in dev_env.assigned_tool_images:
                 raise PlatformError(f"The {tool_image_name} Tool Image is not assigned to the Development Environment.")
 
             host = self.hosts.get_host_by_name(task.host_name)
             if host is None:
                 raise PlatformError(f"The {task.host_name} host is not available.")
 
-            self.user_output.msg(f"\nPulling image {tool_image.name} to host {task.host_name}", is_title=True)
-            try:                
-                host.container_engine.pull(tool_image_name)
+            pull_plan.setdefault((host.name, tool_image_name), (host, tool_image_name))
+
+        if force_pull:
+            return list(pull_plan.values())
+
+        images_to_pull = []
+        for host, image in pull_plan.values():
+            if self._is_pull_needed(host, image):
+                images_to_pull.append((host, image))
+            else:
+                self.user_output.msg(f"The {image} image is already available on host {host.name}.")
+        return images_to_pull
+
+    def _pull_images(self, pull_plan: list[tuple[Host, str]], 
+                     errors: list[ContainerEngineError]) -> Generator[dict, None, None]:
+        """ Pull the images concurrently. At most max_parallel_pulls images are pulled at a time.
+
+            The progress items of the pulls are merged into one stream. Each item gets the 
+            "image" key with the name of the image it belongs to.
+
+            Args:
+                pull_plan -- the (host, image) pairs to pull
+                errors -- the errors of the failed pulls get appended to this list
+
+            Yields the progress items of the pulls.
+        """
+        items: Queue[dict | None] = Queue()
+
+        def pull(host: Host, image: str) -> None:
+            try:
+                for item in host.container_engine.pull_stream(image):
+                    item["image"] = image
+                    items.put(item)
             except ContainerEngineError as e:
-                raise PlatformError(f"Dev Env install failed. --> {str(e)}")
+                errors.append(e)
+            except Exception as e:
+                # E.g. the connection got lost. Nobody reads the future, so it must be recorded.
+                errors.append(ContainerEngineError(f"Failed to pull {image}: {e}"))
+            finally:
+                # Signal that this pull has finished.
+                items.put(None)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(pull_plan), 
+                                                             self.config_file.max_parallel_pulls)))
+        try:
+            for host, image in pull_plan:
+                executor.submit(pull, host, image)
+
+            running_pulls = len(pull_plan)
+            while running_pulls:
+                item = items.get()
+                if item is None:
+                    running_pulls -= 1
+                else:
+                    yield item
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def install_dev_env(self, dev_env_to_install: DevEnv, force_pull: bool = False) -> None:
+        """ Install the Dev Env by pulling the required images.
+
+            Only the missing (or outdated) images are pulled, concurrently, at most 
+            max_parallel_pulls at a time.
+        
+            Args:
+                dev_env_to_install -- the Development Environment to install
+                force_pull -- pull the images even if they are already available
+
+            Raises:
+                PlatformError -- if the install fails
+        """
+        pull_plan = self._get_pull_plan(dev_env_to_install, force_pull)
+
+        if pull_plan:
+            self.user_output.msg("\nPulling the Tool Images", is_title=True)
+            for host, image in pull_plan:
+                self.user_output.msg(f"Pulling image {image} to host {host.name}")
+
+        errors: list[ContainerEngineError] = []
+        self.user_output.progress_generator(self._pull_images(pull_plan, errors))
+        if errors:
+            raise PlatformError("Dev Env install failed. --> " + "\n".join(str(e) for e in errors))
 
         if dev_env_to_install.enable_docker_network:
             self.hosts.local.container_engine.create_network(dev_env_to_install.name)
@@ -0,0 +1,159 @@
+"""Warm state of the platform kept by the long-running processes (e.g. the API server)."""
+# dem/core/platform_state.py
+
+from dem.core.container_engine import ContainerEngine
+from dem.core.dev_env import DevEnv
+from threading import Lock
+from typing import Callable
+
+class PlatformState():
+    """ The state of the Development Environments shared by the requests of the API server.
+
+        The container engines of a Dev Env get started only for its first request. The result of
+        the installation check is cached per Dev Env, so the following requests don't check the
+        images again. The events of the started container engines are watched (their image 
+        indexes are kept up-to-date from the events), and the checked Dev Envs get checked again
+        when an image changes. The listeners get notified when a Dev Env becomes broken (an image
+        of it has been removed) or gets fixed.
+
+        All the methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._lock = Lock()
+        # Serializes the handling of the events coming from the watcher threads of the engines.
+        self._event_lock = Lock()
+        self._started_dev_envs: set[str] = set()
+        self._installation_status: dict[str, bool] = {}
+        # Increased at each invalidation, so a check started before it doesn't get cached.
+        self._generation = 0
+        self._watched_engines: dict[int, ContainerEngine] = {}
+        self._dev_envs: dict[str, DevEnv] = {}
+        self._listeners: list[Callable[[str, bool], None]] = []
+
+    def start_engines(self, dev_env: DevEnv) -> None:
+        """ Start the container engines of the Development Environment if they are not started yet.
+
+            Args:
+                dev_env -- the Development Environment
+
+            Raises:
+                DevEnvError -- if the container engine couldn't be started on a host
+        """
+        with self._lock:
+            if dev_env.name in self._started_dev_envs:
+                return
+
+        dev_env.start_engines()
+
+        with self._lock:
+            self._started_dev_envs.add(dev_env.name)
+            new_engines = {id(task.host.container_engine): task.host.container_engine
+                           for task in dev_env.tasks.values()
+                           if id(task.host.container_engine) not in self._watched_engines}
+            self._watched_engines.update(new_engines)
+
+        for container_engine in new_engines.values():
+            container_engine.add_event_listener(self._on_event)
+
+    def add_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """ Register a function to be called when the installation status of a checked 
+            Development Environment changes.
+
+            The listener gets called from the event watcher thread of a container engine, so it 
+            must be fast and thread-safe.
+
+            Args:
+                listener -- the function to call with the Dev Env name and the new status
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """ Unregister a listener.
+
+            Args:
+                listener -- the function registered with add_listener()
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def is_installation_correct(self, dev_env: DevEnv) -> bool:
+        """ Check if the installation of the Development Environment is correct.
+
+            The result is cached until an image changes on one of the watched hosts.
+
+            Args:
+                dev_env -- the Development Environment
+
+            Returns:
+                True if the images of the tasks are available on their hosts
+        """
+        with self._lock:
+            self._dev_envs[dev_env.name] = dev_env
+            is_correct = self._installation_status.get(dev_env.name, None)
+            generation = self._generation
+        if is_correct is not None:
+            return is_correct
+
+        is_correct = dev_env.is_installation_correct()
+
+        with self._lock:
+            if generation == self._generation:
+                self._installation_status[dev_env.name] = is_correct
+        return is_correct
+
+    def invalidate(self, dev_env_name: str = "") -> None:
+        """ Drop the cached installation status.
+
+            Args:
+                dev_env_name -- drop only the status of this Development Environment, all if empty
+        """
+        with self._lock:
+            self._generation += 1
+            if dev_env_name:
+                self._installation_status.pop(dev_env_name, None)
+            else:
+                self._installation_status.clear()
+
+    def _on_event(self, event: dict) -> None:
+        """ Check the Development Environments again when an image changes.
+
+            Args:
+                event -- the Docker event, empty if the events might have been missed
+        """
+        if event and event.get("Type") != "image":
+            return
+
+        with self._event_lock:
+            self._check_again()
+
+    def _check_again(self) -> None:
+        """ Check the cached Development Environments again and notify the listeners about the
+            changed ones. The _event_lock must be held.
+        """
+        with self._lock:
+            previous_status = dict(self._installation_status)
+            dev_envs = list(self._dev_envs.values())
+            listeners = list(self._listeners)
+        self.invalidate()
+
+        for dev_env in dev_envs:
+            try:
+                is_correct = self.is_installation_correct(dev_env)
+            except Exception:
+                # The host is not available, it gets checked at the next request.
+                continue
+            if previous_status.get(dev_env.name, is_correct) != is_correct:
+                for listener in listeners:
+                    listener(dev_env.name, is_correct)
+
+    def close(self) -> None:
+        """ Stop watching the events of the container engines."""
+        with self._lock:
+            watched_engines = list(self._watched_engines.values())
+            self._watched_engines.clear()
+            self._started_dev_envs.clear()
+        for container_engine in watched_engines:
+            container_engine.remove_event_listener(self._on_event)
@@ -3,8 +3,12 @@
 
 from dem.core.core import Core
 from dem.core.exceptions import RegistryError
+from dem.core.data_management import RegistryCacheJSON
 
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 from typing import Generator
 from abc import ABC, abstractmethod
 
@@ -22,7 +26,10 @@ class Registry(Core, ABC):
         except KeyError:
             raise RegistryError("Invalid registry configuration.")
         self._namespace = registry_config.get("namespace", "")
+        self._cache_ttl_s: float | None = registry_config.get("cache_ttl_s", None)
         self._repos = []
+        self.cache: dict = {}
+        self._new_cached_pages: dict[str, dict] = {}
 
     @property
     @abstractmethod
@@ -34,6 +41,11 @@ class Registry(Core, ABC):
     def _repo_endpoint_response_key(self) -> str:
         """ Used to obtain the repositories from the endpoint response."""
 
+    @property
+    @abstractmethod
+    def _page_size_query_param(self) -> str:
+        """ Query parameter to set the page size of the paginated endpoints."""
+
     @abstractmethod
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
         """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
@@ -61,57 +73,198 @@ class Registry(Core, ABC):
             Returns with the endpoint url.
         """
 
-    def _list_tags(self, repo_name: str) -> None:
-        """ Get the tags from the respective endpoint and call the registry specific function to 
-            populate the private repo list.
+    @abstractmethod
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ The registry type specific way to obtain the url of the next page.
+
+            Args:
+                response -- the response of the actual page
+                endpoint_response -- the deserialized response of the actual page
+
+            Returns with the url of the next page or None if this is the last page.
+        """
+
+    def _compact_endpoint_response(self, endpoint_response: dict) -> dict:
+        """ Keep only the repository and tag names of the endpoint response, so the cache stays 
+            small.
+
+            Args:
+                endpoint_response -- the deserialized response of the endpoint
+
+            Returns with the compacted endpoint response.
+        """
+        compact_endpoint_response = {}
+        for key in (self._repo_endpoint_response_key, self._tag_endpoint_response_key):
+            if key in endpoint_response:
+                compact_endpoint_response[key] = [{"name": item["name"]} if isinstance(item, dict) else item
+                                                  for item in endpoint_response[key]]
+        return compact_endpoint_response
+
+    def _request_pages(self, url: str, failure_text: str) -> Generator:
+        """ Generator function for requesting a paginated endpoint page by page.
+
+            The first page is requested with the configured page size, then the next page links
+            are followed until the last page. Only one page is held in memory at a time.
+
+            If a page is in the cache, it gets revalidated with its ETag. When the registry 
+            responds with 304 Not Modified, the cached page is used.
+
+            Args:
+                url -- the url of the first page
+                failure_text -- describes what couldn't be retrieved in case of an error response
+
+            Yields the endpoint response of each page.
+
+            Raises:
+                RegistryError -- if the registry responds with an error status code
+        """
+        params: dict | None = {self._page_size_query_param: self.config_file.registry_page_size}
+        while url:
+            cached_page: dict | None = self.cache.get("pages", {}).get(url)
+            headers: dict | None = None
+            if cached_page:
+                headers = {"If-None-Match": cached_page["etag"]}
+
+            response = self.http_client.get(url, params=params, headers=headers,
+                                            timeout=self.config_file.http_request_timeout_s)
+            if response.status_code == requests.codes.not_modified and cached_page:
+                endpoint_response = cached_page["body"]
+                next_page_url = cached_page["next"]
+            elif response.status_code == requests.codes.ok:
+                endpoint_response = response.json()
+                next_page_url = self._get_next_page_url(response, endpoint_response)
+                cached_page = None
+                etag = response.headers.get("ETag")
+                if etag:
+                    cached_page = {
+                        "etag": etag,
+                        "body": self._compact_endpoint_response(endpoint_response),
+                        "next": next_page_url
+                    }
+            else:
+                raise RegistryError(f"Error in communication with the registry. {failure_text} Response status code: {response.status_code}")
+
+            if cached_page:
+                self._new_cached_pages[url] = cached_page
+
+            yield endpoint_response
+
+            url = next_page_url
+            # The next page url already contains the query parameters.
+            params = None
+
+    def _request_tags(self, repo_name: str) -> list[dict] | None:
+        """ Get the tags from the respective endpoint.
+
+            This method only communicates with the registry, so it can be called from multiple
+            threads at the same time.
 
             Args:
                 repo_name -- get the tags of this repository
+
+            Returns with the endpoint response of each page or None if the tags couldn't be 
+            retrieved.
         """
         try:
-            response = requests.get(self._get_tag_endpoint_url(repo_name), 
-                                              timeout=self.config_file.http_request_timeout_s)
+            return list(self._request_pages(self._get_tag_endpoint_url(repo_name), 
+                                            "Failed to retrieve tags."))
         except Exception as e:
             self.user_output.error(str(e))
-        else:
-            if response.status_code == requests.codes.ok:
-                self._append_repo_with_tag(response.json(), repo_name)
-                return
-            else:
-                self.user_output.error("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(response.status_code))
 
         self.user_output.msg("Skipping repository: " + repo_name)
-    
+        return None
+
+    def _update_cache(self, is_complete: bool) -> None:
+        """ Save the result of the listing to the cache.
+
+            Args:
+                is_complete -- all the repositories and tags have been retrieved
+        """
+        if is_complete:
+            self.cache["repos"] = list(self._repos)
+            self.cache["updated_at"] = time.time()
+            # Drop the pages that weren't requested anymore (e.g. deleted repositories).
+            self.cache["pages"] = self._new_cached_pages
+        else:
+            self.cache.setdefault("pages", {}).update(self._new_cached_pages)
+        self._new_cached_pages = {}
+
     def _list_repos(self) -> Generator:
-        """ Generator function for listing the repos. """
+        """ Generator function for listing the repos. 
+        
+            The repositories are processed page by page. The tags of the repositories in a page are
+            requested concurrently (at most max_concurrency requests at a time), but the results 
+            get appended to the private repo list in the order of the repositories, so the repo 
+            list is deterministic.
+        """
+        is_complete = True
+        executor = ThreadPoolExecutor(max_workers=max(1, self.config_file.max_concurrency))
         try:
-            response = requests.get(self._get_repo_endpoint_url(), 
-                                    timeout=self.config_file.http_request_timeout_s)
+            for endpoint_response in self._request_pages(self._get_repo_endpoint_url(), 
+                                                         "Failed to retrieve the repositories."):
+                repo_names = [repo["name"] for repo in endpoint_response[self._repo_endpoint_response_key]]
+                futures = [executor.submit(self._request_tags, repo_name) for repo_name in repo_names]
+                for repo_name, future in zip(repo_names, futures):
+                    yield "Loading image data from: " + repo_name
+                    tag_endpoint_responses = future.result()
+                    if tag_endpoint_responses is None:
+                        is_complete = False
+                        continue
+                    for tag_endpoint_response in tag_endpoint_responses:
+                        self._append_repo_with_tag(tag_endpoint_response, repo_name)
+            self._update_cache(is_complete)
+            return
+        except requests.exceptions.JSONDecodeError as e:
+            self.user_output.error(f"Invalid JSON format in response from the registry: {str(e)}")
         except Exception as e:
             self.user_output.error(str(e))
-        else:
-            if response.status_code == requests.codes.ok:
-                try:
-                    for repo in response.json()[self._repo_endpoint_response_key]:
-                        yield "Loading image data from: " + repo["name"]
-                        self._list_tags(repo["name"])
-                    return
-                except requests.exceptions.JSONDecodeError as e:
-                    self.user_output.error(f"Invalid JSON format in response from the registry: {str(e)}")
-                except Exception as e:
-                    self.user_output.error(str(e))
-            else:
-                self.user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(response.status_code))
+        finally:
+            executor.shutdown(cancel_futures=True)
 
+        self._update_cache(False)
         self.user_output.msg(f"Skipping [bold]{self._name}[/bold].")
+
+    def use_cache(self, cache: dict) -> None:
+        """ Use the given cache for the registry. The registry updates it after each listing.
+
+            If the cache belongs to a registry with a different url or namespace, it gets cleared.
+
+            Args:
+                cache -- the cache of the registry (as stored in the registry cache file)
+        """
+        if cache.get("url") != self._url or cache.get("namespace") != self._namespace:
+            cache.clear()
+            cache["url"] = self._url
+            cache["namespace"] = self._namespace
+        self.cache = cache
+
+    def _is_cache_fresh(self) -> bool:
+        """ Check whether the cached repos are younger than the TTL of the registry.
+
+            The TTL can be set per registry with the cache_ttl_s key of the registry config. 
+            Otherwise the registry_cache_ttl_s option of the config file is used.
+
+            Returns with True if the cached repos can be used without requesting the registry.
+        """
+        cache_ttl_s = self._cache_ttl_s
+        if cache_ttl_s is None:
+            cache_ttl_s = self.config_file.registry_cache_ttl_s
+        return "repos" in self.cache and time.time() - self.cache.get("updated_at", 0) < cache_ttl_s
     
     @property
     def repos(self) -> list[str]:
         """ Repos in the registry filtered by namespace if applicable.
+
+            If the cache is fresh the repos are served from it, otherwise they get requested from
+            the registry.
         
             Returns with list of the repos.
         """
-        self.user_output.status_generator(self._list_repos())
+        if self._is_cache_fresh():
+            self._repos = list(self.cache["repos"])
+        else:
+            self._repos = []
+            self.user_output.status_generator(self._list_repos())
         return self._repos
 
 class DockerHub(Registry):
@@ -122,10 +275,12 @@ class DockerHub(Registry):
                                   Docker Hub registry)
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
             _repo_endpoint_response_key -- used to obtain the repositories from the endpoint response
+            _page_size_query_param -- query parameter to set the page size
     """
     _docker_hub_domain = "registry.hub.docker.com"
     _tag_endpoint_response_key = "results"
     _repo_endpoint_response_key = "results"
+    _page_size_query_param = "page_size"
 
     def __init__(self, registry_config: dict) -> None:
         """ Init the class.
@@ -167,15 +322,28 @@ class DockerHub(Registry):
         """
         return f"{self._url}/v2/namespaces/{self._namespace}/repositories/{repo_name}/tags"
 
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ Docker Hub returns the url of the next page in the response body.
+
+            Args:
+                response -- the response of the actual page
+                endpoint_response -- the deserialized response of the actual page
+
+            Returns with the url of the next page or None if this is the last page.
+        """
+        return endpoint_response.get("next")
+
 class DockerRegistry(Registry):
     """ Docker Registry
     
         Class variables:
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
             _repo_endpoint_response_key -- used to obtain the repositories from the endpoint response
+            _page_size_query_param -- query parameter to set the page size
     """
     _tag_endpoint_response_key = "tags"
     _repo_endpoint_response_key = "repositories"
+    _page_size_query_param = "n"
 
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
         """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
@@ -205,6 +373,21 @@ class DockerRegistry(Registry):
         """
         return f"{self._url}/v2/{repo_name.split('/')[1]}/tags/list"
 
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ Docker Registry returns the url of the next page in the RFC 5988 Link header. The url is
+            relative to the requested one.
+
+            Args:
+                response -- the response of the actual page
+                endpoint_response -- the deserialized response of the actual page
+
+            Returns with the url of the next page or None if this is the last page.
+        """
+        next_page_link = response.links.get("next", {}).get("url")
+        if next_page_link:
+            return urljoin(response.url, next_page_link)
+        return None
+
 class Registries(Core):
     """ Contains all configured registiries."""
     def __init__(self) -> None:
@@ -225,6 +408,11 @@ class Registries(Core):
         else:
             self.registries.append(DockerRegistry(registry_config))
 
+    @property
+    def registry_cache_json(self) -> RegistryCacheJSON:
+        """ The registry cache shared by all the registries. It gets loaded only at the first access."""
+        return RegistryCacheJSON.get_shared()
+
     def list_repos(self, reg_selection: list[str]) -> list[str]:
         """ List the available repositories.
 
@@ -237,10 +425,22 @@ class Registries(Core):
 
         for registry in self.registries:
             if not reg_selection or registry._name in reg_selection:
+                registry.use_cache(self.registry_cache_json.get_entry(registry._name))
                 repo_list.extend(registry.repos)
 
+        self.registry_cache_json.flush()
         return repo_list
 
+    def invalidate_cache(self, reg_selection: list[str]) -> None:
+        """ Drop the cached data of the registries, so the next listing requests them again.
+
+            Args:
+                reg_selection -- the selected registries, empty list means all registries
+        """
+        for registry in self.registries:
+            if not reg_selection or registry._name in reg_selection:
+                self.registry_cache_json.delete_entry(registry._name)
+
     def add_registry(self, registry_config: dict) -> None:
         """ Add a new registry.
         
@@ -272,4 +472,7 @@ class Registries(Core):
                 self.registries.remove(registry)
 
         self.config_file.registries.remove(registry_config)
-        self.config_file.flush()
\ No newline at end of file
+        self.config_file.flush()
+
+        self.registry_cache_json.delete_entry(registry_config["name"])
+        self.registry_cache_json.flush()
\ No newline at end of file
@@ -2,7 +2,10 @@
 # dem/core/task.py
 
 from dem.core.hosts import Hosts, Host
+from dem.core.container_engine import RunResult
 from dem.core.exceptions import TaskError
+from threading import Event
+from typing import Callable
 import os
 
 class Task():
@@ -16,17 +19,20 @@ class Task():
         self.descriptor: dict = task_descriptor
         self.name: str = task_descriptor["name"]
         self.host_name: str = task_descriptor["host_name"]
+        self.depends_on: list[str] = task_descriptor.get("depends_on", [])
 
 class DockerTask(Task):
     """ A Docker Task. """
-    def __init__(self, task_descriptor: dict, hosts: Hosts) -> None:
+    def __init__(self, task_descriptor: dict, hosts: Hosts, dev_env_name: str = "") -> None:
         """ Initialize the DockerTask class.
         
             Args:
                 task_descriptor -- The description of the task.
                 hosts -- The available hosts.
+                dev_env_name -- The name of the Development Environment the task belongs to.
         """
         super().__init__(task_descriptor)
+        self.dev_env_name: str = dev_env_name
         self.rm: bool = task_descriptor["rm"]
         self.mount_workdir: bool = task_descriptor["mount_workdir"]
         self.connect_to_network: bool = task_descriptor["connect_to_network"]
@@ -45,12 +51,36 @@ class DockerTask(Task):
             except KeyError:
                 raise TaskError(f"Host {self.host_name} not available.")
 
-    def run(self) -> None:
-        """ Run the task. """
+    def run(self, log_prefix: str = "", warm: bool = False, 
+            output: Callable[[bytes, bool], None] | None = None, 
+            cancel_event: Event | None = None, name_suffix: str = "") -> RunResult:
+        """ Run the task.
+        
+            Args:
+                log_prefix -- the prefix of the task's log lines
+                warm -- run the task in the warm container of the Dev Env and image
+                output -- receives the output (data, is_stderr) instead of the user output
+                cancel_event -- the task gets stopped when this event is set (not supported for 
+                                the warm runs)
+                name_suffix -- appended to the name of the container, so the runs of the same 
+                               task at the same time don't conflict
+
+            Returns:
+                the result of the run
+        """
         if self.run_as_current_user:
             user: str = f"{os.getuid()}:{os.getgid()}"
         else:
             user: None = None
 
-        self.host.container_engine.run(self.image, self.command, remove=self.rm, 
-                                       network=self.network, name=self.name, user=user)
\ No newline at end of file
+        if warm:
+            return self.host.container_engine.run_warm(self.image, self.descriptor["command"],
+                                                       self.dev_env_name, network=self.network, 
+                                                       user=user, log_prefix=log_prefix, 
+                                                       output=output)
+
+        name = f"{self.name}-{name_suffix}" if name_suffix else self.name
+        return self.host.container_engine.run(self.image, self.command, remove=self.rm, 
+                                              network=self.network, name=name, user=user,
+                                              log_prefix=log_prefix, output=output, 
+                                              cancel_event=cancel_event)
\ No newline at end of file
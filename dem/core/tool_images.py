@@ -55,23 +55,26 @@ class ToolImages():
         """
         registry_tool_image_names = []
         local_tool_image_names = []
+        local_tool_image_name_set = set()
 
         if local:
             local_tool_image_names = self.container_engine.get_local_tool_images()
+            local_tool_image_name_set = set(local_tool_image_names)
 
         if registry:
             registry_tool_image_names = self.registries.list_repos(reg_selection)
 
+        registry_tool_image_name_set = set(registry_tool_image_names)
         for tool_image_name in local_tool_image_names:
             tool_image = self.all_tool_images.get(tool_image_name, ToolImage(tool_image_name))
-            if tool_image_name in registry_tool_image_names:
+            if tool_image_name in registry_tool_image_name_set:
                 tool_image.availability = ToolImage.LOCAL_AND_REGISTRY
             else:
                 tool_image.availability = ToolImage.LOCAL_ONLY
             self.all_tool_images[tool_image_name] = tool_image
 
         for tool_image_name in registry_tool_image_names:
-            if tool_image_name not in local_tool_image_names:
+            if tool_image_name not in local_tool_image_name_set:
                 tool_image = self.all_tool_images.get(tool_image_name, ToolImage(tool_image_name))
                 tool_image.availability = ToolImage.REGISTRY_ONLY
                 self.all_tool_images[tool_image_name] = tool_image
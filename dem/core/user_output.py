@@ -18,6 +18,18 @@ class UserOutput(ABC):
         """
         pass
 
+    @abstractmethod
+    def raw_output(self, data: bytes, is_stderr: bool = False) -> None:
+        """ Pass output through to the user without any processing.
+
+            Used for the output of the containers, which must not be interpreted as markup.
+        
+            Args:
+                data -- the output to write
+                is_stderr -- the data belongs to the stderr
+        """
+        pass
+
     @abstractmethod
     def error(self, text: str) -> None:
         """ Send and error message
@@ -66,6 +78,9 @@ class NoUserOutput(UserOutput):
     def msg(self, text: str, is_title: bool = False) -> None:
         pass
 
+    def raw_output(self, data: bytes, is_stderr: bool = False) -> None:
+        pass
+
     def error(self, text: str) -> None:
         pass
 
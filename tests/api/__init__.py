@@ -0,0 +1,2 @@
+"""Dummy test module for VS code unit test extension."""
+# tests/api/__init__.py
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""Unit tests for the API."""
+# tests/api/test_main.py
+
+# Unit under test:
+import dem.api.main as api_main
+
+# Test framework
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from dem.core.jobs import Job
+
+def _get_test_job() -> Job:
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    return Job(mock_dev_env, ["task1"])
+
+def _parse_sse(event: str) -> tuple[str, dict]:
+    lines = event.strip().split("\n")
+    return lines[0][len("event: "):], json.loads(lines[1][len("data: "):])
+
+def test__iter_job_events() -> None:
+    # Test setup
+    test_job = _get_test_job()
+
+    async def collect_events() -> list[str]:
+        events = []
+        async for event in api_main._iter_job_events(test_job):
+            events.append(event)
+            if len(events) == 1:
+                # The output arrives from the job's thread while the client is waiting.
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.05, lambda: (test_job.start(),
+                                               test_job.write_output("é\n".encode()[:1], False)))
+                loop.call_later(0.1, lambda: (test_job.write_output("é\n".encode()[1:], False),
+                                              test_job.write_output(b"err\n", True),
+                                              test_job.finish(Job.SUCCEEDED, 0)))
+        return events
+
+    # Run unit under test
+    actual_events = asyncio.run(asyncio.wait_for(collect_events(), 5))
+
+    # Check expectations
+    actual_parsed_events = [_parse_sse(event) for event in actual_events 
+                            if not event.startswith(":")]
+    assert actual_parsed_events[0][0] == "status"
+    assert actual_parsed_events[0][1]["status"] == Job.QUEUED
+    actual_output = [data for event, data in actual_parsed_events if event == "output"]
+    assert "".join(data["data"] for data in actual_output if data["stream"] == "stdout") == "é\n"
+    assert "".join(data["data"] for data in actual_output if data["stream"] == "stderr") == "err\n"
+    assert actual_parsed_events[-1] == ("end", test_job.to_dict())
+    assert not test_job._listeners
+
+def test__iter_job_output() -> None:
+    # Test setup
+    test_job = _get_test_job()
+    test_job.start()
+    test_job.write_output(b"out\n", False)
+
+    async def collect_output() -> list[bytes]:
+        output = []
+        async for data in api_main._iter_job_output(test_job, True):
+            output.append(data)
+            if len(output) == 1:
+                # The output arrives from the job's thread while the client is waiting.
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.05, lambda: (test_job.write_output(b"err\n", True),
+                                               test_job.finish(Job.SUCCEEDED, 0)))
+        return output
+
+    # Run unit under test
+    actual_output = asyncio.run(asyncio.wait_for(collect_output(), 5))
+
+    # Check expectations
+    assert actual_output == [b"out\n", b"err\n"]
+    assert not test_job._listeners
+
+def test__iter_job_output_no_follow() -> None:
+    # Test setup
+    test_job = _get_test_job()
+    test_job._max_output_size = 4
+    test_job.start()
+    for data in (b"ab", b"cd", b"ef"):
+        test_job.write_output(data, False)
+
+    async def collect_output() -> list[bytes]:
+        return [data async for data in api_main._iter_job_output(test_job, False)]
+
+    # Run unit under test
+    actual_output = asyncio.run(asyncio.wait_for(collect_output(), 5))
+
+    # Check expectations
+    assert actual_output == [b"[1 output chunks dropped]\n", b"cd", b"ef"]
+    assert not test_job._listeners
+
+def test_delete_job_conflict() -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    test_job = _get_test_job()
+    mock_platform.job_manager.get.return_value = test_job
+    mock_platform.job_manager.cancel.side_effect = api_main.JobError("test_error")
+    api_main.platform = mock_platform
+
+    # Run unit under test
+    with pytest.raises(api_main.HTTPException) as exported_exception_info:
+        api_main.delete_job(test_job.id)
+
+    # Check expectations
+    assert exported_exception_info.value.status_code == 409
+    assert exported_exception_info.value.detail == "Job error: test_error"
+    mock_platform.job_manager.cancel.assert_called_once_with(test_job.id)
+
+def test__iter_job_events_dropped() -> None:
+    # Test setup
+    test_job = _get_test_job()
+    test_job._max_output_size = 4
+    for data in (b"ab", b"cd", b"ef"):
+        test_job.write_output(data, False)
+    test_job.finish(Job.FAILED, 1)
+
+    async def collect_events() -> list[str]:
+        return [event async for event in api_main._iter_job_events(test_job)]
+
+    # Run unit under test
+    actual_events = asyncio.run(collect_events())
+
+    # Check expectations
+    actual_parsed_events = [_parse_sse(event) for event in actual_events]
+    assert [event for event, _ in actual_parsed_events] == ["status", "dropped", "output", 
+                                                            "output", "end"]
+    assert actual_parsed_events[1][1] == {"chunks": 1}
+    assert actual_parsed_events[-1][1]["exit_code"] == 1
+
+def _get_test_platform(is_installation_correct: bool = True) -> MagicMock:
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {"task1": MagicMock()}
+    mock_result = MagicMock()
+    mock_result.exit_code = 0
+    mock_result.to_dict.return_value = {"exit_code": 0}
+    mock_dev_env.run_tasks.return_value = {"task1": mock_result}
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    mock_platform.state.is_installation_correct.return_value = is_installation_correct
+    return mock_platform
+
+def test_run_command() -> None:
+    # Test setup
+    mock_platform = _get_test_platform()
+    mock_dev_env = mock_platform.get_dev_env_by_name.return_value
+    api_main.platform = mock_platform
+    test_request = api_main.RunCommandRequest(dev_env_name="test_dev_env", task_name="task1", 
+                                              extra_args="")
+
+    # Run unit under test
+    actual_response = api_main.run_command(test_request)
+
+    # Check expectations
+    assert actual_response == {
+        "status": "success",
+        "message": "Task task1 executed in test_dev_env",
+        "exit_code": 0,
+        "results": {"task1": {"exit_code": 0}}
+    }
+
+    mock_platform.state.start_engines.assert_called_once_with(mock_dev_env)
+    mock_platform.state.is_installation_correct.assert_called_once_with(mock_dev_env)
+    mock_dev_env.run_tasks.assert_called_once()
+    assert mock_dev_env.run_tasks.call_args.args == (["task1"],)
+    assert len(mock_dev_env.run_tasks.call_args.kwargs["name_suffix"]) == 32
+
+def test_run_command_incorrect_installation() -> None:
+    # Test setup
+    mock_platform = _get_test_platform(False)
+    mock_dev_env = mock_platform.get_dev_env_by_name.return_value
+    api_main.platform = mock_platform
+    test_request = api_main.RunCommandRequest(dev_env_name="test_dev_env", task_name="task1", 
+                                              extra_args="")
+
+    # Run unit under test
+    with pytest.raises(api_main.HTTPException) as exported_exception_info:
+        api_main.run_command(test_request)
+
+    # Check expectations
+    assert exported_exception_info.value.status_code == 500
+    assert exported_exception_info.value.detail == \
+        "Development Environment error: The test_dev_env Development Environment is not installed correctly."
+    mock_dev_env.run_tasks.assert_not_called()
+
+def test_run_command_unknown_task() -> None:
+    # Test setup
+    mock_platform = _get_test_platform()
+    api_main.platform = mock_platform
+    test_request = api_main.RunCommandRequest(dev_env_name="test_dev_env", task_name="task2", 
+                                              extra_args="")
+
+    # Run unit under test
+    with pytest.raises(api_main.HTTPException) as exported_exception_info:
+        api_main.run_command(test_request)
+
+    # Check expectations
+    assert exported_exception_info.value.status_code == 404
+    mock_platform.state.start_engines.assert_not_called()
+
+def test__iter_dev_env_events() -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    api_main.platform = mock_platform
+
+    async def collect() -> list[str]:
+        events = api_main._iter_dev_env_events()
+        first_event = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+        listener = mock_platform.state.add_listener.call_args.args[0]
+        listener("test_dev_env", False)
+        actual_events = [await first_event]
+        await events.aclose()
+        return actual_events
+
+    # Run unit under test
+    actual_events = asyncio.run(collect())
+
+    # Check expectations
+    assert [_parse_sse(event) for event in actual_events] == [
+        ("status", {"dev_env_name": "test_dev_env", "is_installation_correct": False})
+    ]
+    mock_platform.state.remove_listener.assert_called_once_with(
+        mock_platform.state.add_listener.call_args.args[0])
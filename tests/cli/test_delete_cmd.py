@@ -47,6 +47,39 @@ def test_delete(mock_stdout_print: MagicMock, mock_config: MagicMock) -> None:
     ])
     mock_platform.flush_dev_env_properties.assert_called_once()
 
+@patch("dem.core.commands.delete_cmd.typer.confirm")
+@patch("dem.core.commands.delete_cmd.stdout.print")
+def test_delete_batched(mock_stdout_print: MagicMock, mock_confirm: MagicMock) -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+
+    test_dev_env = MagicMock()
+    test_dev_env.is_installed = True
+    mock_platform.get_dev_env_by_name.return_value = test_dev_env
+    mock_platform.local_dev_envs = [test_dev_env]
+    mock_batch = mock_platform.dev_env_json.batch.return_value
+
+    def check_not_batched(*args, **kwargs) -> None:
+        mock_batch.__enter__.assert_not_called()
+    mock_confirm.side_effect = check_not_batched
+
+    def check_batched(dev_env: MagicMock) -> list[str]:
+        mock_batch.__enter__.assert_called_once()
+        return []
+    mock_platform.uninstall_dev_env.side_effect = check_batched
+    mock_platform.flush_dev_env_properties.side_effect = \
+        lambda: mock_batch.__exit__.assert_not_called()
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["delete", "test_dev_env_name"])
+
+    # Check expectations
+    assert runner_result.exit_code == 0
+    mock_platform.uninstall_dev_env.assert_called_once_with(test_dev_env)
+    mock_platform.flush_dev_env_properties.assert_called_once()
+    mock_batch.__exit__.assert_called_once()
+
 @patch("dem.core.commands.delete_cmd.typer.confirm")
 @patch("dem.core.commands.delete_cmd.stderr.print")
 def test_delete_uninstall_failed(mock_stderr_print: MagicMock, mock_confirm: MagicMock) -> None:
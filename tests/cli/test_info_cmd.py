@@ -4,6 +4,7 @@
 # Unit under test:
 import dem.cli.main as main
 import dem.core.commands.info_cmd as info_cmd
+from dem.core.exceptions import CatalogError
 
 # Test framework
 from typer.testing import CliRunner
@@ -264,14 +265,18 @@ def test_cat_dev_env_info(mock_print_cat_dev_env_info: MagicMock) -> None:
     mock_catalog = MagicMock()
     mock_catalog.get_dev_env_by_name.return_value = mock_dev_env
     mock_catalog.name = "test_cat"
-    mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
+    mock_not_reached_catalog = MagicMock()
+    mock_platform.dev_env_catalogs.catalogs = [mock_catalog, mock_not_reached_catalog]
+    mock_platform.dev_env_catalogs.request_all.return_value = iter([(mock_catalog, None), 
+                                                                    (mock_not_reached_catalog, None)])
 
     # Run the test
     info_cmd.cat_dev_env_info(mock_platform, test_dev_env_name, [])
 
     # Verify the output
-    mock_catalog.request_dev_envs.assert_called_once()
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with([])
     mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_not_reached_catalog.get_dev_env_by_name.assert_not_called()
     mock_print_cat_dev_env_info.assert_called_once_with(mock_dev_env, "test_cat")
 
 @patch("dem.core.commands.info_cmd.stderr.print")
@@ -281,15 +286,24 @@ def test_cat_dev_env_info_unknown_dev_env(mock_stderr_print: MagicMock) -> None:
     test_dev_env_name = "test_dev_env"
     mock_catalog = MagicMock()
     mock_catalog.get_dev_env_by_name.return_value = None
-    mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
+    mock_failing_catalog = MagicMock()
+    mock_platform.dev_env_catalogs.catalogs = [mock_failing_catalog, mock_catalog]
+    mock_platform.dev_env_catalogs.request_all.return_value = [
+        (mock_failing_catalog, CatalogError("test_error")),
+        (mock_catalog, None)
+    ]
 
     # Run the test
     info_cmd.cat_dev_env_info(mock_platform, test_dev_env_name, [])
 
     # Verify the output
-    mock_catalog.request_dev_envs.assert_called_once()
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with([])
+    mock_failing_catalog.get_dev_env_by_name.assert_not_called()
     mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
-    mock_stderr_print.assert_called_once_with("[red]Error: Unknown Development Environment: test_dev_env[/]\n")
+    mock_stderr_print.assert_has_calls([
+        call("[red]Catalog error: test_error[/]"),
+        call("[red]Error: Unknown Development Environment: test_dev_env[/]\n")
+    ])
 
 @patch("dem.core.commands.info_cmd.stderr.print")
 def test_selected_cats_info_unknown_catalog(mock_stderr_print: MagicMock) -> None:
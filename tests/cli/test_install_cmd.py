@@ -48,10 +48,30 @@ def test_install_dev_env_valid_name(mock_stdout_print):
     assert 0 == runner_result.exit_code
     
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_install.name )
-    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install)
+    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install, False)
     mock_stdout_print.assert_called_once_with(f"[green]Successfully installed the {fake_dev_env_to_install.name}![/]")
 
 
+@patch("dem.core.commands.install_cmd.stdout.print")
+def test_install_dev_env_force_pull(mock_stdout_print):
+    # Test setup
+    fake_dev_env_to_install = MagicMock()
+    fake_dev_env_to_install.name = "dev_env"
+    fake_dev_env_to_install.is_installed = False    
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["install", fake_dev_env_to_install.name, 
+                                                   "--force-pull"], color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install, True)
+    mock_stdout_print.assert_called_once_with(f"[green]Successfully installed the {fake_dev_env_to_install.name}![/]")
+
 @patch("dem.core.commands.install_cmd.stderr.print")
 def test_install_dev_env_already_installed(mock_stderr_print):
      # Test setup
@@ -4,6 +4,7 @@
 # Unit under test:
 import dem.cli.main as main
 from dem.core.commands import list_cat_cmd
+from dem.core.exceptions import CatalogError
 
 # Test framework
 from typer.testing import CliRunner
@@ -32,6 +33,8 @@ def test_list_cat(mock_stdout_print: MagicMock, mock_Table: MagicMock) -> None:
         mock_catalog_2
     ]
     mock_platform.dev_env_catalogs.catalogs = test_catalog_configs
+    mock_platform.dev_env_catalogs.request_all.return_value = [(mock_catalog_1, None), 
+                                                               (mock_catalog_2, None)]
     mock_table = MagicMock()
     mock_Table.return_value = mock_table
 
@@ -44,8 +47,7 @@ def test_list_cat(mock_stdout_print: MagicMock, mock_Table: MagicMock) -> None:
     mock_Table.assert_called_once()
     calls = [call("name"), call("url")]
     mock_table.add_column.assert_has_calls(calls)
-    mock_catalog_1.request_dev_envs.assert_called_once()
-    mock_catalog_2.request_dev_envs.assert_called_once()
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with()
 
     calls = [
         call(mock_catalog_1.name, mock_catalog_1.url),
@@ -85,8 +87,10 @@ def test_list_cat_failure(mock_stderr_print: MagicMock, mock_Table: MagicMock) -
     mock_Table.return_value = mock_table
     mock_corrupted_catalog = MagicMock()
     test_exception_text = "test_exception_text"
-    mock_corrupted_catalog.request_dev_envs.side_effect = list_cat_cmd.CatalogError(test_exception_text)
     mock_platform.dev_env_catalogs.catalogs = [mock_corrupted_catalog]
+    mock_platform.dev_env_catalogs.request_all.return_value = [
+        (mock_corrupted_catalog, CatalogError(test_exception_text))
+    ]
 
     # Run unit under test
     list_cat_cmd.execute(mock_platform)
@@ -94,5 +98,6 @@ def test_list_cat_failure(mock_stderr_print: MagicMock, mock_Table: MagicMock) -
     # Check expectations
     mock_Table.assert_called_once
     mock_table.add_column.assert_has_calls([call("name"), call("url")])
-    mock_corrupted_catalog.request_dev_envs.assert_called_once()
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with()
+    mock_table.add_row.assert_called_once_with(mock_corrupted_catalog.name, mock_corrupted_catalog.url)
     mock_stderr_print.assert_called_once_with(f"[red]Catalog error: {test_exception_text}[/]")
\ No newline at end of file
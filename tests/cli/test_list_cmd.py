@@ -4,6 +4,7 @@
 # Unit under test:
 import dem.cli.main as main
 import dem.core.commands.list_cmd as list_cmd
+from dem.core.exceptions import CatalogError
 
 # Test framework
 from typer.testing import CliRunner
@@ -163,13 +164,20 @@ def test_list_all_cat_dev_envs(mock_list_actual_cat_dev_envs: MagicMock) -> None
     # Setup
     mock_platform = MagicMock()
     mock_catalog = MagicMock()
-    mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
+    mock_failing_catalog = MagicMock()
+    mock_platform.dev_env_catalogs.catalogs = [mock_catalog, mock_failing_catalog]
+    test_error = CatalogError("test_error")
+    mock_platform.dev_env_catalogs.request_all.return_value = [(mock_catalog, None),
+                                                               (mock_failing_catalog, test_error)]
 
     # Run the test
-    list_cmd.list_all_cat_dev_envs(mock_platform)
+    with patch("dem.core.commands.list_cmd.stderr.print") as mock_stderr_print:
+        list_cmd.list_all_cat_dev_envs(mock_platform)
 
     # Check the result
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with()
     mock_list_actual_cat_dev_envs.assert_called_once_with(mock_catalog)
+    mock_stderr_print.assert_called_once_with("[red]Catalog error: test_error[/]")
 
 @patch("dem.core.commands.list_cmd.list_actual_cat_dev_envs")
 def test_list_selected_cat_dev_envs(mock_list_actual_cat_dev_envs: MagicMock) -> None:
@@ -179,13 +187,35 @@ def test_list_selected_cat_dev_envs(mock_list_actual_cat_dev_envs: MagicMock) ->
     test_catalog_name = "test_catalog"
     mock_catalog.name = test_catalog_name
     mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
+    mock_platform.dev_env_catalogs.request_all.return_value = [(mock_catalog, None)]
 
     # Run the test
     list_cmd.list_selected_cat_dev_envs(mock_platform, [test_catalog_name])
 
     # Check the result
+    mock_platform.dev_env_catalogs.request_all.assert_called_once_with([test_catalog_name])
     mock_list_actual_cat_dev_envs.assert_called_once_with(mock_catalog)
 
+@patch("dem.core.commands.list_cmd.stderr.print")
+@patch("dem.core.commands.list_cmd.list_actual_cat_dev_envs")
+def test_list_selected_cat_dev_envs_catalog_error(mock_list_actual_cat_dev_envs: MagicMock,
+                                                  mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    mock_catalog = MagicMock()
+    test_catalog_name = "test_catalog"
+    mock_catalog.name = test_catalog_name
+    mock_platform.dev_env_catalogs.catalogs = [mock_catalog]
+    mock_platform.dev_env_catalogs.request_all.return_value = [(mock_catalog, 
+                                                                CatalogError("test_error"))]
+
+    # Run the test
+    list_cmd.list_selected_cat_dev_envs(mock_platform, [test_catalog_name])
+
+    # Check the result
+    mock_list_actual_cat_dev_envs.assert_not_called()
+    mock_stderr_print.assert_called_once_with("[red]Catalog error: test_error[/]")
+
 @patch("dem.core.commands.list_cmd.stderr.print")
 def test_list_selected_cat_dev_envs_catalog_not_found(mock_stderr_print: MagicMock) -> None:
     # Setup
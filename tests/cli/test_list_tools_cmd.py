@@ -223,6 +223,19 @@ def test_execute_list_tools_from_all_regs(mock_list_tools_from_all_regs: MagicMo
     # Check the result
     mock_list_tools_from_all_regs.assert_called_once_with(mock_platform)
 
+@patch("dem.core.commands.list_tools_cmd.list_tools_from_selected_regs")
+def test_execute_list_tools_from_selected_regs_refresh(mock_list_tools_from_selected_regs: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    test_specified_regs = ["test_reg"]
+
+    # Run the test
+    list_tools_cmd.execute(mock_platform, True, test_specified_regs, True)
+
+    # Check the result
+    mock_platform.registries.invalidate_cache.assert_called_once_with(test_specified_regs)
+    mock_list_tools_from_selected_regs.assert_called_once_with(mock_platform, test_specified_regs)
+
 @patch("dem.core.commands.list_tools_cmd.execute")
 def test_list_tools_cmd(mock_execute: MagicMock) -> None:
     # Setup
@@ -235,4 +248,4 @@ def test_list_tools_cmd(mock_execute: MagicMock) -> None:
     # Check the result
     assert result.exit_code == 0
 
-    mock_execute.assert_called_once_with(mock_platform, False, [])
\ No newline at end of file
+    mock_execute.assert_called_once_with(mock_platform, False, [], False)
\ No newline at end of file
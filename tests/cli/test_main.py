@@ -165,6 +165,44 @@ def test_autocomplete_task_name() -> None:
     # Check expectations
     assert expected_completions == actual_completions
 
+def test_autocomplete_from_name_index() -> None:
+    # Test setup
+    mock_name_index = MagicMock()
+    mock_name_index.get_dev_env_names.side_effect = lambda installed_only=False: \
+        ["test_installed"] if installed_only else ["test_installed", "test_other", "other"]
+    mock_name_index.get_names.side_effect = lambda key: [f"test_{key}", "other"]
+    mock_name_index.get_task_names.return_value = ["test_task", "other"]
+    mock_ctx = MagicMock()
+    mock_ctx.params = {
+        "dev_env_name": "test_installed"
+    }
+
+    main.platform = MagicMock()
+    main.name_index = mock_name_index
+
+    try:
+        # Run unit under test
+        actual_dev_env_names = list(main.autocomplete_dev_env_name("tes"))
+        actual_installed_dev_env_names = list(main.autocomplete_installed_dev_env_name("tes"))
+        actual_cat_names = list(main.autocomplete_cat_name("tes"))
+        actual_reg_names = list(main.autocomplete_reg_name("tes"))
+        actual_host_names = list(main.autocomplete_host_name(""))
+        actual_task_names = list(main.autocomplete_task_name(mock_ctx, "tes"))
+    finally:
+        main.name_index = None
+
+    # Check expectations
+    assert actual_dev_env_names == ["test_installed", "test_other"]
+    assert actual_installed_dev_env_names == ["test_installed"]
+    assert actual_cat_names == ["test_catalogs"]
+    assert actual_reg_names == ["test_registries"]
+    assert actual_host_names == ["test_hosts", "other"]
+    assert actual_task_names == ["test_task"]
+
+    mock_name_index.get_task_names.assert_called_once_with("test_installed")
+    main.platform.registries.list_registry_configs.assert_not_called()
+    main.platform.hosts.list_host_configs.assert_not_called()
+
 @patch("dem.cli.main.__app_name__", "axem-dem")
 @patch("dem.cli.main.stdout.print")
 @patch("dem.cli.main.importlib.metadata.version")
@@ -207,7 +245,7 @@ def test_version_exit_raised(mock_importlib_metadata_version):
     with pytest.raises(typer.Exit):
         main._version_callback(True)
 
-@patch("dem.cli.main.init_cmd.execute")
+@patch("dem.core.commands.init_cmd.execute")
 def test_init_execute(mock_init_execute: MagicMock) -> None:
     # Test setup
     test_path = "test_path"
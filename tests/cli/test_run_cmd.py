@@ -41,4 +41,157 @@ def test_dev_env_health_check(mock_stderr_print: MagicMock, mock_stdout_print: M
     mock_stderr_print.assert_called_once_with("[red]Error: Incorrect installation![/]")
     mock_typer_confirm.assert_called_once_with("Should DEM reinstall the DevEnv?", abort=True)
     mock_platform.install_dev_env.assert_called_once_with(mock_dev_env)
-    mock_stdout_print.assert_called_once_with(f"[green]DEM successfully fixed the {mock_dev_env.name} Development Environment![/]")
\ No newline at end of file
+    mock_stdout_print.assert_called_once_with(f"[green]DEM successfully fixed the {mock_dev_env.name} Development Environment![/]")
+@patch("dem.core.commands.run_cmd.dev_env_health_check")
+@patch("dem.core.commands.run_cmd.stdout.print")
+def test_run_single_task(mock_stdout_print: MagicMock, mock_dev_env_health_check: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+    test_task_name = "test_task"
+
+    mock_task = MagicMock()
+    mock_task.name = test_task_name
+    mock_task.host_name = "local"
+    mock_task.run.return_value.exit_code = 0
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {test_task_name: mock_task}
+    mock_dev_env.get_task_execution_order.return_value = [test_task_name]
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["run", test_dev_env_name, test_task_name])
+
+    # Check expectations
+    assert runner_result.exit_code == 0
+
+    mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_dev_env.get_task_execution_order.assert_called_once_with([test_task_name])
+    mock_dev_env.start_engines.assert_called_once()
+    mock_dev_env_health_check.assert_called_once_with(mock_platform, mock_dev_env)
+    mock_stdout_print.assert_called_once_with(f"[green]Running task [bold]{test_task_name}[/bold] in Development Environment [bold]{test_dev_env_name}[/bold] on host local...[/]\n")
+    mock_task.run.assert_called_once_with(warm=False)
+    mock_dev_env.run_tasks.assert_not_called()
+
+@patch("dem.core.commands.run_cmd.dev_env_health_check")
+@patch("dem.core.commands.run_cmd.stdout.print")
+@patch("dem.core.commands.run_cmd.stderr.print")
+def test_run_multiple_tasks(mock_stderr_print: MagicMock, mock_stdout_print: MagicMock, 
+                            mock_dev_env_health_check: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+    test_task_names = ["lint", "unit-test", "static-analysis"]
+
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {task_name: MagicMock() for task_name in test_task_names + ["build"]}
+    mock_dev_env.get_task_execution_order.return_value = ["lint", "build", "unit-test", 
+                                                          "static-analysis"]
+    mock_dev_env.run_tasks.side_effect = run_cmd.DevEnvError("test_error")
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["run", test_dev_env_name, *test_task_names, 
+                                                   "--parallel", "3"])
+
+    # Check expectations
+    assert runner_result.exit_code == 1
+
+    mock_dev_env.get_task_execution_order.assert_called_once_with(test_task_names)
+    mock_dev_env.start_engines.assert_called_once()
+    mock_stdout_print.assert_called_once_with(f"[green]Running tasks [bold]lint, build, unit-test, static-analysis[/bold] in Development Environment [bold]{test_dev_env_name}[/bold] (parallel: 3)...[/]\n")
+    mock_dev_env.run_tasks.assert_called_once_with(test_task_names, 3, False)
+    mock_stderr_print.assert_called_once_with("[red]Development Environment error: test_error[/]")
+
+@patch("dem.core.commands.run_cmd.stderr.print")
+def test_run_unknown_task(mock_stderr_print: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {"lint": MagicMock()}
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["run", test_dev_env_name, "lint", "missing"])
+
+    # Check expectations
+    assert runner_result.exit_code == 1
+
+    mock_stderr_print.assert_called_once_with(f"[red]Error: Task [bold]missing[/bold] not found in Development Environment [bold]{test_dev_env_name}[/bold]![/]")
+    mock_dev_env.start_engines.assert_not_called()
+
+@patch("dem.core.commands.run_cmd.dev_env_health_check")
+@patch("dem.core.commands.run_cmd.stdout.print")
+@patch("dem.core.commands.run_cmd.stderr.print")
+def test_run_single_task_non_zero_exit_code(mock_stderr_print: MagicMock, 
+                                            mock_stdout_print: MagicMock, 
+                                            mock_dev_env_health_check: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+    test_task_name = "test_task"
+
+    mock_task = MagicMock()
+    mock_task.name = test_task_name
+    mock_task.run.return_value.exit_code = 3
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {test_task_name: mock_task}
+    mock_dev_env.get_task_execution_order.return_value = [test_task_name]
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["run", test_dev_env_name, test_task_name])
+
+    # Check expectations
+    assert runner_result.exit_code == 3
+
+    mock_task.run.assert_called_once_with(warm=False)
+    mock_stderr_print.assert_called_once_with(f"[red]Error: Task [bold]{test_task_name}[/bold] exited with code 3.[/]")
+
+@patch("dem.core.commands.run_cmd.dev_env_health_check")
+@patch("dem.core.commands.run_cmd.stdout.print")
+def test_run_multiple_tasks_summary(mock_stdout_print: MagicMock, 
+                                    mock_dev_env_health_check: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+    test_task_names = ["lint", "unit-test"]
+
+    mock_dev_env = MagicMock()
+    mock_dev_env.is_installed = True
+    mock_dev_env.tasks = {task_name: MagicMock() for task_name in test_task_names + ["build"]}
+    mock_dev_env.get_task_execution_order.return_value = ["lint", "build", "unit-test"]
+    mock_lint_result = MagicMock(exit_code=0, duration_s=1.25)
+    mock_build_result = MagicMock(exit_code=2, duration_s=3.0)
+    mock_dev_env.run_tasks.return_value = {"lint": mock_lint_result, "build": mock_build_result}
+
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["run", test_dev_env_name, *test_task_names, 
+                                                   "--parallel", "2", "--warm"])
+
+    # Check expectations
+    assert runner_result.exit_code == 2
+
+    mock_dev_env.run_tasks.assert_called_once_with(test_task_names, 2, True)
+    mock_stdout_print.assert_has_calls([
+        call("[green]lint: exit code 0 (1.2 s)[/]"),
+        call("[red]build: exit code 2 (3.0 s)[/]"),
+        call("[yellow]unit-test: not started[/]"),
+    ])
@@ -0,0 +1,78 @@
+"""Unit tests for the serve CLI command."""
+# tests/cli/test_serve_cmd.py
+
+# Unit under test:
+import dem.cli.main as main
+import dem.core.commands.serve_cmd as serve_cmd
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+## Global test variables
+
+# In order to test stdout and stderr separately, the stderr can't be mixed into the stdout.
+runner = CliRunner(mix_stderr=False)
+
+## Test cases
+
+@patch("dem.core.commands.serve_cmd.stdout.print")
+@patch("dem.core.commands.serve_cmd.APIServer")
+def test_serve(mock_APIServer: MagicMock, mock_stdout_print: MagicMock) -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.config_file.api_host = "0.0.0.0"
+    mock_platform.config_file.api_port = 8000
+    mock_platform.config_file.api_threadpool_size = 40
+    mock_platform.config_file.api_max_concurrent_requests = 0
+    mock_platform.config_file.api_keep_alive_timeout_s = 5
+    mock_platform.config_file.api_graceful_shutdown_timeout_s = 300
+    main.platform = mock_platform
+
+    mock_api_server = MagicMock()
+    mock_api_server.server.started = True
+    mock_api_server.wait.side_effect = KeyboardInterrupt
+    mock_APIServer.return_value = mock_api_server
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["serve", "--port", "8080", "--threads", "8"])
+
+    # Check expectations
+    assert runner_result.exit_code == 0
+
+    mock_APIServer.assert_called_once_with(mock_platform.fastapi_app, "0.0.0.0", 8080, 8, 0, 5, 300)
+    assert mock_platform.api_server is mock_api_server
+    mock_api_server.start.assert_called_once()
+    mock_api_server.wait.assert_called_once()
+    mock_api_server.stop.assert_called_once()
+    mock_platform.job_manager.shutdown.assert_called_once_with(wait=True)
+    mock_platform.state.close.assert_called_once()
+    mock_stdout_print.assert_called_with("[green]The API server has stopped.[/]")
+
+@patch("dem.core.commands.serve_cmd.stderr.print")
+@patch("dem.core.commands.serve_cmd.APIServer")
+def test_serve_failed_to_start(mock_APIServer: MagicMock, mock_stderr_print: MagicMock) -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+
+    mock_api_server = MagicMock()
+    mock_api_server.host = "127.0.0.1"
+    mock_api_server.port = 8080
+    mock_api_server.server.started = False
+    mock_APIServer.return_value = mock_api_server
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["serve", "--host", "127.0.0.1", "--port", "8080",
+                                                   "--threads", "8", "--max-concurrent-requests", "100",
+                                                   "--keep-alive-timeout", "10",
+                                                   "--graceful-shutdown-timeout", "30"])
+
+    # Check expectations
+    assert runner_result.exit_code == 0
+
+    mock_APIServer.assert_called_once_with(mock_platform.fastapi_app, "127.0.0.1", 8080, 8, 100, 
+                                           10, 30)
+    mock_api_server.stop.assert_not_called()
+    mock_stderr_print.assert_called_once_with("[red]Error: Failed to start the API server on 127.0.0.1:8080.[/]")
+    mock_platform.job_manager.shutdown.assert_not_called()
@@ -0,0 +1,21 @@
+"""Regression tests for the startup of the CLI."""
+# tests/cli/test_startup.py
+
+# Test framework
+import json
+import subprocess
+import sys
+
+def test_cli_import_defers_heavy_modules() -> None:
+    # Test setup
+    test_heavy_modules = ["fastapi", "pydantic", "uvicorn", "starlette", "textual", 
+                          "dem.api.main", "dem.core.api_server", "dem.cli.tui.window"]
+    test_script = ("import sys, json, dem.__main__\n"
+                   f"print(json.dumps([m for m in {test_heavy_modules!r} if m in sys.modules]))")
+
+    # Run unit under test
+    result = subprocess.run([sys.executable, "-c", test_script], capture_output=True, text=True)
+
+    # Check expectations
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
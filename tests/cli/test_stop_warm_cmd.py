@@ -0,0 +1,56 @@
+"""Unit tests for the stop-warm CLI command."""
+# tests/cli/test_stop_warm_cmd.py
+
+# Unit under test:
+import dem.cli.main as main
+import dem.core.commands.stop_warm_cmd as stop_warm_cmd
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock, call
+
+## Global test variables
+
+# In order to test stdout and stderr separately, the stderr can't be mixed into the stdout.
+runner = CliRunner(mix_stderr=False)
+
+## Test cases
+
+@patch("dem.core.commands.stop_warm_cmd.stderr.print")
+@patch("dem.core.commands.stop_warm_cmd.stdout.print")
+def test_stop_warm(mock_stdout_print: MagicMock, mock_stderr_print: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env"
+
+    mock_local_host = MagicMock()
+    mock_local_host.name = "local"
+    mock_local_host.container_engine.stop_warm_containers.return_value = 2
+    mock_remote_host1 = MagicMock()
+    mock_remote_host1.name = "test_remote1"
+    mock_remote_host1.container_engine.stop_warm_containers.return_value = 0
+    mock_remote_host2 = MagicMock()
+    mock_remote_host2.name = "test_remote2"
+    mock_remote_host2.container_engine.stop_warm_containers.side_effect = \
+        stop_warm_cmd.ContainerEngineError("test_error")
+
+    mock_platform = MagicMock()
+    mock_platform.hosts.local = mock_local_host
+    mock_platform.hosts.remotes = {
+        mock_remote_host1.name: mock_remote_host1,
+        mock_remote_host2.name: mock_remote_host2
+    }
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["stop-warm", test_dev_env_name])
+
+    # Check expectations
+    assert runner_result.exit_code == 0
+
+    for host in (mock_local_host, mock_remote_host1, mock_remote_host2):
+        host.container_engine.stop_warm_containers.assert_called_once_with(test_dev_env_name)
+    mock_stdout_print.assert_has_calls([
+        call("[green]Stopped 2 warm container(s) on host local.[/]"),
+        call("No warm containers on host test_remote1."),
+    ])
+    mock_stderr_print.assert_called_once_with("[red]Error: Unable to stop the warm containers on host test_remote2: Container engine error: test_error[/]")
@@ -42,6 +42,55 @@ def test_PullProgressBar__update_progress_bar():
                                                               total=float(test_total),
                                                               completed=float(test_current))
 
+def test_PullProgressBar__update_progress_bar_multiple_images():
+    # Test setup
+    test_layer_id = "test_layer_id"
+    test_items = [
+        {
+            "image": f"test_image{i}:latest",
+            "progressDetail": {
+                "current": 10,
+                "total": 100,
+            }
+        } for i in range(2)
+    ]
+    test_status = "Downloading"
+
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
+    pull_progress_bar.progress = MagicMock()
+    pull_progress_bar.progress.add_task.side_effect = [0, 1]
+
+    # Run unit under test
+    for test_item in test_items:
+        pull_progress_bar._update_progress_bar(test_layer_id, test_item, test_status)
+
+    # Check expectations
+    assert pull_progress_bar.tasks == {
+        ("test_image0:latest", test_layer_id): 0,
+        ("test_image1:latest", test_layer_id): 1,
+    }
+
+    pull_progress_bar.progress.add_task.assert_has_calls([
+        call(f"test_image0:latest {test_layer_id}", id=f"test_image0:latest {test_layer_id}"),
+        call(f"test_image1:latest {test_layer_id}", id=f"test_image1:latest {test_layer_id}"),
+    ])
+
+def test_PullProgressBar__process_image_prefix():
+    # Test setup
+    test_item = {
+        "status": "Status: Downloaded newer image",
+        "image": "test_image:latest",
+    }
+
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
+    pull_progress_bar.progress = MagicMock()
+
+    # Run unit under test
+    pull_progress_bar._process(test_item)
+
+    # Check expectations
+    pull_progress_bar.progress.console.print.assert_called_once_with("test_image:latest: Status: Downloaded newer image")
+
 @patch.object(tui_user_output.PullProgressBar, "_update_progress_bar")
 def test_PullProgressBar__process(mock__update_progress_bar):
     # Test setup
@@ -172,6 +221,29 @@ def test_TUIUserOutput_msg_is_title(mock_stdout_rule: MagicMock):
     # Check expectations
     mock_stdout_rule.assert_called_once_with(test_text)
 
+@patch("dem.cli.tui.tui_user_output.stderr")
+@patch("dem.cli.tui.tui_user_output.stdout")
+def test_TUIUserOutput_raw_output(mock_stdout: MagicMock, mock_stderr: MagicMock):
+    # Test setup
+    test_stdout_data = b"[red]not markup[/]\n"
+    test_stderr_data = b"error\n"
+
+    test_tui_user_output = tui_user_output.TUIUserOutput()
+
+    # Run unit under test
+    test_tui_user_output.raw_output(test_stdout_data)
+    test_tui_user_output.raw_output(test_stderr_data, True)
+
+    # Check expectations
+    mock_stdout.file.flush.assert_called_once()
+    mock_stdout.file.buffer.write.assert_called_once_with(test_stdout_data)
+    mock_stdout.file.buffer.flush.assert_called_once()
+    mock_stdout.print.assert_not_called()
+    mock_stderr.file.flush.assert_called_once()
+    mock_stderr.file.buffer.write.assert_called_once_with(test_stderr_data)
+    mock_stderr.file.buffer.flush.assert_called_once()
+    mock_stderr.print.assert_not_called()
+
 @patch("dem.cli.tui.tui_user_output.stderr.print")
 def test_TUIUserOutput_error(mock_stderr_print: MagicMock):
     # Test setup
@@ -0,0 +1,45 @@
+"""Unit tests for the API server."""
+# tests/core/test_api_server.py
+
+# Unit under test:
+import dem.core.api_server as api_server
+
+# Test framework
+import asyncio
+from unittest.mock import patch, MagicMock
+
+@patch("dem.core.api_server.uvicorn.Config")
+def test_APIServer(mock_Config: MagicMock) -> None:
+    # Test setup
+    mock_app = MagicMock()
+
+    # Run unit under test
+    test_api_server = api_server.APIServer(mock_app, "127.0.0.1", 8080, 8, 0, 10, 30)
+
+    # Check expectations
+    assert test_api_server.host == "127.0.0.1"
+    assert test_api_server.port == 8080
+    assert test_api_server.server.threadpool_size == 8
+
+    mock_Config.assert_called_once_with(mock_app, host="127.0.0.1", port=8080, log_level="info",
+                                        limit_concurrency=None, timeout_keep_alive=10,
+                                        timeout_graceful_shutdown=30)
+
+@patch("dem.core.api_server.uvicorn.Server.serve")
+def test_APIServer_threadpool_size(mock_serve: MagicMock) -> None:
+    # Test setup
+    test_api_server = api_server.APIServer(MagicMock(), threadpool_size=8,
+                                           max_concurrent_requests=100)
+    actual_total_tokens = []
+
+    async def serve(sockets=None) -> None:
+        actual_total_tokens.append(
+            api_server.anyio.to_thread.current_default_thread_limiter().total_tokens)
+    mock_serve.side_effect = serve
+
+    # Run unit under test
+    asyncio.run(test_api_server.server.serve())
+
+    # Check expectations
+    assert actual_total_tokens == [8]
+    assert test_api_server.server.config.limit_concurrency == 100
@@ -7,23 +7,328 @@ import dem.core.container_engine as container_engine
 # Test framework
 import pytest
 from unittest.mock import patch, MagicMock, call
-
-class mockImage:
-    def __init__(self, tags: list[str]) -> None:
-        self.tags = tags
+from queue import Queue
 
 def _get_test_image_tags_as_images(test_image_tags):
-    test_images = []
-    for test_image_tag in test_image_tags:
-        test_images.append(mockImage(test_image_tag))
-    return test_images
+    return [{"Id": f"sha256:{i}", "RepoTags": test_image_tag} 
+            for i, test_image_tag in enumerate(test_image_tags)]
 
-@patch("docker.from_env")
-def test_get_local_tool_images(mock_docker_from_env):
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_caches_api_version(mock_DockerClient: MagicMock, mock_host_metadata_json: MagicMock,
+                                  mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_host:2375"
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.api_version = "1.43"
+    mock_DockerClient.return_value = mock_docker_client
+    mock_host_metadata_json.get_entry.return_value = {}
+
+    test_container_engine1 = container_engine.ContainerEngine(test_url)
+    test_container_engine2 = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    test_container_engine1.get_local_tool_images()
+    test_container_engine1.start()
+    test_container_engine2.start()
+
+    # Check expectations
+    assert container_engine.ContainerEngine._api_versions[test_url] == "1.43"
+    assert mock_DockerClient.call_args_list == [call(base_url=test_url, version="auto"), 
+                                                call(base_url=test_url, version="1.43")]
+
+    mock_host_metadata_json.get_entry.assert_called_with(test_url)
+    assert mock__refresh_host_metadata.call_count == 2
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_with_cached_host_metadata(mock_DockerClient: MagicMock, 
+                                         mock_host_metadata_json: MagicMock,
+                                         mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_cached_host:2375"
+    mock_DockerClient.return_value.api.api_version = "1.41"
+    mock_host_metadata_json.get_entry.return_value = {
+        "api_version": "1.41",
+        "last_seen": container_engine.time.time()
+    }
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    test_container_engine.start()
+
+    # Check expectations
+    mock_DockerClient.assert_called_once_with(base_url=test_url, version="1.41")
+    mock__refresh_host_metadata.assert_not_called()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_with_outdated_host_metadata(mock_DockerClient: MagicMock, 
+                                           mock_host_metadata_json: MagicMock,
+                                           mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_outdated_host:2375"
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.api_version = "1.45"
+    mock_DockerClient.side_effect = [container_engine.docker.errors.DockerException("test_error"),
+                                     mock_docker_client]
+    mock_host_metadata_json.get_entry.return_value = {
+        "api_version": "1.41",
+        "last_seen": 0
+    }
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    test_container_engine.start()
+
+    # Check expectations
+    assert test_container_engine._docker_client is mock_docker_client
+    assert container_engine.ContainerEngine._api_versions[test_url] == "1.45"
+
+    assert mock_DockerClient.call_args_list == [call(base_url=test_url, version="1.41"), 
+                                                call(base_url=test_url, version="auto")]
+    mock__refresh_host_metadata.assert_called_once()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_DockerException(mock_DockerClient: MagicMock, 
+                               mock_host_metadata_json: MagicMock) -> None:
+    # Test setup
+    mock_DockerClient.side_effect = container_engine.docker.errors.DockerException("test_error")
+    mock_host_metadata_json.get_entry.return_value = {}
+
+    test_container_engine = container_engine.ContainerEngine("tcp://test_unavailable_host:2375")
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Unable to connect to the Docker Engine: test_error"
+    assert "tcp://test_unavailable_host:2375" not in container_engine.ContainerEngine._api_versions
+
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_refresh_host_metadata(mock_DockerClient: MagicMock, 
+                               mock_host_metadata_json: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_downgraded_host:2375"
+    test_host_metadata = {}
+    mock_host_metadata_json.get_entry.return_value = test_host_metadata
+
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.api_version = "1.45"
+    mock_docker_client.api.version.return_value = {
+        "ApiVersion": "1.41",
+        "Version": "20.10.24",
+        "Os": "linux",
+        "Arch": "arm64"
+    }
+    mock_new_docker_client = MagicMock()
+    mock_new_docker_client.api.api_version = "1.41"
+    mock_DockerClient.return_value = mock_new_docker_client
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    test_container_engine._refresh_host_metadata()
+
+    # Check expectations
+    assert test_container_engine._docker_client is mock_new_docker_client
+    assert container_engine.ContainerEngine._api_versions[test_url] == "1.41"
+    assert test_host_metadata["api_version"] == "1.41"
+    assert test_host_metadata["engine_version"] == "20.10.24"
+    assert test_host_metadata["os"] == "linux"
+    assert test_host_metadata["arch"] == "arm64"
+    assert test_host_metadata["last_seen"] > 0
+
+    mock_docker_client.api.version.assert_called_once_with(api_version=False)
+    mock_DockerClient.assert_called_once_with(base_url=test_url, version="1.41")
+    mock_host_metadata_json.flush.assert_called_once()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_saves_host_metadata(mock_DockerClient: MagicMock, 
+                                   mock_host_metadata_json: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_new_host:2375"
+    test_host_metadata = {}
+    mock_host_metadata_json.get_entry.return_value = test_host_metadata
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    mock_negotiated_docker_client = MagicMock()
+    mock_negotiated_docker_client.api.api_version = "1.45"
+    mock_negotiated_docker_client.api.version.return_value = {
+        "ApiVersion": "1.41",
+        "Version": "20.10.24",
+        "Os": "linux",
+        "Arch": "amd64"
+    }
+    mock_downgraded_docker_client = MagicMock()
+    mock_downgraded_docker_client.api.api_version = "1.41"
+    test_lock_held = []
+    def create_docker_client(base_url: str, version: str) -> MagicMock:
+        test_lock_held.append(test_container_engine._start_lock.locked())
+        if version == "auto":
+            return mock_negotiated_docker_client
+        return mock_downgraded_docker_client
+    mock_DockerClient.side_effect = create_docker_client
+
+    # Run unit under test
+    test_container_engine.start()
+
+    # Check expectations
+    assert test_container_engine._docker_client is mock_downgraded_docker_client
+    assert test_lock_held == [True, True]
+    assert test_host_metadata["api_version"] == "1.41"
+    assert test_host_metadata["engine_version"] == "20.10.24"
+
+    assert mock_DockerClient.call_args_list == [call(base_url=test_url, version="auto"), 
+                                                call(base_url=test_url, version="1.41")]
+    mock_host_metadata_json.flush.assert_called_once()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_pinned_version_unreachable_engine(mock_DockerClient: MagicMock, 
+                                           mock_host_metadata_json: MagicMock,
+                                           mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_pinned_down_host:2375"
+    test_host_metadata = {
+        "api_version": "1.41",
+        "last_seen": container_engine.time.time()
+    }
+    mock_host_metadata_json.get_entry.return_value = test_host_metadata
+    mock_pinned_docker_client = MagicMock()
+    mock_pinned_docker_client.api.api_version = "1.41"
+    mock_pinned_docker_client.api.images.side_effect = \
+        container_engine.requests.exceptions.ConnectionError("test_connection_error")
+    # Negotiating the version needs the engine.
+    mock_DockerClient.side_effect = [mock_pinned_docker_client, 
+                                     container_engine.docker.errors.DockerException("test_error")]
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Unable to connect to the Docker Engine: test_error"
+    assert mock_DockerClient.call_args_list == [call(base_url=test_url, version="1.41"), 
+                                                call(base_url=test_url, version="auto")]
+    assert test_url not in container_engine.ContainerEngine._api_versions
+    assert "api_version" not in test_host_metadata
+
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_pinned_version_refused(mock_DockerClient: MagicMock, mock_host_metadata_json: MagicMock,
+                                mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_pinned_downgraded_host:2375"
+    mock_host_metadata_json.get_entry.return_value = {
+        "api_version": "1.45",
+        "last_seen": container_engine.time.time()
+    }
+    mock_response = MagicMock()
+    mock_response.status_code = 400
+    mock_pinned_docker_client = MagicMock()
+    mock_pinned_docker_client.api.api_version = "1.45"
+    mock_pinned_docker_client.api.images.side_effect = container_engine.docker.errors.APIError(
+        "test_error", response=mock_response, 
+        explanation="client version 1.45 is too new. Maximum supported API version is 1.41")
+    mock_negotiated_docker_client = MagicMock()
+    mock_negotiated_docker_client.api.api_version = "1.41"
+    mock_negotiated_docker_client.api.images.return_value = [{"Id": "sha256:0", 
+                                                              "RepoTags": ["test:latest"]}]
+    mock_DockerClient.side_effect = [mock_pinned_docker_client, mock_negotiated_docker_client]
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    actual_tool_images = test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert actual_tool_images == ["test:latest"]
+    assert test_container_engine._docker_client is mock_negotiated_docker_client
+    assert container_engine.ContainerEngine._api_versions[test_url] == "1.41"
+    assert mock_DockerClient.call_args_list == [call(base_url=test_url, version="1.45"), 
+                                                call(base_url=test_url, version="auto")]
+    mock__refresh_host_metadata.assert_called_once()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+@patch.object(container_engine.ContainerEngine, "_refresh_host_metadata")
+@patch.object(container_engine.ContainerEngine, "host_metadata_json")
+@patch("dem.core.container_engine.DockerClient")
+def test_start_check_connection(mock_DockerClient: MagicMock, mock_host_metadata_json: MagicMock,
+                                mock__refresh_host_metadata: MagicMock) -> None:
+    # Test setup
+    test_url = "tcp://test_pinned_checked_host:2375"
+    mock_host_metadata_json.get_entry.return_value = {
+        "api_version": "1.41",
+        "last_seen": container_engine.time.time()
+    }
+    mock_pinned_docker_client = MagicMock()
+    mock_pinned_docker_client.api.api_version = "1.41"
+    mock_pinned_docker_client.ping.side_effect = \
+        container_engine.requests.exceptions.ConnectionError("test_connection_error")
+    mock_DockerClient.side_effect = [mock_pinned_docker_client, 
+                                     container_engine.docker.errors.DockerException("test_error")]
+
+    test_container_engine = container_engine.ContainerEngine(test_url)
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError):
+        test_container_engine.start(check_connection=True)
+
+    # Check expectations
+    mock_pinned_docker_client.ping.assert_called_once()
+
+    container_engine.ContainerEngine._api_versions.pop(test_url, None)
+
+def test_negotiated_version_unreachable_engine() -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.images.side_effect = \
+        container_engine.requests.exceptions.ConnectionError("test_connection_error")
+    test_container_engine = container_engine.ContainerEngine("tcp://test_down_host:2375")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_local_tool_images()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Unable to connect to the Docker Engine: test_connection_error"
+    mock_docker_client.api.images.assert_called_once()
+
+def test_get_local_tool_images():
     # Test setup
     test_image_tags = [
     ["alpine:latest"],
-    [""],
+    None,
+    ["<none>:<none>"],
     ["axemsolutions/make_gnu_arm:v1.0.0"],
     ["axemsolutions/stlink_org:latest", "axemsolutions/stlink_org:v1.0.0"],
     ["axemsolutions/cpputest:latest"],
@@ -31,53 +336,168 @@ def test_get_local_tool_images(mock_docker_from_env):
     ["debian:latest"],
     ["ubuntu:latest"],
     ["hello-world:latest"],
-    [""],
+    [],
     ]
     expected_image_tags = [
     "alpine:latest",
-    "axemsolutions/make_gnu_arm:v1.0.0",
-    "axemsolutions/stlink_org:latest", 
-    "axemsolutions/stlink_org:v1.0.0",
     "axemsolutions/cpputest:latest",
     "axemsolutions/make_gnu_arm:latest", 
     "axemsolutions/make_gnu_arm:v0.1.0", 
+    "axemsolutions/make_gnu_arm:v1.0.0",
     "axemsolutions/make_gnu_arm:v1.1.0",
+    "axemsolutions/stlink_org:latest", 
+    "axemsolutions/stlink_org:v1.0.0",
     "debian:latest",
-    "ubuntu:latest",
     "hello-world:latest",
+    "ubuntu:latest",
     ]
     mock_docker_client = MagicMock()
-    mock_docker_client.images.list.return_value = _get_test_image_tags_as_images(test_image_tags)
-    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.images.return_value = _get_test_image_tags_as_images(test_image_tags)
+
+    container_engine_obj = container_engine.ContainerEngine("test_url")
+    container_engine_obj._docker_client = mock_docker_client
 
     # Run unit under test
-    container_engine_obj = container_engine.ContainerEngine()
     actual_image_tags = container_engine_obj.get_local_tool_images()
 
     # Check expectations
     assert expected_image_tags == actual_image_tags
 
-    mock_docker_from_env.assert_called_once()
-    mock_docker_client.images.list.assert_called_once()
+    mock_docker_client.api.images.assert_called_once_with(filters=None)
+    mock_docker_client.images.list.assert_not_called()
 
-@patch("docker.from_env")
-def test_get_local_tool_images_when_none_available(mock_docker_from_env):
+def test_get_local_tool_images_when_none_available():
     # Test setup
-    test_image_tags = []
-    expected_image_tags = []
     fake_docker_client = MagicMock()
-    mock_docker_from_env.return_value = fake_docker_client
-    fake_docker_client.images.list.return_value = _get_test_image_tags_as_images(test_image_tags)
+    fake_docker_client.api.images.return_value = _get_test_image_tags_as_images([])
+
+    container_engine_obj = container_engine.ContainerEngine("test_url")
+    container_engine_obj._docker_client = fake_docker_client
 
     # Run unit under test
-    container_engine_obj = container_engine.ContainerEngine()
     actual_image_tags = container_engine_obj.get_local_tool_images()
 
     # Check expectations
-    assert expected_image_tags == actual_image_tags
+    assert [] == actual_image_tags
 
-    mock_docker_from_env.assert_called_once()
-    fake_docker_client.images.list.assert_called_once()
+    fake_docker_client.api.images.assert_called_once_with(filters=None)
+
+def test__list_local_images():
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.images.return_value = _get_test_image_tags_as_images([
+        ["axemsolutions/cpputest:latest", "axemsolutions/cpputest:v1.0.0"],
+        ["<none>:<none>"],
+        None
+    ])
+
+    test_container_engine = container_engine.ContainerEngine("test_url")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_local_images = test_container_engine._list_local_images()
+
+    # Check expectations
+    assert actual_local_images == {
+        "axemsolutions/cpputest:latest": "sha256:0", 
+        "axemsolutions/cpputest:v1.0.0": "sha256:0"
+    }
+    assert test_container_engine._local_image_ids is None
+
+    mock_docker_client.api.images.assert_called_once_with(filters=None)
+
+@patch.object(container_engine.Core, "user_output")
+def test_is_image_local_uses_image_index(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.images.side_effect = [
+        _get_test_image_tags_as_images([["test_image:latest", "test_image:v1.0.0"]]),
+        _get_test_image_tags_as_images([["test_image:latest", "test_image:v1.0.0"], 
+                                        ["test_pulled_image:latest"]]),
+        _get_test_image_tags_as_images([["test_pulled_image:latest"]]),
+    ]
+
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
+
+    test_container_engine = container_engine.ContainerEngine("test_url")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_before_pull = [test_container_engine.is_image_local("test_image:latest"),
+                          test_container_engine.is_image_local("test_image:v1.0.0"),
+                          test_container_engine.is_image_local("test_pulled_image:latest")]
+    test_container_engine.pull("test_pulled_image:latest")
+    actual_after_pull = test_container_engine.is_image_local("test_pulled_image:latest")
+    test_container_engine.remove("test_image:latest")
+    actual_after_remove = test_container_engine.is_image_local("test_image:latest")
+
+    # Check expectations
+    assert actual_before_pull == [True, True, False]
+    assert actual_after_pull is True
+    assert actual_after_remove is False
+
+    assert mock_docker_client.api.images.call_count == 3
+
+def test_is_image_up_to_date():
+    # Test setup
+    test_image = "test_image:latest"
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.inspect_image.return_value = {
+        "RepoDigests": ["test_image@sha256:test_local_digest"]
+    }
+    mock_docker_client.api.inspect_distribution.side_effect = [
+        {"Descriptor": {"digest": "sha256:test_local_digest"}},
+        {"Descriptor": {"digest": "sha256:test_remote_digest"}},
+        container_engine.docker.errors.APIError("test_error"),
+    ]
+
+    test_container_engine = container_engine.ContainerEngine("test_url")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_results = [test_container_engine.is_image_up_to_date(test_image) for _ in range(3)]
+
+    # Check expectations
+    assert actual_results == [True, False, True]
+
+    mock_docker_client.api.inspect_image.assert_called_with(test_image)
+    mock_docker_client.api.inspect_distribution.assert_called_with(test_image)
+
+def test_pull_stream():
+    # Test setup
+    test_items = [{"status": "Pulling fs layer", "id": "test_layer"}, 
+                  {"status": "Status: Downloaded newer image"}]
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.pull.return_value = iter(test_items)
+
+    test_container_engine = container_engine.ContainerEngine("test_url")
+    test_container_engine._docker_client = mock_docker_client
+    test_container_engine._local_image_ids = {}
+
+    # Run unit under test
+    actual_items = list(test_container_engine.pull_stream("test_image:latest"))
+
+    # Check expectations
+    assert actual_items == test_items
+    assert test_container_engine._local_image_ids is None
+
+    mock_docker_client.api.pull.assert_called_once_with("test_image:latest", stream=True, 
+                                                        decode=True)
+
+def test_pull_stream_error():
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.pull.return_value = iter([{"error": "test_error"}])
+
+    test_container_engine = container_engine.ContainerEngine("test_url")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        list(test_container_engine.pull_stream("test_image:latest"))
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Failed to pull test_image:latest: test_error"
 
 @patch.object(container_engine.Core, "user_output")
 @patch("dem.core.container_engine.docker.from_env")
@@ -238,6 +658,472 @@ def test_run_StopIteration(mock_from_env):
         # Check expectations
         assert str(exported_exception_info) =="Invalid input parameter!"
 
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_raw_output(mock_user_output: MagicMock) -> None:
+    # Test setup
+    test_image = "test_image"
+    test_command = "test_command"
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.return_value = [
+        (b"[bold]line1[/]\n", None),
+        (b"line2\n", None),
+        (None, b"error1\n"),
+        (b"line3\n", None),
+    ]
+    mock_container.wait.return_value = {"StatusCode": 0}
+    mock_container.stats.return_value = []
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_result = test_container_engine.run(test_image, test_command, remove=True, name="test_name")
+
+    # Check expectations
+    mock_docker_client.containers.run.assert_called_once_with(test_image, test_command, detach=True,
+                                                              stdout=True, stderr=True, 
+                                                              name="test_name")
+    mock_container.attach.assert_called_once_with(stdout=True, stderr=True, stream=True, 
+                                                  logs=True, demux=True)
+    # The markup is not interpreted and the output of each stream is kept in order.
+    actual_stdout = b"".join(data for data, is_stderr in 
+                             (c.args for c in mock_user_output.raw_output.call_args_list) 
+                             if not is_stderr)
+    actual_stderr = b"".join(data for data, is_stderr in 
+                             (c.args for c in mock_user_output.raw_output.call_args_list) 
+                             if is_stderr)
+    assert actual_stdout == b"[bold]line1[/]\nline2\nline3\n"
+    assert actual_stderr == b"error1\n"
+    mock_user_output.msg.assert_not_called()
+    mock_container.wait.assert_called_once_with()
+    mock_container.remove.assert_called_once()
+
+    assert actual_result.exit_code == 0
+    assert actual_result.output_size == len(b"[bold]line1[/]\nline2\nerror1\nline3\n")
+    assert actual_result.duration_s >= 0
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_log_prefix(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    # The lines can be split between the frames.
+    mock_container.attach.return_value = [
+        (b"line1\nli", None),
+        (b"ne2\nline3", None),
+    ]
+    mock_container.wait.return_value = {"StatusCode": 0}
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    test_container_engine.run("test_image", "test_command", remove=False, log_prefix="task | ")
+
+    # Check expectations
+    actual_stdout = b"".join(c.args[0] for c in mock_user_output.raw_output.call_args_list)
+    assert actual_stdout == b"task | line1\ntask | line2\ntask | line3\n"
+    mock_container.remove.assert_not_called()
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_exit_code(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.return_value = []
+    mock_container.wait.return_value = {"StatusCode": 2}
+    test_memory_usages = [100, 300, 200]
+    mock_container.stats.return_value = [{"memory_stats": {"usage": usage}} 
+                                         for usage in test_memory_usages]
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_result = test_container_engine.run("test_image", "test_command", remove=False)
+
+    # Check expectations
+    assert actual_result.exit_code == 2
+    assert actual_result.output_size == 0
+    assert actual_result.memory_peak in (None, 100, 300)
+    assert actual_result.to_dict() == {
+        "exit_code": 2,
+        "duration_s": actual_result.duration_s,
+        "output_size": 0,
+        "memory_peak": actual_result.memory_peak
+    }
+    mock_container.stats.assert_called_once_with(stream=True, decode=True)
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_stream_error(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.side_effect = container_engine.docker.errors.APIError("test_error")
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.run("test_image", "test_command")
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Failed to stream the output of the container: test_error"
+    mock_container.remove.assert_called_once_with(force=True)
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_wait_error(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.return_value = []
+    mock_container.wait.side_effect = container_engine.docker.errors.APIError("test_error")
+    mock_container.remove.side_effect = container_engine.docker.errors.APIError("test_remove")
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.run("test_image", "test_command")
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Failed to wait for the container: test_error"
+    mock_container.remove.assert_called_once_with(force=True)
+
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_stream_error_no_remove(mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container = MagicMock()
+    mock_docker_client.containers.run.return_value = mock_container
+    mock_container.attach.side_effect = container_engine.docker.errors.APIError("test_error")
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError):
+        test_container_engine.run("test_image", "test_command", remove=False)
+
+    # Check expectations
+    mock_container.remove.assert_not_called()
+
+@patch.object(container_engine.ContainerEngine, "config_file")
+def test__get_warm_container_reuse(mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_unhealthy_container = MagicMock()
+    mock_unhealthy_container.exec_run.side_effect = container_engine.docker.errors.APIError("test")
+    mock_healthy_container = MagicMock()
+    mock_healthy_container.exec_run.return_value.exit_code = 0
+    mock_docker_client.containers.list.return_value = [mock_unhealthy_container, 
+                                                       mock_healthy_container]
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_container = test_container_engine._get_warm_container("test_image", "test_dev_env", 
+                                                                 None)
+
+    # Check expectations
+    assert actual_container is mock_healthy_container
+    mock_docker_client.containers.list.assert_called_once_with(filters={
+        "label": ["dem.warm=true", "dem.warm.dev_env=test_dev_env", "dem.warm.image=test_image", 
+                  "dem.warm.network=", "dem.warm.entrypoint"],
+        "status": "running"
+    })
+    mock_unhealthy_container.remove.assert_called_once_with(force=True)
+    mock_healthy_container.exec_run.assert_called_once_with(["/bin/sh", "-c", "touch /tmp/.dem_warm"])
+    mock_healthy_container.remove.assert_not_called()
+    mock_docker_client.containers.run.assert_not_called()
+
+@patch.object(container_engine.ContainerEngine, "config_file")
+def test__get_warm_container_create(mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.warm_container_idle_timeout_s = 60
+    mock_docker_client = MagicMock()
+    mock_docker_client.containers.list.return_value = []
+    mock_docker_client.images.get.side_effect = container_engine.docker.errors.ImageNotFound("test")
+    mock_docker_client.images.pull.return_value.attrs = {
+        "Config": {
+            "Entrypoint": ["/entrypoint.sh"]
+        }
+    }
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_container = test_container_engine._get_warm_container("test_image", "test_dev_env", 
+                                                                 "test_network")
+
+    # Check expectations
+    assert actual_container is mock_docker_client.containers.run.return_value
+    mock_docker_client.containers.run.assert_called_once()
+    args, kwargs = mock_docker_client.containers.run.call_args
+    assert args[0] == "test_image"
+    assert "-lt 60 ]" in args[1][0]
+    assert kwargs == {
+        "entrypoint": ["/bin/sh", "-c"],
+        "detach": True,
+        "auto_remove": True,
+        "labels": {
+            "dem.warm": "true",
+            "dem.warm.dev_env": "test_dev_env",
+            "dem.warm.image": "test_image",
+            "dem.warm.network": "test_network",
+            "dem.warm.entrypoint": "[\"/entrypoint.sh\"]"
+        },
+        "network": "test_network"
+    }
+    mock_docker_client.images.get.assert_called_once_with("test_image")
+    mock_docker_client.images.pull.assert_called_once_with("test_image")
+
+@patch.object(container_engine.ContainerEngine, "_get_warm_container")
+@patch.object(container_engine.ContainerEngine, "user_output")
+def test_run_warm(mock_user_output: MagicMock, mock__get_warm_container: MagicMock) -> None:
+    # Test setup
+    test_command = "make \"all\""
+    mock_docker_client = MagicMock()
+    mock_api = mock_docker_client.api
+    mock_api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_api.exec_start.return_value = [(b"output\n", None)]
+    mock_api.exec_inspect.return_value = {"ExitCode": 1}
+    mock__get_warm_container.return_value.labels = {"dem.warm.entrypoint": "[\"/entrypoint.sh\"]"}
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_result = test_container_engine.run_warm("test_image", test_command, "test_dev_env",
+                                                   user="1000:1000", log_prefix="task | ")
+
+    # Check expectations
+    assert actual_result.exit_code == 1
+    assert actual_result.output_size == len(b"output\n")
+    assert actual_result.memory_peak is None
+
+    mock__get_warm_container.assert_called_once_with("test_image", "test_dev_env", None)
+    args, kwargs = mock_api.exec_create.call_args
+    assert args[0] is mock__get_warm_container.return_value.id
+    assert args[1][:3] == ["/entrypoint.sh", "/bin/bash", "-c"]
+    assert kwargs == {"user": "1000:1000", "environment": {"DEM_TASK_COMMAND": test_command}}
+    mock_api.exec_start.assert_called_once_with("test_exec_id", stream=True, demux=True)
+    mock_api.exec_inspect.assert_called_once_with("test_exec_id")
+    mock_user_output.raw_output.assert_called_once_with(b"task | output\n", False)
+
+def test_stop_warm_containers() -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_container1 = MagicMock()
+    mock_container2 = MagicMock()
+    mock_container2.remove.side_effect = container_engine.docker.errors.NotFound("test")
+    mock_docker_client.containers.list.return_value = [mock_container1, mock_container2]
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    # Run unit under test
+    actual_removed = test_container_engine.stop_warm_containers("test_dev_env")
+
+    # Check expectations
+    assert actual_removed == 1
+    mock_docker_client.containers.list.assert_called_once_with(all=True, filters={
+        "label": ["dem.warm=true", "dem.warm.dev_env=test_dev_env"]
+    })
+    mock_container1.remove.assert_called_once_with(force=True)
+    mock_container2.remove.assert_called_once_with(force=True)
+
+class _StubEventStream():
+    """ Yield the queued events until closed, like the event stream of the Docker Engine."""
+    def __init__(self, events: list[dict]) -> None:
+        self.events: Queue = Queue()
+        for event in events:
+            self.events.put(event)
+        self.closed = False
+
+    def __iter__(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        self.closed = True
+        self.events.put(None)
+
+def test_event_listener() -> None:
+    # Test setup
+    test_event = {"Type": "image", "Action": "pull", "Actor": {"ID": "test_image:latest"}}
+    test_stream = _StubEventStream([test_event])
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.events.return_value = test_stream
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+    test_container_engine._local_image_ids = {"test_image:latest": "sha256:test"}
+
+    actual_events = Queue()
+
+    # Run unit under test
+    test_container_engine.add_event_listener(actual_events.put)
+    actual_first_event = actual_events.get(timeout=5)
+    actual_second_event = actual_events.get(timeout=5)
+    test_container_engine.remove_event_listener(actual_events.put)
+
+    # Check expectations
+    assert actual_first_event == {}
+    assert actual_second_event == test_event
+    assert test_container_engine._local_image_ids is None
+    assert test_stream.closed is True
+    assert test_container_engine._events_thread is None
+
+    mock_docker_client.api.events.assert_called_once_with(decode=True, filters={
+        "type": ["image", "container"],
+        "event": ["delete", "die", "import", "load", "pull", "tag", "untag"]
+    })
+
+def test__update_image_index() -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.inspect_image.side_effect = [
+        {"Id": "sha256:new", "RepoTags": ["test_image:latest", "test_image:v2"]},
+        {"Id": "sha256:old", "RepoTags": []},
+    ]
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+    test_container_engine._local_image_ids = {
+        "test_image:latest": "sha256:old",
+        "test_image:v1": "sha256:old",
+        "other_image:latest": "sha256:other"
+    }
+
+    # Run unit under test
+    test_container_engine._update_image_index({"Type": "image", "Action": "pull", 
+                                               "Actor": {"ID": "test_image:latest"}})
+    actual_after_pull = dict(test_container_engine._local_image_ids)
+    test_container_engine._update_image_index({"Type": "image", "Action": "untag", 
+                                               "Actor": {"ID": "sha256:old"}})
+    actual_after_untag = dict(test_container_engine._local_image_ids)
+    test_container_engine._update_image_index({"Type": "image", "Action": "delete", 
+                                               "Actor": {"ID": "sha256:other"}})
+
+    # Check expectations
+    assert actual_after_pull == {
+        "test_image:latest": "sha256:new",
+        "test_image:v2": "sha256:new",
+        "test_image:v1": "sha256:old",
+        "other_image:latest": "sha256:other"
+    }
+    assert actual_after_untag == {
+        "test_image:latest": "sha256:new",
+        "test_image:v2": "sha256:new",
+        "other_image:latest": "sha256:other"
+    }
+    assert test_container_engine._local_image_ids == {
+        "test_image:latest": "sha256:new",
+        "test_image:v2": "sha256:new"
+    }
+    assert test_container_engine.is_image_local("test_image:v2") is True
+    mock_docker_client.api.images.assert_not_called()
+    mock_docker_client.api.inspect_image.assert_has_calls([call("test_image:latest"), 
+                                                           call("sha256:old")])
+
+def test__update_image_index_not_found() -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.inspect_image.side_effect = \
+        container_engine.docker.errors.NotFound("test")
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+    test_container_engine._local_image_ids = {"test_image:latest": "sha256:test"}
+
+    # Run unit under test
+    test_container_engine._update_image_index({"Type": "image", "Action": "tag", 
+                                               "Actor": {"ID": "sha256:test"}})
+
+    # Check expectations
+    assert test_container_engine._local_image_ids == {}
+
+def test__update_image_index_unknown_action() -> None:
+    # Test setup
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = MagicMock()
+    test_container_engine._local_image_ids = {"test_image:latest": "sha256:test"}
+
+    # Run unit under test
+    test_container_engine._update_image_index({"Type": "image", "Action": "prune", 
+                                               "Actor": {"ID": ""}})
+
+    # Check expectations
+    assert test_container_engine._local_image_ids is None
+
+def test_event_listener_container_die() -> None:
+    # Test setup
+    test_event = {"Type": "container", "Action": "die", "Actor": {"ID": "test_container_id"}}
+    test_stream = _StubEventStream([])
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.events.return_value = test_stream
+    mock_container = MagicMock()
+    mock_container.id = "test_container_id"
+    mock_docker_client.containers.list.return_value = [mock_container]
+    mock_container.exec_run.return_value.exit_code = 0
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+
+    actual_events = Queue()
+    test_container_engine.add_event_listener(actual_events.put)
+    assert actual_events.get(timeout=5) == {}
+
+    # Run unit under test
+    actual_first = test_container_engine._get_warm_container("test_image", "test_dev_env", None)
+    actual_remembered = test_container_engine._get_warm_container("test_image", "test_dev_env", None)
+    test_stream.events.put(test_event)
+    assert actual_events.get(timeout=5) == test_event
+    actual_after_die = test_container_engine._get_warm_container("test_image", "test_dev_env", None)
+    test_container_engine.remove_event_listener(actual_events.put)
+
+    # Check expectations
+    assert actual_first is mock_container
+    assert actual_remembered is mock_container
+    assert actual_after_die is mock_container
+    assert mock_docker_client.containers.list.call_count == 2
+
+def test_event_listener_reconnect() -> None:
+    # Test setup
+    test_stream = _StubEventStream([])
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.events.side_effect = [container_engine.docker.errors.APIError("test"),
+                                                 test_stream]
+
+    test_container_engine = container_engine.ContainerEngine("unix://test")
+    test_container_engine._docker_client = mock_docker_client
+    test_container_engine._events_retry_interval_s = 0
+
+    actual_events = Queue()
+
+    # Run unit under test
+    test_container_engine.add_event_listener(actual_events.put)
+    actual_event = actual_events.get(timeout=5)
+    test_container_engine.remove_event_listener(actual_events.put)
+
+    # Check expectations
+    assert actual_event == {}
+    assert mock_docker_client.api.events.call_count == 2
+
 @patch.object(container_engine.ContainerEngine, "user_output")
 @patch("docker.from_env")
 def test_remove(mock_from_env: MagicMock, mock_user_output: MagicMock) -> None:
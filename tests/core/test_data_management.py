@@ -9,17 +9,21 @@ from unittest.mock import patch, MagicMock, call
 import pytest
 
 import json.decoder
+import os
+
+from dem.core.exceptions import DataStorageConflictError
 
 ## Test cases
 
 @patch("dem.core.data_management.open")
-@patch("dem.core.data_management.json.load")
-def test_BaseJSON_update(mock_json_load: MagicMock, mock_open: MagicMock) -> None:
+@patch("dem.core.data_management.json.loads")
+def test_BaseJSON_update(mock_json_loads: MagicMock, mock_open: MagicMock) -> None:
     # Test setup
     fake_opened_file = MagicMock()
+    fake_opened_file.read.return_value = "test_content"
     mock_open.return_value = fake_opened_file
     expected_deserialized_json = MagicMock()
-    mock_json_load.return_value = expected_deserialized_json
+    mock_json_loads.return_value = expected_deserialized_json
 
     test_path = "test_path"
     data_management.BaseJSON._path = test_path
@@ -30,11 +34,13 @@ def test_BaseJSON_update(mock_json_load: MagicMock, mock_open: MagicMock) -> Non
 
     # Check expectations
     mock_open.assert_called_once_with(test_path, "r")
-    mock_json_load.assert_called_once_with(fake_opened_file)
+    mock_json_loads.assert_called_once_with("test_content")
     fake_opened_file.close.assert_called_once()
 
     assert base_json.deserialized is expected_deserialized_json
+    assert base_json._content_hash == data_management.BaseJSON._hash("test_content")
 
+@patch.object(data_management.BaseJSON, "_write")
 @patch("dem.core.data_management.open")
 @patch("dem.core.data_management.json.loads")
 @patch("dem.core.data_management.os.path.exists")
@@ -42,10 +48,9 @@ def test_BaseJSON_update(mock_json_load: MagicMock, mock_open: MagicMock) -> Non
 def test_BaseJSON_update_FileNotFoundError(mock_os_makedirs: MagicMock, 
                                            mock_os_path_exists: MagicMock, 
                                            mock_json_loads: MagicMock, 
-                                           mock_open: MagicMock):
+                                           mock_open: MagicMock, mock_write: MagicMock):
     # Test setup
-    fake_opened_file = MagicMock()
-    mock_open.side_effect = [FileNotFoundError, fake_opened_file]
+    mock_open.side_effect = FileNotFoundError
     expected_deserialized_json = MagicMock()
     mock_json_loads.return_value = expected_deserialized_json
     mock_os_path_exists.return_value = False
@@ -58,14 +63,8 @@ def test_BaseJSON_update_FileNotFoundError(mock_os_makedirs: MagicMock,
     base_json.update()
    
     # Check expectations
-    calls = [
-        call(base_json._path, "r"),
-        call(base_json._path, "w"),
-    ]
-    mock_open.assert_has_calls(calls)
-    
-    fake_opened_file.write.assert_called_once_with(test_default_json)    
-    fake_opened_file.close.assert_called_once()
+    mock_open.assert_called_once_with(base_json._path, "r")
+    mock_write.assert_called_once_with(test_default_json)
   
     mock_os_path_exists.assert_called_once()
     mock_os_makedirs.assert_called_once_with(base_json._config_dir)
@@ -74,24 +73,284 @@ def test_BaseJSON_update_FileNotFoundError(mock_os_makedirs: MagicMock,
 
     assert base_json.deserialized is expected_deserialized_json
 
-@patch("dem.core.data_management.open")
-@patch("dem.core.data_management.json.dump")
-def test_BaseJSON_flush(mock_json_dump: MagicMock, mock_open: MagicMock) -> None:
+@patch.object(data_management.BaseJSON, "_write")
+def test_BaseJSON_flush(mock_write: MagicMock) -> None:
+    # Test setup
+    base_json = data_management.BaseJSON()
+    base_json.deserialized = {"test": [1, 2]}
+
+    # Run unit under test
+    base_json.flush()
+
+    # Check expectations
+    mock_write.assert_called_once_with(json.dumps({"test": [1, 2]}, indent=4))
+
+@patch.object(data_management.BaseJSON, "_write")
+def test_BaseJSON_flush_not_serializable(mock_write: MagicMock) -> None:
+    # Test setup
+    base_json = data_management.BaseJSON()
+    base_json.deserialized = {"test": object()}
+
+    with pytest.raises(TypeError):
+        # Run unit under test
+        base_json.flush()
+
+    # Check expectations
+    mock_write.assert_not_called()
+
+def test_BaseJSON_flush_unchanged(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text(json.dumps({"test": [1, 2]}, indent=4))
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+    base_json.update()
+
+    with patch.object(data_management.BaseJSON, "_write") as mock_write:
+        # Run unit under test
+        base_json.flush()
+        base_json.deserialized["test"].append(3)
+        base_json.flush()
+        base_json.flush()
+
+    # Check expectations
+    mock_write.assert_called_once_with(json.dumps({"test": [1, 2, 3]}, indent=4))
+
+@patch.object(data_management.BaseJSON, "_written")
+@patch.object(data_management.BaseJSON, "_write")
+def test_BaseJSON_batch(mock_write: MagicMock, mock_written: MagicMock) -> None:
+    # Test setup
+    base_json = data_management.BaseJSON()
+
+    # Run unit under test
+    with base_json.batch():
+        base_json.deserialized["first"] = 1
+        base_json.flush()
+        with base_json.batch():
+            base_json.deserialized["second"] = 2
+            base_json.flush()
+        mock_write.assert_not_called()
+
+    # Check expectations
+    mock_write.assert_called_once_with(json.dumps({"first": 1, "second": 2}, indent=4))
+    mock_written.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "_write")
+def test_BaseJSON_batch_exception(mock_write: MagicMock) -> None:
+    # Test setup
+    base_json = data_management.BaseJSON()
+
+    with pytest.raises(RuntimeError):
+        # Run unit under test
+        with base_json.batch():
+            base_json.deserialized["first"] = 1
+            base_json.flush()
+            raise RuntimeError()
+
+    # Check expectations
+    mock_write.assert_called_once_with(json.dumps({"first": 1}, indent=4))
+
+@patch.object(data_management.BaseJSON, "_write")
+def test_BaseJSON_batch_not_dirty(mock_write: MagicMock) -> None:
+    # Test setup
+    base_json = data_management.BaseJSON()
+
+    # Run unit under test
+    with base_json.batch():
+        base_json.deserialized["first"] = 1
+
+    # Check expectations
+    mock_write.assert_not_called()
+
+def test_BaseJSON_write(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text("old")
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+
+    # Run unit under test
+    base_json._write("new")
+
+    # Check expectations
+    assert test_path.read_text() == "new"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test.json", "test.json.lock"]
+
+@patch("dem.core.data_management.os.fsync")
+def test_BaseJSON_write_interrupted(mock_fsync: MagicMock, tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text("old")
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+    mock_fsync.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        # Run unit under test
+        base_json._write("new")
+
+    # Check expectations
+    assert test_path.read_text() == "old"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test.json", "test.json.lock"]
+
+@pytest.mark.skipif(data_management.fcntl is None, reason="no file locks on this platform")
+@patch("dem.core.data_management.fcntl.flock")
+def test_BaseJSON_write_locked(mock_flock: MagicMock, tmp_path) -> None:
     # Test setup
-    mock_opened_file = MagicMock()
-    mock_open.return_value = mock_opened_file
-    fake_json_deserialized = MagicMock()
+    test_path = tmp_path / "test.json"
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+
+    def check_not_written(lock_file, operation) -> None:
+        if operation == data_management.fcntl.LOCK_EX:
+            assert not test_path.exists()
+    mock_flock.side_effect = check_not_written
+
+    # Run unit under test
+    base_json._write("new")
 
+    # Check expectations
+    assert test_path.read_text() == "new"
+    assert [operation for _, operation in (c.args for c in mock_flock.call_args_list)] == \
+        [data_management.fcntl.LOCK_EX, data_management.fcntl.LOCK_UN]
+
+def test_BaseJSON_write_backups(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
     base_json = data_management.BaseJSON()
-    base_json.deserialized = fake_json_deserialized
+    base_json._path = test_path
+    base_json._keep_backups = True
+    base_json.backup_count = 2
+
+    # Run unit under test
+    for version in range(4):
+        base_json._write(f"version {version}")
+
+    # Check expectations
+    assert test_path.read_text() == "version 3"
+    assert (tmp_path / "test.json.1").read_text() == "version 2"
+    assert (tmp_path / "test.json.2").read_text() == "version 1"
+    assert not (tmp_path / "test.json.3").exists()
+
+def test_BaseJSON_write_no_backups(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+    base_json.backup_count = 2
+
+    # Run unit under test
+    base_json._write("version 0")
+    base_json._write("version 1")
+
+    # Check expectations
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test.json", "test.json.lock"]
+
+def test_BaseJSON_flush_conflict(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text(json.dumps({"test": []}, indent=4))
+    writers = [data_management.BaseJSON(), data_management.BaseJSON()]
+    for writer in writers:
+        writer._path = test_path
+        writer._check_conflicts = True
+        writer.update()
+
+    writers[0].deserialized["test"].append("first")
+    writers[0].flush()
+    writers[1].deserialized["test"].append("second")
+
+    with pytest.raises(DataStorageConflictError) as exported_exception_info:
+        # Run unit under test
+        writers[1].flush()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Conflicting file change: The test.json file " \
+        "was modified by another process. The changes were not saved, please try again."
+    assert json.loads(test_path.read_text()) == {"test": ["first"]}
+    assert writers[1].deserialized == {"test": ["first"]}
+
+    # The change can be applied again to the reloaded buffer.
+    writers[1].deserialized["test"].append("second")
+    writers[1].flush()
+    assert json.loads(test_path.read_text()) == {"test": ["first", "second"]}
+
+def test_BaseJSON_flush_merge(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text(json.dumps({
+        "version": "0.1",
+        "development_environments": [
+            {"name": "dev_env_1", "installed": "False", "tools": []},
+            {"name": "dev_env_2", "installed": "False", "tools": []}
+        ]
+    }, indent=4))
+    writers = [data_management.BaseJSON(), data_management.BaseJSON()]
+    for writer in writers:
+        writer._path = test_path
+        writer._check_conflicts = True
+        writer.update()
+
+    writers[0].deserialized["development_environments"][0]["installed"] = "True"
+    writers[0].deserialized["development_environments"].append({"name": "dev_env_3"})
+    writers[0].flush()
+
+    writers[1].deserialized["development_environments"][1]["tools"].append("test_tool")
+    del writers[1].deserialized["development_environments"][0]["tools"]
+
+    # Run unit under test
+    writers[1].flush()
+
+    # Check expectations
+    expected_content = {
+        "version": "0.1",
+        "development_environments": [
+            {"name": "dev_env_1", "installed": "True"},
+            {"name": "dev_env_2", "installed": "False", "tools": ["test_tool"]},
+            {"name": "dev_env_3"}
+        ]
+    }
+    assert json.loads(test_path.read_text()) == expected_content
+
+    # The changes of the other writer are kept at the next write too.
+    writers[1].deserialized["version"] = "0.2"
+    writers[1].flush()
+    expected_content["version"] = "0.2"
+    assert json.loads(test_path.read_text()) == expected_content
+
+def test_BaseJSON_flush_no_conflict_check(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text("{}")
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+    base_json.update()
+    test_path.write_text("{\"modified\": true}")
+    base_json.deserialized["cached"] = True
 
     # Run unit under test
     base_json.flush()
 
     # Check expectations
-    mock_open.assert_called_once_with(base_json._path, "w")
-    mock_json_dump.assert_called_once_with(fake_json_deserialized, mock_opened_file, indent=4)
-    mock_opened_file.close.assert_called_once()
+    assert json.loads(test_path.read_text()) == {"cached": True}
+
+def test_BaseJSON_restore_modified(tmp_path) -> None:
+    # Test setup
+    test_path = tmp_path / "test.json"
+    test_path.write_text("{}")
+    base_json = data_management.BaseJSON()
+    base_json._path = test_path
+    base_json._config_dir = str(tmp_path)
+    base_json._default_json = "{\"default\": true}"
+    base_json._check_conflicts = True
+    base_json.update()
+    test_path.write_text("{\"modified\": true}")
+
+    # Run unit under test
+    base_json.restore()
+
+    # Check expectations
+    assert json.loads(test_path.read_text()) == {"default": True}
 
 @patch.object(data_management.BaseJSON, "_create_default_json")
 def test_BaseJSON_restore(mock_create_default_json: MagicMock) -> None:
@@ -161,6 +420,81 @@ def test_LocalDevEnvJSON_update_JSONDecodeError(mock_update: MagicMock) -> None:
 
     mock_update.assert_called_once()
 
+@patch.object(data_management.BaseJSON, "_create_default_json")
+@patch.object(data_management.BaseJSON, "update")
+def test_CacheJSON_update_JSONDecodeError(mock_update: MagicMock, 
+                                          mock__create_default_json: MagicMock) -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    mock_update.side_effect = json.decoder.JSONDecodeError("test_msg", "test_doc", 0)
+    mock_default_deserialized = MagicMock()
+    mock__create_default_json.return_value = mock_default_deserialized
+
+    # Run unit under test
+    test_registry_cache_json.update()
+
+    # Check expectations
+    assert test_registry_cache_json.deserialized is mock_default_deserialized
+
+    mock_update.assert_called_once()
+    mock__create_default_json.assert_called_once()
+
+def test_CacheJSON_get_and_delete_entry() -> None:
+    # Test setup
+    test_catalog_cache_json = data_management.CatalogCacheJSON()
+    test_catalog_cache_json.deserialized = {
+        "catalogs": {
+            "test_catalog": {
+                "url": "test_url"
+            }
+        }
+    }
+
+    # Run unit under test
+    actual_existing_cache = test_catalog_cache_json.get_entry("test_catalog")
+    actual_new_cache = test_catalog_cache_json.get_entry("new_catalog")
+    test_catalog_cache_json.delete_entry("test_catalog")
+
+    # Check expectations
+    assert actual_existing_cache == {"url": "test_url"}
+    assert actual_new_cache == {}
+    assert test_catalog_cache_json.deserialized == {
+        "catalogs": {
+            "new_catalog": {}
+        }
+    }
+
+def test_CacheJSON_default_json() -> None:
+    # Run unit under test
+    test_host_metadata_json = data_management.HostMetadataJSON()
+
+    # Check expectations
+    assert test_host_metadata_json._path.name == "host_metadata.json"
+    assert json.loads(test_host_metadata_json._default_json) == {"hosts": {}}
+
+@patch.object(data_management.CacheJSON, "update")
+def test_CacheJSON_get_shared(mock_update: MagicMock) -> None:
+    # Test setup
+    for cls in (data_management.RegistryCacheJSON, data_management.HostMetadataJSON):
+        if "_shared" in cls.__dict__:
+            del cls._shared
+
+    try:
+        # Run unit under test
+        actual_registry_cache_json = data_management.RegistryCacheJSON.get_shared()
+        actual_registry_cache_json_again = data_management.RegistryCacheJSON.get_shared()
+        actual_host_metadata_json = data_management.HostMetadataJSON.get_shared()
+
+        # Check expectations
+        assert actual_registry_cache_json is actual_registry_cache_json_again
+        assert isinstance(actual_registry_cache_json, data_management.RegistryCacheJSON)
+        assert isinstance(actual_host_metadata_json, data_management.HostMetadataJSON)
+
+        assert mock_update.call_count == 2
+    finally:
+        del data_management.RegistryCacheJSON._shared
+        del data_management.HostMetadataJSON._shared
+
 @patch("dem.core.data_management.PurePath")
 def test_ConfigFile(mock_PurePath: MagicMock):
     # Test setup
@@ -191,14 +525,36 @@ def test_ConfigFile(mock_PurePath: MagicMock):
     ],
     "hosts": [],
     "http_request_timeout_s": 2,
-    "use_native_system_cert_store": false
+    "use_native_system_cert_store": false,
+    "max_concurrency": 8,
+    "registry_page_size": 100,
+    "registry_cache_ttl_s": 600,
+    "http_pool_size": 10,
+    "http_max_retries": 2,
+    "http_retry_backoff_factor": 0.5,
+    "max_parallel_pulls": 4,
+    "check_image_digests": false,
+    "warm_container_idle_timeout_s": 600,
+    "api_max_running_jobs": 4,
+    "api_max_queued_jobs": 32,
+    "api_max_finished_jobs": 100,
+    "api_max_job_output_kib": 16384,
+    "api_host": "0.0.0.0",
+    "api_port": 8000,
+    "api_threadpool_size": 40,
+    "api_max_concurrent_requests": 0,
+    "api_keep_alive_timeout_s": 5,
+    "api_graceful_shutdown_timeout_s": 300,
+    "json_backup_count": 0
 }"""
 
     mock_PurePath.assert_called_once_with(test_path + "/config.json")
 
+@patch("dem.core.data_management.NameIndexJSON")
 @patch.object(data_management.BaseJSON, "flush")
 @patch.object(data_management.BaseJSON, "update")
-def test_ConfigFile_update(mock_update: MagicMock, mock_flush: MagicMock) -> None:
+def test_ConfigFile_update(mock_update: MagicMock, mock_flush: MagicMock, 
+                           mock_NameIndexJSON: MagicMock) -> None:
     # Test setup
     test_config_file = data_management.ConfigFile()
     test_registry = MagicMock()
@@ -237,4 +593,117 @@ def test_ConfigFile_update_JSONDecodeError(mock_update: MagicMock) -> None:
     # Check expectations
     assert "Invalid file: The config.json file is corrupted.\ntest_msg: line 1 column 1 (char 0)" == str(e.value)
 
-    mock_update.assert_called_once()
\ No newline at end of file
+    mock_update.assert_called_once()
+@patch("dem.core.data_management.NameIndexJSON")
+@patch.object(data_management.BaseJSON, "_write")
+def test_LocalDevEnvJSON_flush(mock_write: MagicMock, mock_NameIndexJSON: MagicMock) -> None:
+    # Test setup
+    test_local_dev_env_json = data_management.LocalDevEnvJSON()
+    test_local_dev_env_json.deserialized = {"test": "value"}
+
+    # Run unit under test
+    test_local_dev_env_json.flush()
+
+    # Check expectations
+    mock_write.assert_called_once()
+    mock_NameIndexJSON.return_value.rebuild.assert_called_once()
+
+@patch("dem.core.data_management.NameIndexJSON")
+@patch.object(data_management.BaseJSON, "_write")
+def test_ConfigFile_flush(mock_write: MagicMock, mock_NameIndexJSON: MagicMock) -> None:
+    # Test setup
+    test_config_file = data_management.ConfigFile()
+    test_config_file.deserialized = {"test": "value"}
+
+    # Run unit under test
+    test_config_file.flush()
+
+    # Check expectations
+    mock_write.assert_called_once()
+    mock_NameIndexJSON.return_value.rebuild.assert_called_once()
+
+def test_NameIndexJSON_rebuild(tmp_path) -> None:
+    # Test setup
+    (tmp_path / "dev_env.json").write_text(json.dumps({
+        "version": "0.1",
+        "development_environments": [
+            {
+                "name": "dev_env_1",
+                "installed": "True",
+                "tools": [],
+                "custom_tasks": {"lint": "command", "build": "command"},
+                "docker_tasks": [{"name": "build"}, {"name": "test"}]
+            },
+            {
+                "name": "dev_env_2",
+                "tools": []
+            }
+        ]
+    }))
+    (tmp_path / "config.json").write_text(json.dumps({
+        "registries": [{"name": "reg_1"}],
+        "catalogs": [{"name": "cat_1"}, {"name": "cat_2"}],
+        "hosts": [{"name": "host_1"}]
+    }))
+
+    with patch.object(data_management.BaseJSON, "_config_dir", str(tmp_path)):
+        test_name_index_json = data_management.NameIndexJSON()
+
+        # Run unit under test
+        test_name_index_json.rebuild()
+
+    # Check expectations
+    assert test_name_index_json.get_dev_env_names() == ["dev_env_1", "dev_env_2"]
+    assert test_name_index_json.get_dev_env_names(installed_only=True) == ["dev_env_1"]
+    assert test_name_index_json.get_task_names("dev_env_1") == ["build", "test", "lint"]
+    assert test_name_index_json.get_task_names("dev_env_2") == []
+    assert test_name_index_json.get_task_names("missing") == []
+    assert test_name_index_json.get_names("registries") == ["reg_1"]
+    assert test_name_index_json.get_names("catalogs") == ["cat_1", "cat_2"]
+    assert test_name_index_json.get_names("hosts") == ["host_1"]
+    assert json.loads((tmp_path / "name_index.json").read_text()) == test_name_index_json.deserialized
+
+def test_NameIndexJSON_rebuild_missing_files(tmp_path) -> None:
+    # Test setup
+    with patch.object(data_management.BaseJSON, "_config_dir", str(tmp_path)):
+        test_name_index_json = data_management.NameIndexJSON()
+
+        # Run unit under test
+        test_name_index_json.rebuild()
+
+    # Check expectations
+    assert test_name_index_json.get_dev_env_names() == []
+    assert test_name_index_json.get_names("registries") == ["axem"]
+    assert test_name_index_json.get_names("catalogs") == ["axem"]
+    assert test_name_index_json.get_names("hosts") == []
+
+def test_NameIndexJSON_update(tmp_path) -> None:
+    # Test setup
+    (tmp_path / "config.json").write_text(json.dumps({"hosts": [{"name": "host_1"}]}))
+
+    with patch.object(data_management.BaseJSON, "_config_dir", str(tmp_path)):
+        # The index is missing, so it gets built.
+        data_management.NameIndexJSON().update()
+        index_path = tmp_path / "name_index.json"
+        assert json.loads(index_path.read_text())["hosts"] == ["host_1"]
+
+        # The index is up-to-date, so it gets read.
+        index_path.write_text(json.dumps({"dev_envs": {}, "registries": [], "catalogs": [], 
+                                          "hosts": ["from_index"]}))
+        test_name_index_json = data_management.NameIndexJSON()
+        test_name_index_json.update()
+        assert test_name_index_json.get_names("hosts") == ["from_index"]
+
+        # The config.json has been edited since, so the index gets rebuilt.
+        config_mtime_ns = os.stat(index_path).st_mtime_ns + 1_000_000_000
+        os.utime(tmp_path / "config.json", ns=(config_mtime_ns, config_mtime_ns))
+        test_name_index_json = data_management.NameIndexJSON()
+        test_name_index_json.update()
+        assert test_name_index_json.get_names("hosts") == ["host_1"]
+
+        # A corrupted index gets rebuilt.
+        index_path.write_text("{")
+        os.utime(index_path, ns=(config_mtime_ns, config_mtime_ns))
+        test_name_index_json = data_management.NameIndexJSON()
+        test_name_index_json.update()
+        assert test_name_index_json.get_names("hosts") == ["host_1"]
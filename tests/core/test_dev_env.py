@@ -5,8 +5,9 @@
 import dem.core.dev_env as dev_env
 
 # Test framework
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, call
 import pytest
+from threading import Barrier, Event
 
 from typing import Any
 
@@ -220,15 +221,18 @@ def test_DevEnv_is_installation_correct_true(mock___init__: MagicMock) -> None:
 
     test_dev_env = dev_env.DevEnv(MagicMock())
 
-    mock_tool_image1 = MagicMock()
-    mock_tool_image1.availability = dev_env.ToolImage.LOCAL_AND_REGISTRY
-    mock_tool_image2 = MagicMock()
-    mock_tool_image2.availability = dev_env.ToolImage.LOCAL_ONLY
-    test_dev_env.assigned_tool_images = [
-        mock_tool_image1,
-        mock_tool_image2
-    ]
-    test_dev_env.is_installed = True
+    mock_host = MagicMock()
+    mock_host.container_engine.is_image_local.return_value = True
+    mock_task1 = MagicMock()
+    mock_task1.image = "test_image1:latest"
+    mock_task1.host = mock_host
+    mock_task2 = MagicMock()
+    mock_task2.image = "test_image2:latest"
+    mock_task2.host = mock_host
+    test_dev_env.tasks = {
+        "test_task1": mock_task1,
+        "test_task2": mock_task2
+    }
 
     # Run unit under test
     actual_status = test_dev_env.is_installation_correct()
@@ -237,6 +241,8 @@ def test_DevEnv_is_installation_correct_true(mock___init__: MagicMock) -> None:
     assert actual_status is True
 
     mock___init__.assert_called_once()
+    mock_host.container_engine.is_image_local.assert_has_calls([call(mock_task1.image), 
+                                                                call(mock_task2.image)])
 
 @patch.object(dev_env.DevEnv, "__init__")
 def test_DevEnv_is_installation_correct_false(mock___init__: MagicMock) -> None:
@@ -245,15 +251,18 @@ def test_DevEnv_is_installation_correct_false(mock___init__: MagicMock) -> None:
 
     test_dev_env = dev_env.DevEnv(MagicMock())
 
-    mock_tool_image1 = MagicMock()
-    mock_tool_image1.availability = dev_env.ToolImage.NOT_AVAILABLE
-    mock_tool_image2 = MagicMock()
-    mock_tool_image2.availability = dev_env.ToolImage.LOCAL_ONLY
-    test_dev_env.assigned_tool_images = [
-        mock_tool_image1,
-        mock_tool_image2
-    ]
-    test_dev_env.is_installed = True
+    mock_host = MagicMock()
+    mock_host.container_engine.is_image_local.side_effect = [True, False]
+    mock_task1 = MagicMock()
+    mock_task1.image = "test_image1:latest"
+    mock_task1.host = mock_host
+    mock_task2 = MagicMock()
+    mock_task2.image = "test_image2:latest"
+    mock_task2.host = mock_host
+    test_dev_env.tasks = {
+        "test_task1": mock_task1,
+        "test_task2": mock_task2
+    }
 
     # Run unit under test
     actual_status = test_dev_env.is_installation_correct()
@@ -262,6 +271,8 @@ def test_DevEnv_is_installation_correct_false(mock___init__: MagicMock) -> None:
     assert actual_status is False
 
     mock___init__.assert_called_once()
+    mock_host.container_engine.is_image_local.assert_has_calls([call(mock_task1.image), 
+                                                                call(mock_task2.image)])
 
 @patch.object(dev_env.DevEnv, "__init__")
 def test_DevEnv_is_installation_correct_not_istalled(mock___init__: MagicMock) -> None:
@@ -288,6 +299,262 @@ def test_DevEnv_is_installation_correct_not_istalled(mock___init__: MagicMock) -
 
     mock___init__.assert_called_once()
 
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_start_engines(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+
+    # Both engines must be starting at the same time to pass the barrier.
+    test_barrier = Barrier(2, timeout=5)
+    def start_engine(check_connection: bool) -> None:
+        test_barrier.wait()
+
+    mock_local_host = MagicMock()
+    mock_local_host.name = "local"
+    mock_local_host.container_engine.start.side_effect = start_engine
+    mock_remote_host = MagicMock()
+    mock_remote_host.name = "test_remote"
+    mock_remote_host.container_engine.start.side_effect = start_engine
+
+    test_dev_env.tasks = {}
+    for index, host in enumerate([mock_local_host, mock_remote_host, mock_local_host]):
+        mock_task = MagicMock()
+        mock_task.host = host
+        test_dev_env.tasks[f"test_task{index}"] = mock_task
+
+    # Run unit under test
+    test_dev_env.start_engines()
+
+    # Check expectations
+    mock___init__.assert_called_once()
+    mock_local_host.container_engine.start.assert_called_once_with(check_connection=True)
+    mock_remote_host.container_engine.start.assert_called_once_with(check_connection=True)
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_start_engines_failure(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+
+    mock_local_host = MagicMock()
+    mock_local_host.name = "local"
+    mock_remote_host = MagicMock()
+    mock_remote_host.name = "test_remote"
+    mock_remote_host.container_engine.start.side_effect = dev_env.ContainerEngineError("test_error")
+
+    test_dev_env.tasks = {}
+    for index, host in enumerate([mock_local_host, mock_remote_host]):
+        mock_task = MagicMock()
+        mock_task.host = host
+        test_dev_env.tasks[f"test_task{index}"] = mock_task
+
+    # Run unit under test
+    with pytest.raises(dev_env.DevEnvError) as exported_exception_info:
+        test_dev_env.start_engines()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Development Environment error: Failed to start the container engine on the following hosts: ['test_remote']"
+
+    mock___init__.assert_called_once()
+
+def _get_test_tasks(dependencies: dict[str, list[str]]) -> dict[str, MagicMock]:
+    test_tasks = {}
+    for task_name, depends_on in dependencies.items():
+        mock_task = MagicMock()
+        mock_task.name = task_name
+        mock_task.depends_on = depends_on
+        test_tasks[task_name] = mock_task
+    return test_tasks
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_get_task_execution_order(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "build": [],
+        "lint": [],
+        "unit-test": ["build"],
+        "package": ["unit-test", "build"],
+    })
+
+    # Run unit under test
+    actual_execution_order = test_dev_env.get_task_execution_order(["package", "lint"])
+
+    # Check expectations
+    assert actual_execution_order == ["build", "unit-test", "package", "lint"]
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_get_task_execution_order_circular(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "task1": ["task2"],
+        "task2": ["task3"],
+        "task3": ["task1"],
+    })
+
+    # Run unit under test
+    with pytest.raises(dev_env.DevEnvError) as exported_exception_info:
+        test_dev_env.get_task_execution_order(["task1"])
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Development Environment error: Circular task dependency: task1 -> task2 -> task3 -> task1"
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_get_task_execution_order_unknown_dependency(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "task1": ["missing_task"],
+    })
+
+    # Run unit under test
+    with pytest.raises(dev_env.DevEnvError) as exported_exception_info:
+        test_dev_env.get_task_execution_order(["task1"])
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Development Environment error: The task1 task depends on the unknown missing_task task."
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_run_tasks(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "build": [],
+        "lint": [],
+        "unit-test": ["build"],
+    })
+
+    # The independent tasks must be running at the same time to pass the barrier.
+    test_barrier = Barrier(2, timeout=5)
+    finished_tasks = []
+    def run_task(task_name: str, log_prefix: str) -> None:
+        if task_name in ("build", "lint"):
+            test_barrier.wait()
+        else:
+            # The dependency must have finished before the task gets started.
+            assert "build" in finished_tasks
+        finished_tasks.append(task_name)
+        return test_results[task_name]
+
+    test_results = {}
+    for task_name in test_dev_env.tasks:
+        test_results[task_name] = MagicMock()
+        test_results[task_name].exit_code = 0
+
+    for task_name, mock_task in test_dev_env.tasks.items():
+        mock_task.run.side_effect = \
+            lambda log_prefix, warm, output, cancel_event, name_suffix, task_name=task_name: \
+                run_task(task_name, log_prefix)
+
+    # Run unit under test
+    actual_results = test_dev_env.run_tasks(["unit-test", "lint"], 2, True, name_suffix="job1")
+
+    # Check expectations
+    assert actual_results == test_results
+    assert sorted(finished_tasks) == ["build", "lint", "unit-test"]
+    test_dev_env.tasks["build"].run.assert_called_once_with("build     | ", True, None, None, "job1")
+    test_dev_env.tasks["lint"].run.assert_called_once_with("lint      | ", True, None, None, "job1")
+    test_dev_env.tasks["unit-test"].run.assert_called_once_with("unit-test | ", True, None, None, 
+                                                                "job1")
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_run_tasks_failure(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "build": [],
+        "unit-test": ["build"],
+    })
+    test_dev_env.tasks["build"].run.side_effect = dev_env.ContainerEngineError("test_error")
+
+    # Run unit under test
+    with pytest.raises(dev_env.DevEnvError) as exported_exception_info:
+        test_dev_env.run_tasks(["unit-test"], 2)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Development Environment error: The following tasks failed:\nbuild: Container engine error: test_error\nThe following tasks were not started: unit-test"
+
+    test_dev_env.tasks["unit-test"].run.assert_not_called()
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_run_tasks_non_zero_exit_code(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "build": [],
+        "unit-test": ["build"],
+    })
+    test_dev_env.tasks["build"].run.return_value.exit_code = 2
+
+    # Run unit under test
+    actual_results = test_dev_env.run_tasks(["unit-test"], 2)
+
+    # Check expectations
+    assert actual_results == {"build": test_dev_env.tasks["build"].run.return_value}
+    test_dev_env.tasks["unit-test"].run.assert_not_called()
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_run_tasks_non_zero_exit_code_waiting_tasks(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "a": [],
+        "b": [],
+        "c": [],
+    })
+    test_dev_env.tasks["a"].run.return_value.exit_code = 1
+
+    # Run unit under test
+    actual_results = test_dev_env.run_tasks(["a", "b", "c"], 1)
+
+    # Check expectations
+    assert actual_results == {"a": test_dev_env.tasks["a"].run.return_value}
+    test_dev_env.tasks["b"].run.assert_not_called()
+    test_dev_env.tasks["c"].run.assert_not_called()
+
+@patch.object(dev_env.DevEnv, "__init__")
+def test_DevEnv_run_tasks_cancelled_waiting_tasks(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env = dev_env.DevEnv(MagicMock())
+    test_dev_env.tasks = _get_test_tasks({
+        "a": [],
+        "b": [],
+        "c": [],
+    })
+    test_cancel_event = Event()
+    test_dev_env.tasks["a"].run.return_value.exit_code = 0
+    test_dev_env.tasks["a"].run.side_effect = \
+        lambda log_prefix, warm, output, cancel_event, name_suffix: \
+            cancel_event.set() or test_dev_env.tasks["a"].run.return_value
+
+    # Run unit under test
+    actual_results = test_dev_env.run_tasks(["a", "b", "c"], 1, cancel_event=test_cancel_event)
+
+    # Check expectations
+    assert actual_results == {"a": test_dev_env.tasks["a"].run.return_value}
+    test_dev_env.tasks["b"].run.assert_not_called()
+    test_dev_env.tasks["c"].run.assert_not_called()
+
 def test_DevEnv_get_deserialized_is_installed_true() -> None:
     # Test setup
     test_descriptor: dict[str, Any] = {
@@ -7,24 +7,30 @@ import dem.core.dev_env_catalog as dev_env_catalog
 # Test framework
 from unittest.mock import patch, MagicMock, call
 import pytest
+from threading import Event
 
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
 @patch.object(dev_env_catalog.Core, "config_file")
 @patch("dem.core.dev_env_catalog.DevEnv")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs(mock_requests: MagicMock, mock_DevEnv: MagicMock, 
-                       mock_config_file: MagicMock) -> None:
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs(mock_http_client: MagicMock, mock_DevEnv: MagicMock, 
+                                        mock_config_file: MagicMock, 
+                                        mock_catalog_cache_json: MagicMock) -> None:
     # Test setup
+    test_dev_env_descriptors = [{"name": f"test_dev_env_{i}"} for i in range(5)]
+    test_body = dev_env_catalog.json.dumps({
+        "development_environments": test_dev_env_descriptors
+    })
     mock_response = MagicMock()
     mock_response.status_code = dev_env_catalog.requests.codes.ok
-
-    mock_requests.get.return_value = mock_response
-    test_dev_env_descriptors = [MagicMock()] * 5
-    mock_json = {
-        "development_environments": test_dev_env_descriptors
+    mock_response.text = test_body
+    mock_response.headers = {
+        "ETag": "test_etag",
+        "Last-Modified": "test_last_modified"
     }
-    mock_response.json.return_value = mock_json
+    mock_http_client.get.return_value = mock_response
 
-    test_dev_envs = [MagicMock()] * 5
+    test_dev_envs = [MagicMock() for _ in test_dev_env_descriptors]
     mock_DevEnv.side_effect = test_dev_envs
     
     test_url = "test_url"
@@ -36,6 +42,9 @@ def test_DevEnvCatalog_request_dev_envs(mock_requests: MagicMock, mock_DevEnv: M
     test_http_request_timeout_s = 1
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
 
+    test_cache = {}
+    mock_catalog_cache_json.get_entry.return_value = test_cache
+
     test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
 
     # Run unit under test
@@ -43,20 +52,126 @@ def test_DevEnvCatalog_request_dev_envs(mock_requests: MagicMock, mock_DevEnv: M
 
     # Check expectations
     assert test_dev_env_catalog.dev_envs == test_dev_envs
+    assert test_cache == {
+        "url": test_url,
+        "body": test_body,
+        "etag": "test_etag",
+        "last_modified": "test_last_modified"
+    }
 
-    mock_requests.get.assert_called_once_with(test_url, timeout=test_http_request_timeout_s)
-    mock_response.json.assert_called_once()
+    mock_http_client.get.assert_called_once_with(test_url, headers={}, 
+                                                 timeout=test_http_request_timeout_s)
 
-    calls = [call(descriptor=test_dev_env_descriptor) for test_dev_env_descriptor in test_dev_env_descriptors]
+    calls = [call(test_dev_env_descriptor) for test_dev_env_descriptor in test_dev_env_descriptors]
     mock_DevEnv.assert_has_calls(calls)
+    mock_catalog_cache_json.get_entry.assert_called_with(test_catalog_config["name"])
+    mock_catalog_cache_json.flush.assert_called_once()
 
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
 @patch.object(dev_env_catalog.Core, "config_file")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_requests: MagicMock, 
-                                                           mock_config_file: MagicMock) -> None:
+@patch("dem.core.dev_env_catalog.DevEnv")
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs_not_modified(mock_http_client: MagicMock, 
+                                                     mock_DevEnv: MagicMock, 
+                                                     mock_config_file: MagicMock, 
+                                                     mock_catalog_cache_json: MagicMock) -> None:
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = dev_env_catalog.requests.codes.not_modified
+    mock_http_client.get.return_value = mock_response
+
+    test_dev_env_descriptor = {"name": "test_dev_env"}
+    test_url = "test_url"
+    test_cache = {
+        "url": test_url,
+        "body": dev_env_catalog.json.dumps({
+            "development_environments": [test_dev_env_descriptor]
+        }),
+        "etag": "test_etag",
+        "last_modified": "test_last_modified"
+    }
+    mock_catalog_cache_json.get_entry.return_value = test_cache
+
+    test_catalog_config = {
+        "url": test_url,
+        "name": "test_name"
+    }
+
+    test_http_request_timeout_s = 1
+    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
+
+    # Run unit under test
+    test_dev_env_catalog.request_dev_envs()
+    test_dev_env_catalog.request_dev_envs()
+
+    # Check expectations
+    assert test_dev_env_catalog.dev_envs == [mock_DevEnv.return_value]
+
+    mock_http_client.get.assert_called_once_with(test_url, headers={
+        "If-None-Match": "test_etag",
+        "If-Modified-Since": "test_last_modified"
+    }, timeout=test_http_request_timeout_s)
+    mock_DevEnv.assert_called_once_with(test_dev_env_descriptor)
+    mock_catalog_cache_json.flush.assert_not_called()
+
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
+@patch.object(dev_env_catalog.Core, "user_output")
+@patch.object(dev_env_catalog.Core, "config_file")
+@patch("dem.core.dev_env_catalog.DevEnv")
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs_offline_with_cache(mock_http_client: MagicMock, 
+                                                           mock_DevEnv: MagicMock, 
+                                                           mock_config_file: MagicMock, 
+                                                           mock_user_output: MagicMock,
+                                                           mock_catalog_cache_json: MagicMock) -> None:
     # Test setup
     test_exception_text = "test_exception_text"
-    mock_requests.get.side_effect = Exception(test_exception_text)
+    mock_http_client.get.side_effect = Exception(test_exception_text)
+
+    test_dev_env_descriptor = {"name": "test_dev_env"}
+    test_url = "test_url"
+    test_cache = {
+        "url": test_url,
+        "body": dev_env_catalog.json.dumps({
+            "development_environments": [test_dev_env_descriptor]
+        })
+    }
+    mock_catalog_cache_json.get_entry.return_value = test_cache
+
+    test_catalog_config = {
+        "url": test_url,
+        "name": "test_name"
+    }
+
+    test_http_request_timeout_s = 1
+    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+
+    test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
+
+    # Run unit under test
+    test_dev_env_catalog.request_dev_envs()
+
+    # Check expectations
+    assert test_dev_env_catalog.dev_envs == [mock_DevEnv.return_value]
+
+    mock_http_client.get.assert_called_once_with(test_url, headers={}, 
+                                                 timeout=test_http_request_timeout_s)
+    mock_DevEnv.assert_called_once_with(test_dev_env_descriptor)
+    mock_user_output.msg.assert_called_once_with(f"[yellow]Error in communication with the [bold]{test_catalog_config['name']}[/bold] Development Environment Catalog.\n{test_exception_text}" +
+                                                 f"\nUsing the cached content of the {test_catalog_config['name']} catalog, which might be outdated.[/]")
+    mock_catalog_cache_json.flush.assert_not_called()
+
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
+@patch.object(dev_env_catalog.Core, "config_file")
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_http_client: MagicMock, 
+                                                           mock_config_file: MagicMock,
+                                                           mock_catalog_cache_json: MagicMock) -> None:
+    # Test setup
+    test_exception_text = "test_exception_text"
+    mock_http_client.get.side_effect = Exception(test_exception_text)
 
     test_catalog_config = {
         "url": "test_url",
@@ -66,6 +181,8 @@ def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_requests: MagicM
     test_http_request_timeout_s = 1
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
 
+    mock_catalog_cache_json.get_entry.return_value = {}
+
     test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
 
     # Run unit under test
@@ -75,17 +192,19 @@ def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_requests: MagicM
     # Check expectations
     assert str(e.value) == f"Catalog error: Error in communication with the [bold]{test_catalog_config['name']}[/bold] Development Environment Catalog.\n{test_exception_text}"
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
-                                              timeout=test_http_request_timeout_s)
+    mock_http_client.get.assert_called_once_with(test_catalog_config["url"], headers={},
+                                                 timeout=test_http_request_timeout_s)
 
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
 @patch.object(dev_env_catalog.Core, "config_file")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_requests: MagicMock, 
-                                                           mock_config_file: MagicMock) -> None:
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_http_client: MagicMock, 
+                                                           mock_config_file: MagicMock,
+                                                           mock_catalog_cache_json: MagicMock) -> None:
     # Test setup
-    mock_deser_json_response = MagicMock()
-    mock_deser_json_response.status_code = dev_env_catalog.requests.codes.not_found
-    mock_requests.get.return_value = mock_deser_json_response
+    mock_response = MagicMock()
+    mock_response.status_code = dev_env_catalog.requests.codes.not_found
+    mock_http_client.get.return_value = mock_response
 
     test_catalog_config = {
         "url": "test_url",
@@ -95,6 +214,8 @@ def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_requests: MagicM
     test_http_request_timeout_s = 1
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
 
+    mock_catalog_cache_json.get_entry.return_value = {}
+
     test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
 
     # Run unit under test
@@ -104,27 +225,29 @@ def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_requests: MagicM
     # Check expectations
     assert str(e.value) == (f"Catalog error: Error in communication with the [bold]{test_catalog_config['name']}[/bold] Development Environment Catalog. " + 
                                   "Failed to retrieve Development Environments." + 
-                                  "\nResponse status code: " + str(mock_deser_json_response.status_code) + 
+                                  "\nResponse status code: " + str(mock_response.status_code) + 
                                   "\nDoes the URL point to a valid Development Environment Catalog?\n")
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
-                                              timeout=test_http_request_timeout_s)
+    mock_http_client.get.assert_called_once_with(test_catalog_config["url"], headers={},
+                                                 timeout=test_http_request_timeout_s)
 
+@patch.object(dev_env_catalog.DevEnvCatalog, "catalog_cache_json")
 @patch.object(dev_env_catalog.Core, "config_file")
 @patch("dem.core.dev_env_catalog.DevEnv")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_requests: MagicMock, 
+@patch.object(dev_env_catalog.Core, "http_client")
+def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_http_client: MagicMock, 
                                                           mock_DevEnv: MagicMock, 
-                                                          mock_config_file: MagicMock) -> None:
+                                                          mock_config_file: MagicMock,
+                                                          mock_catalog_cache_json: MagicMock) -> None:
     # Test setup
-    mock_deser_json_response = MagicMock()
-    mock_deser_json_response.status_code = dev_env_catalog.requests.codes.ok
-    mock_requests.get.return_value = mock_deser_json_response
+    mock_response = MagicMock()
+    mock_response.status_code = dev_env_catalog.requests.codes.ok
+    mock_http_client.get.return_value = mock_response
 
-    mock_dev_env_descriptor = MagicMock()
-    mock_deser_json_response.json.return_value = {
-        "development_environments": [mock_dev_env_descriptor]
-    }
+    test_dev_env_descriptor = {"name": "test_dev_env"}
+    mock_response.text = dev_env_catalog.json.dumps({
+        "development_environments": [test_dev_env_descriptor]
+    })
 
     test_exception_text = "test_exception_text"
     mock_DevEnv.side_effect = Exception(test_exception_text)
@@ -137,6 +260,8 @@ def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_requests: MagicMo
     test_http_request_timeout_s = 1
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
 
+    mock_catalog_cache_json.get_entry.return_value = {}
+
     test_dev_env_catalog = dev_env_catalog.DevEnvCatalog(test_catalog_config)
 
     # Run unit under test
@@ -146,10 +271,10 @@ def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_requests: MagicMo
     # Check expectations
     assert str(e.value) == (f"Catalog error: The {test_catalog_config['name']} Development Environment Catalog is corrupted.\n{test_exception_text}")
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
-                                              timeout=test_http_request_timeout_s)
-    mock_deser_json_response.json.assert_called_once()
-    mock_DevEnv.assert_called_once_with(descriptor=mock_dev_env_descriptor)
+    mock_http_client.get.assert_called_once_with(test_catalog_config["url"], headers={},
+                                                 timeout=test_http_request_timeout_s)
+    mock_DevEnv.assert_called_once_with(test_dev_env_descriptor)
+    mock_catalog_cache_json.flush.assert_not_called()
 
 @patch.object(dev_env_catalog.DevEnvCatalog, "__init__")
 def test_DevEnvCatalog_get_dev_env_by_name(mock___init__: MagicMock):
@@ -197,6 +322,92 @@ def test_DevEnvCatalogs(mock_DevEnvCatalog: MagicMock, mock_config_file: MagicMo
         calls.append(call(test_catalog))
     mock_DevEnvCatalog.assert_has_calls(calls)
 
+@patch.object(dev_env_catalog.Core, "config_file")
+@patch.object(dev_env_catalog.DevEnvCatalogs, "__init__")
+def test_DevEnvCatalogs_request_all(mock___init__: MagicMock, mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_concurrency = 2
+
+    test_release_first_catalog = Event()
+    mock_slow_catalog = MagicMock()
+    mock_slow_catalog.name = "test_slow_catalog"
+    mock_slow_catalog.request_dev_envs.side_effect = lambda: test_release_first_catalog.wait(5)
+    mock_failing_catalog = MagicMock()
+    mock_failing_catalog.name = "test_failing_catalog"
+    test_error = dev_env_catalog.CatalogError("test_error")
+    def request_failing_catalog() -> None:
+        test_release_first_catalog.set()
+        raise test_error
+    mock_failing_catalog.request_dev_envs.side_effect = request_failing_catalog
+    mock_not_selected_catalog = MagicMock()
+    mock_not_selected_catalog.name = "test_not_selected_catalog"
+
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs()
+    test_dev_env_catalogs.catalogs = [mock_slow_catalog, mock_not_selected_catalog, 
+                                      mock_failing_catalog]
+
+    # Run unit under test
+    actual_results = list(test_dev_env_catalogs.request_all([mock_slow_catalog.name, 
+                                                             mock_failing_catalog.name]))
+
+    # Check expectations
+    assert actual_results == [(mock_slow_catalog, None), (mock_failing_catalog, test_error)]
+
+    mock___init__.assert_called_once()
+    mock_slow_catalog.request_dev_envs.assert_called_once()
+    mock_failing_catalog.request_dev_envs.assert_called_once()
+    mock_not_selected_catalog.request_dev_envs.assert_not_called()
+
+@patch.object(dev_env_catalog.Core, "config_file")
+@patch.object(dev_env_catalog.DevEnvCatalogs, "__init__")
+def test_DevEnvCatalogs_request_all_stop_early(mock___init__: MagicMock, 
+                                               mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_concurrency = 2
+
+    test_release_hanging_catalog = Event()
+    mock_first_catalog = MagicMock()
+    mock_first_catalog.name = "test_first_catalog"
+    mock_hanging_catalog = MagicMock()
+    mock_hanging_catalog.name = "test_hanging_catalog"
+    mock_hanging_catalog.request_dev_envs.side_effect = lambda: test_release_hanging_catalog.wait(5)
+    mock_not_needed_catalog = MagicMock()
+    mock_not_needed_catalog.name = "test_not_needed_catalog"
+
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs()
+    test_dev_env_catalogs.catalogs = [mock_first_catalog, mock_hanging_catalog, 
+                                      mock_not_needed_catalog]
+
+    # Run unit under test
+    test_results = test_dev_env_catalogs.request_all()
+    actual_first_result = next(test_results)
+    test_results.close()
+
+    # Check expectations
+    assert actual_first_result == (mock_first_catalog, None)
+    assert not test_release_hanging_catalog.is_set()
+
+    test_release_hanging_catalog.set()
+    mock_first_catalog.request_dev_envs.assert_called_once()
+
+@patch.object(dev_env_catalog.DevEnvCatalogs, "__init__")
+def test_DevEnvCatalogs_request_all_no_catalogs(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_dev_env_catalogs = dev_env_catalog.DevEnvCatalogs()
+    test_dev_env_catalogs.catalogs = []
+
+    # Run unit under test
+    actual_results = list(test_dev_env_catalogs.request_all())
+
+    # Check expectations
+    assert actual_results == []
+
+    mock___init__.assert_called_once()
+
 @patch.object(dev_env_catalog.DevEnvCatalogs, "__init__")
 @patch("dem.core.dev_env_catalog.DevEnvCatalog")
 def test_DevEnvCatalogs_add_catalog(mock_DevEnvCatalog: MagicMock, mock___init__: MagicMock) -> None:
@@ -24,6 +24,22 @@ def test_Host() -> None:
     assert test_host.address == test_host_config["address"]
     assert test_host.config == test_host_config
 
+@patch.object(hosts.Core, "config_file")
+@patch("dem.core.hosts.ContainerEngine")
+def test_Hosts_lazy_container_engine(mock_ContainerEngine: MagicMock, 
+                                     mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.hosts = []
+
+    # Run unit under test
+    test_hosts = hosts.Hosts()
+
+    # Check expectations
+    assert test_hosts.local.container_engine is mock_ContainerEngine.return_value
+
+    mock_ContainerEngine.assert_called_once_with("unix://var/run/docker.sock")
+    mock_ContainerEngine.return_value.start.assert_not_called()
+
 @patch.object(hosts.Core, "config_file")
 def test_Hosts(mock_config_file) -> None:
     # Test setup
@@ -0,0 +1,76 @@
+"""Unit tests for the http_client."""
+# tests/core/test_http_client.py
+
+# Unit under test:
+import dem.core.http_client as http_client
+
+# Test framework
+from unittest.mock import patch, MagicMock
+
+def test_HTTPClient__create_session() -> None:
+    # Test setup
+    test_pool_size = 4
+    test_max_retries = 3
+    test_retry_backoff_factor = 0.1
+    test_http_client = http_client.HTTPClient(test_pool_size, test_max_retries,
+                                              test_retry_backoff_factor)
+
+    # Run unit under test
+    actual_session = test_http_client._create_session()
+
+    # Check expectations
+    for prefix in ("http://", "https://"):
+        adapter = actual_session.get_adapter(prefix + "test_host")
+        assert adapter._pool_maxsize == test_pool_size
+        assert adapter.max_retries.total == test_max_retries
+        assert adapter.max_retries.backoff_factor == test_retry_backoff_factor
+        assert adapter.max_retries.read == 0
+        assert set(adapter.max_retries.status_forcelist) == set(http_client.HTTPClient._retry_status_codes)
+
+@patch.object(http_client.HTTPClient, "_create_session")
+def test_HTTPClient_get(mock__create_session: MagicMock) -> None:
+    # Test setup
+    mock_session1 = MagicMock()
+    mock_session2 = MagicMock()
+    mock__create_session.side_effect = [mock_session1, mock_session2]
+
+    test_http_client = http_client.HTTPClient()
+
+    # Run unit under test
+    actual_response1 = test_http_client.get("https://test_host1/v2/_catalog", timeout=1)
+    actual_response2 = test_http_client.get("https://test_host1/v2/test_repo/tags/list", timeout=1)
+    actual_response3 = test_http_client.get("https://test_host2:5000/v2/_catalog", timeout=1)
+
+    # Check expectations
+    assert actual_response1 is mock_session1.get.return_value
+    assert actual_response2 is mock_session1.get.return_value
+    assert actual_response3 is mock_session2.get.return_value
+
+    assert mock__create_session.call_count == 2
+    assert mock_session1.get.call_count == 2
+    mock_session1.get.assert_called_with("https://test_host1/v2/test_repo/tags/list", timeout=1)
+    mock_session2.get.assert_called_once_with("https://test_host2:5000/v2/_catalog", timeout=1)
+
+@patch.object(http_client.HTTPClient, "_create_session")
+def test_HTTPClient_configure(mock__create_session: MagicMock) -> None:
+    # Test setup
+    mock_session = MagicMock()
+    mock__create_session.return_value = mock_session
+
+    test_http_client = http_client.HTTPClient()
+    test_http_client.get("https://test_host")
+
+    test_pool_size = 2
+    test_max_retries = 5
+    test_retry_backoff_factor = 1.5
+
+    # Run unit under test
+    test_http_client.configure(test_pool_size, test_max_retries, test_retry_backoff_factor)
+
+    # Check expectations
+    assert test_http_client.pool_size == test_pool_size
+    assert test_http_client.max_retries == test_max_retries
+    assert test_http_client.retry_backoff_factor == test_retry_backoff_factor
+    assert not test_http_client._sessions
+
+    mock_session.close.assert_called_once()
@@ -0,0 +1,195 @@
+"""Unit tests for the jobs."""
+# tests/core/test_jobs.py
+
+# Unit under test:
+import dem.core.jobs as jobs
+
+# Test framework
+import pytest
+from unittest.mock import MagicMock
+from threading import Event
+
+def _get_test_dev_env(exit_code: int = 0) -> MagicMock:
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.is_installed = True
+    mock_dev_env.is_installation_correct.return_value = True
+
+    def run_tasks(task_names, parallel, warm, output, cancel_event, name_suffix):
+        output(b"out\n", False)
+        output(b"err\n", True)
+        result = MagicMock()
+        result.exit_code = exit_code
+        result.to_dict.return_value = {"exit_code": exit_code}
+        return {task_name: result for task_name in task_names}
+
+    mock_dev_env.run_tasks.side_effect = run_tasks
+    return mock_dev_env
+
+def test_JobManager_submit() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    test_job_manager = jobs.JobManager(2, 2)
+
+    # Run unit under test
+    actual_job = test_job_manager.submit(mock_dev_env, ["task1"], 2, True)
+    actual_job.future.result(timeout=5)
+
+    # Check expectations
+    assert test_job_manager.get(actual_job.id) is actual_job
+    assert actual_job.status == jobs.Job.SUCCEEDED
+    assert actual_job.exit_code == 0
+    assert actual_job.read_output(0) == ([(b"out\n", False), (b"err\n", True)], 2, 0)
+    assert actual_job.to_dict()["results"] == {"task1": {"exit_code": 0}}
+
+    mock_dev_env.get_task_execution_order.assert_called_once_with(["task1"])
+    mock_dev_env.start_engines.assert_called_once()
+    mock_dev_env.run_tasks.assert_called_once_with(["task1"], 2, True, actual_job.write_output,
+                                                   actual_job.cancel_event, actual_job.id)
+
+    test_job_manager.shutdown()
+
+def test_JobManager_submit_non_zero_exit_code() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env(2)
+    test_job_manager = jobs.JobManager(1, 1)
+
+    # Run unit under test
+    actual_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    actual_job.future.result(timeout=5)
+
+    # Check expectations
+    assert actual_job.status == jobs.Job.FAILED
+    assert actual_job.exit_code == 2
+
+    test_job_manager.shutdown()
+
+def test_JobManager_submit_incorrect_installation() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    mock_dev_env.is_installation_correct.return_value = False
+    test_job_manager = jobs.JobManager(1, 1)
+
+    # Run unit under test
+    actual_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    actual_job.future.result(timeout=5)
+
+    # Check expectations
+    assert actual_job.status == jobs.Job.FAILED
+    assert actual_job.error == "Job error: The test_dev_env Development Environment is not installed correctly."
+    mock_dev_env.run_tasks.assert_not_called()
+
+    test_job_manager.shutdown()
+
+def test_JobManager_submit_invalid() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    mock_dev_env.get_task_execution_order.side_effect = jobs.DevEnvError("Unknown task: task1")
+    test_job_manager = jobs.JobManager(1, 1)
+
+    # Run unit under test
+    with pytest.raises(jobs.JobError) as exported_exception_info:
+        test_job_manager.submit(mock_dev_env, ["task1"])
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Job error: Development Environment error: Unknown task: task1"
+
+    test_job_manager.shutdown()
+
+def test_JobManager_queue_full_and_cancel() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    test_started = Event()
+    def run_until_cancelled(task_names, parallel, warm, output, cancel_event, name_suffix):
+        test_started.set()
+        assert cancel_event.wait(5)
+        return {}
+    mock_dev_env.run_tasks.side_effect = run_until_cancelled
+
+    test_job_manager = jobs.JobManager(1, 1)
+    test_running_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    assert test_started.wait(5)
+    test_queued_job = test_job_manager.submit(mock_dev_env, ["task2"])
+
+    # Run unit under test
+    with pytest.raises(jobs.JobQueueFullError):
+        test_job_manager.submit(mock_dev_env, ["task3"])
+    test_job_manager.cancel(test_queued_job.id)
+    test_job_manager.cancel(test_running_job.id)
+    test_running_job.future.result(timeout=5)
+
+    # Check expectations
+    assert test_queued_job.status == jobs.Job.CANCELLED
+    assert test_running_job.status == jobs.Job.CANCELLED
+    assert mock_dev_env.run_tasks.call_count == 1
+
+    test_job_manager.shutdown()
+
+def test_JobManager_cancel_warm() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    test_started = Event()
+    test_release = Event()
+    def run_until_released(task_names, parallel, warm, output, cancel_event, name_suffix):
+        test_started.set()
+        assert test_release.wait(5)
+        return {}
+    mock_dev_env.run_tasks.side_effect = run_until_released
+
+    test_job_manager = jobs.JobManager(1, 1)
+    test_running_job = test_job_manager.submit(mock_dev_env, ["task1"], warm=True)
+    assert test_started.wait(5)
+    test_queued_job = test_job_manager.submit(mock_dev_env, ["task2"], warm=True)
+
+    # Run unit under test
+    test_job_manager.cancel(test_queued_job.id)
+    with pytest.raises(jobs.JobError) as exported_exception_info:
+        test_job_manager.cancel(test_running_job.id)
+    test_release.set()
+    test_running_job.future.result(timeout=5)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == f"Job error: The job {test_running_job.id} " \
+        "runs in the warm containers, it can't be cancelled after it has been started."
+    assert test_queued_job.status == jobs.Job.CANCELLED
+    assert test_running_job.status == jobs.Job.SUCCEEDED
+    assert not test_running_job.cancel_event.is_set()
+    assert mock_dev_env.run_tasks.call_count == 1
+
+    test_job_manager.shutdown()
+
+def test_JobManager_delete() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    test_job_manager = jobs.JobManager(1, 1)
+    test_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    test_job.future.result(timeout=5)
+
+    # Run unit under test
+    actual_job = test_job_manager.delete(test_job.id)
+
+    # Check expectations
+    assert actual_job is test_job
+    assert test_job_manager.get(test_job.id) is None
+    assert test_job_manager.delete(test_job.id) is None
+
+    test_job_manager.shutdown()
+
+def test_JobManager_limits() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env()
+    test_job_manager = jobs.JobManager(1, 1, max_finished_jobs=1, max_job_output_size=4)
+    test_old_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    test_old_job.future.result(timeout=5)
+
+    # Run unit under test
+    actual_job = test_job_manager.submit(mock_dev_env, ["task1"])
+    actual_job.future.result(timeout=5)
+    test_job_manager.submit(mock_dev_env, ["task1"]).future.result(timeout=5)
+
+    # Check expectations
+    assert test_job_manager.get(test_old_job.id) is None
+    assert test_job_manager.get(actual_job.id) is actual_job
+    assert actual_job.read_output(0) == ([(b"err\n", True)], 2, 1)
+
+    test_job_manager.shutdown()
@@ -6,6 +6,7 @@ import dem.core.platform as platform
 
 # Test framework
 import pytest
+import requests.exceptions
 from unittest.mock import patch, MagicMock, call
 
 from dem.core.exceptions import DataStorageError
@@ -83,6 +84,31 @@ def test_Platform_assign_tool_image_instances_to_all_dev_envs() -> None:
 
     mock_dev_env.assign_tool_image_instances.assert_called_once_with(mock_tool_images)
 
+@patch.object(platform.BaseJSON, "backup_count", 0)
+@patch("dem.core.platform.truststore.inject_into_ssl")
+@patch.object(platform.Platform, "http_client")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_configure(mock___init__: MagicMock, mock_config_file: MagicMock,
+                            mock_http_client: MagicMock, mock_inject_into_ssl: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.use_native_system_cert_store = True
+    mock_config_file.http_pool_size = 4
+    mock_config_file.http_max_retries = 3
+    mock_config_file.http_retry_backoff_factor = 0.1
+    mock_config_file.json_backup_count = 3
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    test_platform.configure()
+
+    # Check expectations
+    mock_inject_into_ssl.assert_called_once()
+    mock_http_client.configure.assert_called_once_with(4, 3, 0.1)
+    assert platform.BaseJSON.backup_count == 3
+
 @patch("dem.core.platform.ToolImages")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_tool_images(mock___init__: MagicMock, mock_ToolImages: MagicMock) -> None:
@@ -283,70 +309,117 @@ def test_Platform_get_dev_env_by_name_no_match(mock___init__: MagicMock) -> None
 
     mock___init__.assert_called_once()
 
+def _get_test_install_dev_env(tasks: list[tuple[str, str]]) -> MagicMock:
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.enable_docker_network = False
+    mock_dev_env.tasks = {}
+    mock_dev_env.assigned_tool_images = {}
+    for index, (image, host_name) in enumerate(tasks):
+        mock_task = MagicMock()
+        mock_task.image = image
+        mock_task.host_name = host_name
+        mock_dev_env.tasks[f"test_task{index}"] = mock_task
+        mock_dev_env.assigned_tool_images[image] = MagicMock()
+    return mock_dev_env
+
+def _get_test_host(name: str) -> MagicMock:
+    mock_host = MagicMock()
+    mock_host.name = name
+    mock_host.container_engine.is_image_local.return_value = False
+    mock_host.container_engine.pull_stream.side_effect = lambda image: iter([
+        {"status": f"Pulling {image}"}
+    ])
+    return mock_host
+
 @patch.object(platform.Platform, "flush_dev_env_properties")
-@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "config_file")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
-def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_input: MagicMock, 
-                                         mock_container_engine: MagicMock, 
+def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_output: MagicMock, 
+                                         mock_config_file: MagicMock,
                                          mock_flush_dev_env_properties: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
+    mock_config_file.max_parallel_pulls = 4
 
-    mock_dev_env = MagicMock()    
-    mock_tool_image0 = MagicMock()
-    mock_tool_image0.name = "test_image_name0:test_image_version0"
-    mock_tool_image0.availability = platform.ToolImage.LOCAL_AND_REGISTRY
-    mock_tool_image1 = MagicMock()
-    mock_tool_image1.name = "test_image_name1:test_image_version1"
-    mock_tool_image1.availability = platform.ToolImage.REGISTRY_ONLY
-    mock_tool_image2 = MagicMock()
-    mock_tool_image2.name = "test_image_name2:test_image_version2"
-    mock_tool_image2.availability = platform.ToolImage.REGISTRY_ONLY
-    mock_tool_image3 = MagicMock()
-    mock_tool_image3.name = "test_image_name3:test_image_version3"
-    mock_tool_image3.availability = platform.ToolImage.LOCAL_ONLY
-    mock_dev_env.tool_images = [mock_tool_image0, mock_tool_image1, 
-                                 mock_tool_image2, mock_tool_image3]
+    mock_local_host = _get_test_host("local")
+    mock_remote_host = _get_test_host("test_remote")
+    test_hosts = {
+        "local": mock_local_host,
+        "test_remote": mock_remote_host
+    }
+
+    mock_dev_env = _get_test_install_dev_env([
+        ("test_image1:latest", "local"),
+        ("test_image2:latest", "local"),
+        ("test_image1:latest", "local"),
+        ("test_image1:latest", "test_remote"),
+    ])
 
     test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.side_effect = lambda name: test_hosts[name]
+
+    actual_items = []
+    mock_user_output.progress_generator.side_effect = lambda generator: actual_items.extend(generator)
 
     # Run unit under test
     test_platform.install_dev_env(mock_dev_env)
 
     # Check expectations
-    mock___init__.assert_called_once()
+    assert sorted(actual_items, key=lambda item: item["status"]) == [
+        {"status": "Pulling test_image1:latest", "image": "test_image1:latest"},
+        {"status": "Pulling test_image1:latest", "image": "test_image1:latest"},
+        {"status": "Pulling test_image2:latest", "image": "test_image2:latest"},
+    ]
+    assert mock_dev_env.is_installed is True
 
-    expected_registry_only_tool_images: list[str] = ["test_image_name1:test_image_version1", 
-                                                     "test_image_name2:test_image_version2"]
-    mock_user_input.msg.assert_has_calls([
-        call(f"\nPulling image {expected_registry_only_tool_images[0]}", is_title=True),
-        call(f"\nPulling image {expected_registry_only_tool_images[1]}", is_title=True)
-    ])
-    mock_container_engine.pull.assert_has_calls([
-        call(expected_registry_only_tool_images[0]),
-        call(expected_registry_only_tool_images[1])
+    mock___init__.assert_called_once()
+    mock_user_output.msg.assert_has_calls([
+        call("\nPulling the Tool Images", is_title=True),
+        call("Pulling image test_image1:latest to host local"),
+        call("Pulling image test_image2:latest to host local"),
+        call("Pulling image test_image1:latest to host test_remote"),
     ])
+    assert mock_local_host.container_engine.pull_stream.call_count == 2
+    mock_local_host.container_engine.pull_stream.assert_has_calls([call("test_image1:latest"), 
+                                                                   call("test_image2:latest")],
+                                                                  any_order=True)
+    mock_remote_host.container_engine.pull_stream.assert_called_once_with("test_image1:latest")
     mock_flush_dev_env_properties.assert_called_once()
 
-@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "flush_dev_env_properties")
+@patch.object(platform.Platform, "config_file")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_install_dev_env_pull_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
-                                               mock_container_engine: MagicMock) -> None:
+                                               mock_config_file: MagicMock,
+                                               mock_flush_dev_env_properties: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
-
-    mock_dev_env = MagicMock()
-    mock_tool_image = MagicMock()
-    mock_tool_image.name = "test_image_name1:test_image_version1"
-    mock_tool_image.availability = platform.ToolImage.REGISTRY_ONLY
-    mock_dev_env.tool_images = [mock_tool_image]
+    mock_config_file.max_parallel_pulls = 2
 
     test_exception_text = "test_exception_text"
-    mock_container_engine.pull.side_effect = platform.ContainerEngineError(test_exception_text)
+    mock_host = _get_test_host("local")
+    def pull_stream(image: str):
+        if image == "test_failing_image:latest":
+            raise platform.ContainerEngineError(test_exception_text)
+        yield {"status": f"Pulling {image}"}
+    mock_host.container_engine.pull_stream.side_effect = pull_stream
+
+    mock_dev_env = _get_test_install_dev_env([
+        ("test_image:latest", "local"),
+        ("test_failing_image:latest", "local"),
+    ])
+    mock_dev_env.is_installed = False
 
     test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.return_value = mock_host
+
+    actual_items = []
+    mock_user_output.progress_generator.side_effect = lambda generator: actual_items.extend(generator)
 
     # Run unit under test
     with pytest.raises(platform.PlatformError) as exported_exception_info:
@@ -355,13 +428,153 @@ def test_Platform_install_dev_env_pull_failure(mock___init__: MagicMock, mock_us
     # Check expectations
     assert str(exported_exception_info.value) == "Platform error: Dev Env install failed. --> " + \
                                                  f"Container engine error: {test_exception_text}"
+    assert actual_items == [{"status": "Pulling test_image:latest", "image": "test_image:latest"}]
+    assert mock_dev_env.is_installed is False
+
+    mock___init__.assert_called_once()
+    mock_flush_dev_env_properties.assert_not_called()
+
+@patch.object(platform.Platform, "flush_dev_env_properties")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_pull_connection_lost(mock___init__: MagicMock, 
+                                                       mock_user_output: MagicMock,
+                                                       mock_config_file: MagicMock,
+                                                       mock_flush_dev_env_properties: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_parallel_pulls = 2
+
+    mock_host = _get_test_host("local")
+    def pull_stream(image: str):
+        yield {"status": f"Pulling {image}"}
+        raise requests.exceptions.ConnectionError("test_connection_lost")
+    mock_host.container_engine.pull_stream.side_effect = pull_stream
+
+    mock_dev_env = _get_test_install_dev_env([
+        ("test_image:latest", "local"),
+    ])
+    mock_dev_env.is_installed = False
+
+    test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.return_value = mock_host
+
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.install_dev_env(mock_dev_env)
 
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Dev Env install failed. --> " + \
+        "Container engine error: Failed to pull test_image:latest: test_connection_lost"
+    assert mock_dev_env.is_installed is False
+
+    mock_flush_dev_env_properties.assert_not_called()
+
+@patch.object(platform.Platform, "flush_dev_env_properties")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_skip_available_images(mock___init__: MagicMock, 
+                                                        mock_user_output: MagicMock,
+                                                        mock_config_file: MagicMock,
+                                                        mock_flush_dev_env_properties: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_parallel_pulls = 4
+    mock_config_file.check_image_digests = True
+
+    test_local_images = {"test_up_to_date_image:latest", "test_outdated_image:latest"}
+    mock_host = _get_test_host("local")
+    mock_host.container_engine.is_image_local.side_effect = lambda image: image in test_local_images
+    mock_host.container_engine.is_image_up_to_date.side_effect = lambda image: image == "test_up_to_date_image:latest"
+
+    mock_dev_env = _get_test_install_dev_env([
+        ("test_up_to_date_image:latest", "local"),
+        ("test_outdated_image:latest", "local"),
+        ("test_missing_image:latest", "local"),
+    ])
+
+    test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.return_value = mock_host
+
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
+
+    # Run unit under test
+    test_platform.install_dev_env(mock_dev_env)
+
+    # Check expectations
+    assert mock_dev_env.is_installed is True
+
+    mock___init__.assert_called_once()
+    mock_user_output.msg.assert_has_calls([
+        call("The test_up_to_date_image:latest image is already available on host local."),
+        call("\nPulling the Tool Images", is_title=True),
+        call("Pulling image test_outdated_image:latest to host local"),
+        call("Pulling image test_missing_image:latest to host local"),
+    ])
+    assert mock_host.container_engine.pull_stream.call_count == 2
+    mock_host.container_engine.pull_stream.assert_has_calls([call("test_outdated_image:latest"), 
+                                                             call("test_missing_image:latest")],
+                                                            any_order=True)
+    mock_host.container_engine.is_image_up_to_date.assert_has_calls([call("test_up_to_date_image:latest"), 
+                                                                     call("test_outdated_image:latest")])
+    mock_flush_dev_env_properties.assert_called_once()
+
+@patch.object(platform.Platform, "flush_dev_env_properties")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_force_pull(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                             mock_config_file: MagicMock,
+                                             mock_flush_dev_env_properties: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_parallel_pulls = 4
+
+    mock_host = _get_test_host("local")
+    mock_host.container_engine.is_image_local.return_value = True
+
+    mock_dev_env = _get_test_install_dev_env([("test_image:latest", "local")])
+
+    test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.return_value = mock_host
+
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
+
+    # Run unit under test
+    test_platform.install_dev_env(mock_dev_env, force_pull=True)
+
+    # Check expectations
     mock___init__.assert_called_once()
+    mock_host.container_engine.is_image_local.assert_not_called()
+    mock_host.container_engine.pull_stream.assert_called_once_with("test_image:latest")
+    mock_flush_dev_env_properties.assert_called_once()
+
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_host_not_available(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    mock_dev_env = _get_test_install_dev_env([("test_image:latest", "test_missing_host")])
 
-    expected_registry_only_tool_image = "test_image_name1:test_image_version1"
-    mock_user_output.msg.assert_called_once_with(f"\nPulling image {expected_registry_only_tool_image}", 
-                                                 is_title=True)
-    mock_container_engine.pull.assert_called_once_with(expected_registry_only_tool_image)
+    test_platform = platform.Platform()
+    test_platform.hosts = MagicMock()
+    test_platform.hosts.get_host_by_name.return_value = None
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.install_dev_env(mock_dev_env)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: The test_missing_host host is not available."
+
+    mock___init__.assert_called_once()
 
 @patch.object(platform.Platform, "flush_dev_env_properties")
 @patch.object(platform.Platform, "container_engine")
@@ -0,0 +1,97 @@
+"""Unit tests for the platform state."""
+# tests/core/test_platform_state.py
+
+# Unit under test:
+import dem.core.platform_state as platform_state
+
+# Test framework
+from unittest.mock import MagicMock
+
+def _get_test_dev_env(name: str, container_engines: list[MagicMock]) -> MagicMock:
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = name
+    mock_dev_env.tasks = {}
+    for i, container_engine in enumerate(container_engines):
+        mock_task = MagicMock()
+        mock_task.host.container_engine = container_engine
+        mock_dev_env.tasks[f"task{i}"] = mock_task
+    return mock_dev_env
+
+def test_start_engines() -> None:
+    # Test setup
+    mock_container_engine1 = MagicMock()
+    mock_container_engine2 = MagicMock()
+    mock_dev_env1 = _get_test_dev_env("dev_env1", [mock_container_engine1, mock_container_engine1])
+    mock_dev_env2 = _get_test_dev_env("dev_env2", [mock_container_engine1, mock_container_engine2])
+    test_platform_state = platform_state.PlatformState()
+
+    # Run unit under test
+    test_platform_state.start_engines(mock_dev_env1)
+    test_platform_state.start_engines(mock_dev_env1)
+    test_platform_state.start_engines(mock_dev_env2)
+    test_platform_state.close()
+
+    # Check expectations
+    mock_dev_env1.start_engines.assert_called_once()
+    mock_dev_env2.start_engines.assert_called_once()
+    mock_container_engine1.add_event_listener.assert_called_once_with(test_platform_state._on_event)
+    mock_container_engine2.add_event_listener.assert_called_once_with(test_platform_state._on_event)
+    mock_container_engine1.remove_event_listener.assert_called_once_with(test_platform_state._on_event)
+    mock_container_engine2.remove_event_listener.assert_called_once_with(test_platform_state._on_event)
+
+def test_is_installation_correct() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env("dev_env", [])
+    mock_dev_env.is_installation_correct.side_effect = [True, False]
+    test_platform_state = platform_state.PlatformState()
+
+    # Run unit under test
+    actual_first = test_platform_state.is_installation_correct(mock_dev_env)
+    actual_cached = test_platform_state.is_installation_correct(mock_dev_env)
+    test_platform_state._on_event({"Type": "image", "Action": "delete"})
+    actual_after_event = test_platform_state.is_installation_correct(mock_dev_env)
+
+    # Check expectations
+    assert actual_first is True
+    assert actual_cached is True
+    assert actual_after_event is False
+    assert mock_dev_env.is_installation_correct.call_count == 2
+
+def test_is_installation_correct_invalidated_during_check() -> None:
+    # Test setup
+    mock_dev_env = _get_test_dev_env("dev_env", [])
+    test_platform_state = platform_state.PlatformState()
+
+    def check() -> bool:
+        test_platform_state.invalidate("dev_env")
+        return True
+    mock_dev_env.is_installation_correct.side_effect = check
+
+    # Run unit under test
+    test_platform_state.is_installation_correct(mock_dev_env)
+    test_platform_state.is_installation_correct(mock_dev_env)
+
+    # Check expectations
+    assert mock_dev_env.is_installation_correct.call_count == 2
+
+def test_status_change_notification() -> None:
+    # Test setup
+    mock_dev_env1 = _get_test_dev_env("dev_env1", [])
+    mock_dev_env1.is_installation_correct.side_effect = [True, False]
+    mock_dev_env2 = _get_test_dev_env("dev_env2", [])
+    mock_dev_env2.is_installation_correct.side_effect = [True, True]
+    test_platform_state = platform_state.PlatformState()
+    test_platform_state.is_installation_correct(mock_dev_env1)
+    test_platform_state.is_installation_correct(mock_dev_env2)
+    mock_listener = MagicMock()
+    test_platform_state.add_listener(mock_listener)
+
+    # Run unit under test
+    test_platform_state._on_event({"Type": "container", "Action": "die"})
+    test_platform_state._on_event({"Type": "image", "Action": "delete"})
+    test_platform_state.remove_listener(mock_listener)
+
+    # Check expectations
+    mock_listener.assert_called_once_with("dev_env1", False)
+    assert test_platform_state.is_installation_correct(mock_dev_env1) is False
+    assert mock_dev_env1.is_installation_correct.call_count == 2
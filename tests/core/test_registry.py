@@ -16,6 +16,7 @@ class HelperRegistry(registry.Registry):
     """
     _tag_endpoint_response_key = "results"
     _repo_endpoint_response_key = "repositories"
+    _page_size_query_param = "n"
 
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
         return super()._append_repo_with_tag(endpoint_response, repo)
@@ -26,6 +27,9 @@ class HelperRegistry(registry.Registry):
     def _get_tag_endpoint_url(self, repo_name: str) -> str:
         return super()._get_tag_endpoint_url(repo_name)
 
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        return super()._get_next_page_url(response, endpoint_response)
+
 def test_Registry___init___RegistryError() -> None:
     # Test setup
     test_registry_config = {}
@@ -35,143 +39,287 @@ def test_Registry___init___RegistryError() -> None:
         HelperRegistry(test_registry_config)
 
 @patch.object(registry.Core, "config_file")
-@patch.object(registry.Registry, "_append_repo_with_tag")
-@patch.object(registry.Registry, "_get_tag_endpoint_url")
+@patch.object(registry.Registry, "_get_next_page_url")
 @patch.object(registry.Registry, "__init__")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags(mock_requests_get: MagicMock, mock___init__: MagicMock,
-                             mock__get_tag_endpoint_url: MagicMock,
-                             mock__append_repo_with_tag: MagicMock, mock_config_file: MagicMock) -> None:
+@patch.object(registry.Core.http_client, "get")
+def test_Registry__request_pages(mock_http_client_get: MagicMock, mock___init__: MagicMock,
+                                 mock__get_next_page_url: MagicMock, 
+                                 mock_config_file: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
-    test_registry_config = {}
+    test_url = "test_url"
+    test_next_page_url = "test_next_page_url"
+    test_http_request_timeout_s = 10
+    test_registry_page_size = 2
+    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+    mock_config_file.registry_page_size = test_registry_page_size
 
-    test_repo = "test_repo"
+    mock_response1 = MagicMock()
+    mock_response1.status_code = requests.codes.ok
+    mock_response1.json.return_value = "test_endpoint_response1"
+    mock_response1.headers = {}
+    mock_response2 = MagicMock()
+    mock_response2.status_code = requests.codes.ok
+    mock_response2.json.return_value = "test_endpoint_response2"
+    mock_response2.headers = {}
+    mock_http_client_get.side_effect = [mock_response1, mock_response2]
+
+    mock__get_next_page_url.side_effect = [test_next_page_url, None]
+
+    test_registry = HelperRegistry({})
+    test_registry.cache = {}
+    test_registry._new_cached_pages = {}
+
+    # Run unit under test
+    actual_endpoint_responses = list(test_registry._request_pages(test_url, "test_failure_text"))
+
+    # Check expectations
+    assert actual_endpoint_responses == ["test_endpoint_response1", "test_endpoint_response2"]
+
+    assert test_registry._new_cached_pages == {}
+
+    mock_http_client_get.assert_has_calls([
+        call(test_url, params={"n": test_registry_page_size}, headers=None, 
+             timeout=test_http_request_timeout_s),
+        call(test_next_page_url, params=None, headers=None, timeout=test_http_request_timeout_s)
+    ])
+    mock__get_next_page_url.assert_has_calls([
+        call(mock_response1, "test_endpoint_response1"),
+        call(mock_response2, "test_endpoint_response2")
+    ])
+
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "__init__")
+@patch.object(registry.Core.http_client, "get")
+def test_Registry__request_pages_invalid_status(mock_http_client_get: MagicMock, 
+                                                mock___init__: MagicMock,
+                                                mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    mock_http_client_get.return_value = mock_response
+
+    test_failure_text = "test_failure_text"
+
+    test_registry = HelperRegistry({})
+    test_registry.cache = {}
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as exported_exception_info:
+        list(test_registry._request_pages("test_url", test_failure_text))
+
+    # Check expectations
+    assert str(exported_exception_info.value) == f"Registry error: Error in communication with the registry. {test_failure_text} Response status code: 404"
+
+    mock_http_client_get.assert_called_once()
+    mock_response.json.assert_not_called()
+
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Registry, "__init__")
+@patch.object(registry.Core.http_client, "get")
+def test_Registry__request_pages_store_etag(mock_http_client_get: MagicMock, 
+                                            mock___init__: MagicMock,
+                                            mock__get_next_page_url: MagicMock, 
+                                            mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_url = "test_url"
+    mock_config_file.registry_page_size = 2
+
+    test_endpoint_response = {
+        "repositories": [
+            {
+                "name": "test_repo",
+                "description": "not cached"
+            }
+        ],
+        "count": 1
+    }
     mock_response = MagicMock()
     mock_response.status_code = requests.codes.ok
-    test_endpoint_response = "test"
     mock_response.json.return_value = test_endpoint_response
-    mock_requests_get.return_value = mock_response
-    test_tag_endpoint_url = "test_tag_endpoint_url"
-    mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+    mock_response.headers = {"ETag": "test_etag"}
+    mock_http_client_get.return_value = mock_response
+
+    mock__get_next_page_url.return_value = None
+
+    test_registry = HelperRegistry({})
+    test_registry.cache = {}
+    test_registry._new_cached_pages = {}
 
+    # Run unit under test
+    actual_endpoint_responses = list(test_registry._request_pages(test_url, "test_failure_text"))
+
+    # Check expectations
+    assert actual_endpoint_responses == [test_endpoint_response]
+    assert test_registry._new_cached_pages == {
+        test_url: {
+            "etag": "test_etag",
+            "body": {
+                "repositories": [
+                    {
+                        "name": "test_repo"
+                    }
+                ]
+            },
+            "next": None
+        }
+    }
+
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Registry, "__init__")
+@patch.object(registry.Core.http_client, "get")
+def test_Registry__request_pages_not_modified(mock_http_client_get: MagicMock, 
+                                              mock___init__: MagicMock,
+                                              mock__get_next_page_url: MagicMock, 
+                                              mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_url = "test_url"
     test_http_request_timeout_s = 10
+    test_registry_page_size = 2
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+    mock_config_file.registry_page_size = test_registry_page_size
 
-    test_registry = HelperRegistry(test_registry_config)
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_modified
+    mock_http_client_get.return_value = mock_response
+
+    test_cached_page = {
+        "etag": "test_etag",
+        "body": "test_cached_endpoint_response",
+        "next": None
+    }
+
+    test_registry = HelperRegistry({})
+    test_registry.cache = {
+        "pages": {
+            test_url: test_cached_page
+        }
+    }
+    test_registry._new_cached_pages = {}
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_endpoint_responses = list(test_registry._request_pages(test_url, "test_failure_text"))
 
     # Check expectations
-    mock___init__.assert_called_once()
-    mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
-    mock_response.json.assert_called_once()
-    mock__append_repo_with_tag.assert_called_once_with(test_endpoint_response, test_repo)
+    assert actual_endpoint_responses == ["test_cached_endpoint_response"]
+    assert test_registry._new_cached_pages == {test_url: test_cached_page}
 
-@patch.object(registry.Core, "config_file")
-@patch.object(registry.Core, "user_output")
+    mock_http_client_get.assert_called_once_with(test_url, params={"n": test_registry_page_size},
+                                                 headers={"If-None-Match": "test_etag"},
+                                                 timeout=test_http_request_timeout_s)
+    mock_response.json.assert_not_called()
+    mock__get_next_page_url.assert_not_called()
+
+@patch.object(registry.Registry, "_request_pages")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
 @patch.object(registry.Registry, "__init__")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock, mock___init__: MagicMock,
-                                           mock__get_tag_endpoint_url: MagicMock,
-                                           mock_user_output: MagicMock, mock_config_file: MagicMock) -> None:
+def test_Registry__request_tags(mock___init__: MagicMock, mock__get_tag_endpoint_url: MagicMock,
+                                mock__request_pages: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
-    test_registry_config = {}
-
     test_repo = "test_repo"
-    test_exception_text = "test_exception_text"
-    mock_requests_get.side_effect = registry.requests.exceptions.MissingSchema(test_exception_text)
     test_tag_endpoint_url = "test_tag_endpoint_url"
     mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+    test_endpoint_responses = ["test_endpoint_response1", "test_endpoint_response2"]
+    mock__request_pages.return_value = iter(test_endpoint_responses)
 
-    test_http_request_timeout_s = 10
-    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
-
-    test_registry = HelperRegistry(test_registry_config)
+    test_registry = HelperRegistry({})
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_endpoint_responses = test_registry._request_tags(test_repo)
 
     # Check expectations
+    assert actual_endpoint_responses == test_endpoint_responses
+
     mock___init__.assert_called_once()
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
-    mock_user_output.error.assert_called_once_with(test_exception_text)
-    mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
+    mock__request_pages.assert_called_once_with(test_tag_endpoint_url, "Failed to retrieve tags.")
 
-@patch.object(registry.Core, "config_file")
 @patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_request_pages")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
 @patch.object(registry.Registry, "__init__")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock, mock___init__: MagicMock,
-                                            mock__get_tag_endpoint_url: MagicMock,
-                                            mock_user_output: MagicMock, 
-                                            mock_config_file: MagicMock) -> None:
+def test_Registry__request_tags_exception(mock___init__: MagicMock, 
+                                          mock__get_tag_endpoint_url: MagicMock,
+                                          mock__request_pages: MagicMock,
+                                          mock_user_output: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
-    test_registry_config = {}
-
     test_repo = "test_repo"
-    mock_response = MagicMock()
-    mock_response.status_code = 0
-    mock_requests_get.return_value = mock_response
-    test_tag_endpoint_url = "test_tag_endpoint_url"
-    mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
-
-    test_http_request_timeout_s = 10
-    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+    test_exception_text = "test_exception_text"
+    mock__request_pages.side_effect = registry.requests.exceptions.MissingSchema(test_exception_text)
 
-    test_registry = HelperRegistry(test_registry_config)
+    test_registry = HelperRegistry({})
 
     # Run unit under test
-    test_registry._list_tags(test_repo)
+    actual_endpoint_responses = test_registry._request_tags(test_repo)
 
     # Check expectations
-    mock___init__.assert_called_once()
-    mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
-    mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(mock_response.status_code))
+    assert actual_endpoint_responses is None
+
+    mock_user_output.error.assert_called_once_with(test_exception_text)
     mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
 
-@patch("dem.core.registry.requests.get")
-@patch.object(registry.Registry, "_list_tags")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_append_repo_with_tag")
+@patch.object(registry.Registry, "_request_tags")
+@patch.object(registry.Registry, "_request_pages")
 @patch.object(registry.Registry, "_get_repo_endpoint_url")
 @patch.object(registry.Registry, "__init__")
 def test_Registry__list_repos(mock___init__: MagicMock, mock__get_repo_endpoint_url: MagicMock,
-                              mock__list_tags: MagicMock, mock_requests_get: MagicMock) -> None:
+                              mock__request_pages: MagicMock, mock__request_tags: MagicMock, 
+                              mock__append_repo_with_tag: MagicMock, 
+                              mock_config_file: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
 
     test_repo_endpoint_url = "test_repo_endpoint_url"
     mock__get_repo_endpoint_url.return_value = test_repo_endpoint_url
+    mock_config_file.max_concurrency = 2
 
-    mock_response = MagicMock()
-    mock_response.status_code = requests.codes.ok
+    test_repo_endpoint_responses = [
+        {
+            "repositories": [
+                {
+                    "name": "test_repo1"
+                },
+                {
+                    "name": "test_repo2"
+                }
+            ]
+        },
+        {
+            "repositories": [
+                {
+                    "name": "test_repo3"
+                }
+            ]
+        }
+    ]
+    mock__request_pages.return_value = iter(test_repo_endpoint_responses)
 
-    test_endpoint_response = {
-        "repositories": [
-            {
-                "name": "test_repo1"
-            },
-            {
-                "name": "test_repo2"
-            }
-        ]
+    test_tag_responses = {
+        "test_repo1": ["test_tag_response1a", "test_tag_response1b"],
+        "test_repo2": None,
+        "test_repo3": ["test_tag_response3"]
     }
-
-    mock_requests_get.return_value = mock_response
-    mock_response.json.return_value = test_endpoint_response
+    mock__request_tags.side_effect = lambda repo_name: test_tag_responses[repo_name]
 
     test_registry = HelperRegistry({})
-    test_registry.config_file.http_request_timeout_s = 10
+    test_registry._repos = []
+    test_registry.cache = {}
+    test_registry._new_cached_pages = {}
 
     # Run unit under test
     actual_generator_items = []
@@ -181,182 +329,182 @@ def test_Registry__list_repos(mock___init__: MagicMock, mock__get_repo_endpoint_
     # Check expectations
     expected_generator_items = [
         "Loading image data from: test_repo1",
-        "Loading image data from: test_repo2"
+        "Loading image data from: test_repo2",
+        "Loading image data from: test_repo3"
     ]
     assert expected_generator_items == actual_generator_items
 
     mock___init__.assert_called_once()
-    mock_requests_get.assert_called_once_with(test_repo_endpoint_url, 
-                                               timeout=test_registry.config_file.http_request_timeout_s)
-    mock_response.json.assert_called_once()
-    mock__list_tags.assert_has_calls([call("test_repo1"), call("test_repo2")])
+    mock__request_pages.assert_called_once_with(test_repo_endpoint_url, 
+                                                "Failed to retrieve the repositories.")
+    mock__request_tags.assert_has_calls([call("test_repo1"), call("test_repo2"), call("test_repo3")], 
+                                        any_order=True)
+    # The repos are appended in the original order, the failed one is skipped.
+    assert mock__append_repo_with_tag.call_args_list == [
+        call("test_tag_response1a", "test_repo1"),
+        call("test_tag_response1b", "test_repo1"),
+        call("test_tag_response3", "test_repo3")
+    ]
+    # A repository has been skipped, so the repo list is not cached.
+    assert "repos" not in test_registry.cache
 
-@patch("dem.core.registry.requests.get")
+@patch.object(registry.Core, "config_file")
 @patch.object(registry.Registry, "user_output")
+@patch.object(registry.Registry, "_request_pages")
 @patch.object(registry.Registry, "_get_repo_endpoint_url")
-def test_Registry__list_repos_requests_get_Exception(mock__get_repo_endpoint_url: MagicMock,
-                                                     mock_user_output: MagicMock, 
-                                                     mock_requests_get: MagicMock) -> None:
+def test_Registry__list_repos_Exception(mock__get_repo_endpoint_url: MagicMock,
+                                       mock__request_pages: MagicMock,
+                                       mock_user_output: MagicMock,
+                                       mock_config_file: MagicMock) -> None:
     # Test setup
     test_registry_config = {
         "url": "test_url",
         "name": "test_name",
         "namespace": "test_namespace"
     }
-
-    test_repo_endpoint_url = "test_repo_endpoint_url"
-    mock__get_repo_endpoint_url.return_value = test_repo_endpoint_url
+    mock_config_file.max_concurrency = 2
 
     test_exception_text = "test_exception_text"
-    mock_requests_get.side_effect = Exception(test_exception_text)
+    mock__request_pages.side_effect = Exception(test_exception_text)
 
     test_registry = HelperRegistry(test_registry_config)
-    test_registry.config_file.http_request_timeout_s = 10
 
     # Run unit under test
     for _ in test_registry._list_repos():
         pass
 
     # Check expectations
-    mock_requests_get.assert_called_once_with(test_repo_endpoint_url, 
-                                               timeout=test_registry.config_file.http_request_timeout_s)
     mock_user_output.error.assert_called_once_with(test_exception_text)
     mock_user_output.msg.assert_called_once_with(f"Skipping [bold]{test_registry_config['name']}[/bold].")
 
-@patch("dem.core.registry.requests.get")
+@patch.object(registry.Core, "config_file")
 @patch.object(registry.Registry, "user_output")
+@patch.object(registry.Registry, "_request_pages")
 @patch.object(registry.Registry, "_get_repo_endpoint_url")
-def test_Registry__list_repos_request_failed(mock__get_repo_endpoint_url: MagicMock,
-                                             mock_user_output: MagicMock, 
-                                             mock_requests_get: MagicMock) -> None:
+def test_Registry__list_repos_JSONDecodeError(mock__get_repo_endpoint_url: MagicMock,
+                                              mock__request_pages: MagicMock,
+                                              mock_user_output: MagicMock,
+                                              mock_config_file: MagicMock) -> None:
     # Test setup
     test_registry_config = {
         "url": "test_url",
         "name": "test_name",
         "namespace": "test_namespace"
     }
+    mock_config_file.max_concurrency = 2
 
-    test_repo_endpoint_url = "test_repo_endpoint_url"
-    mock__get_repo_endpoint_url.return_value = test_repo_endpoint_url
-
-    mock_response = MagicMock()
-    mock_response.status_code = "404"
-
-    mock_requests_get.return_value = mock_response
+    mock__request_pages.side_effect = registry.requests.exceptions.JSONDecodeError("test", "test", 0)
 
     test_registry = HelperRegistry(test_registry_config)
-    test_registry.config_file.http_request_timeout_s = 10
 
     # Run unit under test
     for _ in test_registry._list_repos():
         pass
 
     # Check expectations
-    mock_requests_get.assert_called_once_with(test_repo_endpoint_url, 
-                                               timeout=test_registry.config_file.http_request_timeout_s)
-    mock_user_output.error.assert_called_once_with(f"Error in communication with the registry. Failed to retrieve the repositories. Response status code: {mock_response.status_code}")
+    mock_user_output.error.assert_called_once_with(f"Invalid JSON format in response from the registry: test: line 1 column 1 (char 0)")
     mock_user_output.msg.assert_called_once_with(f"Skipping [bold]{test_registry_config['name']}[/bold].")
 
-@patch("dem.core.registry.requests.get")
-@patch.object(registry.Registry, "user_output")
-@patch.object(registry.Registry, "_get_repo_endpoint_url")
-def test_Registry__list_repos_JSONDecodeError(mock__get_repo_endpoint_url: MagicMock,
-                                              mock_user_output: MagicMock, 
-                                              mock_requests_get: MagicMock) -> None:
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Registry, "_is_cache_fresh")
+@patch.object(registry.Registry, "_list_repos")
+@patch.object(registry.Registry, "__init__")
+def test_Registry_repos(mock___init_: MagicMock, mock__list_repos: MagicMock, 
+                        mock__is_cache_fresh: MagicMock, mock_user_output: MagicMock):
     # Test setup
-    test_registry_config = {
-        "url": "test_url",
-        "name": "test_name",
-        "namespace": "test_namespace"
-    }
-
-    test_repo_endpoint_url = "test_repo_endpoint_url"
-    mock__get_repo_endpoint_url.return_value = test_repo_endpoint_url
+    mock___init_.return_value = None
+    mock__is_cache_fresh.return_value = False
 
-    mock_response = MagicMock()
-    mock_response.status_code = requests.codes.ok
+    test_registry_config = {}
 
-    mock_requests_get.return_value = mock_response
-    mock_response.json.side_effect = registry.requests.exceptions.JSONDecodeError("test", "test", 0)
+    mock_generator = MagicMock()
+    mock__list_repos.return_value = mock_generator
 
     test_registry = HelperRegistry(test_registry_config)
-    test_registry.config_file.http_request_timeout_s = 10
+    test_registry._repos = ["stale_repo"]
 
     # Run unit under test
-    for _ in test_registry._list_repos():
-        pass
+    actual_repos = test_registry.repos
 
     # Check expectations
-    mock_requests_get.assert_called_once_with(test_repo_endpoint_url, 
-                                               timeout=test_registry.config_file.http_request_timeout_s)
-    mock_response.json.assert_called_once()
-    mock_user_output.error.assert_called_once_with(f"Invalid JSON format in response from the registry: test: line 1 column 1 (char 0)")
-    mock_user_output.msg.assert_called_once_with(f"Skipping [bold]{test_registry_config['name']}[/bold].")
+    assert actual_repos == []
 
-@patch("dem.core.registry.requests.get")
-@patch.object(registry.Registry, "user_output")
-@patch.object(registry.Registry, "_get_repo_endpoint_url")
-def test_Registry__list_repos_json_Exception(mock__get_repo_endpoint_url: MagicMock,
-                                             mock_user_output: MagicMock, 
-                                             mock_requests_get: MagicMock) -> None:
+    mock___init_.assert_called_once()
+    mock__list_repos.assert_called_once()
+    mock_user_output.status_generator.assert_called_once_with(mock_generator)
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_repos")
+def test_Registry_repos_from_cache(mock__list_repos: MagicMock, mock_config_file: MagicMock,
+                                   mock_user_output: MagicMock):
     # Test setup
+    mock_config_file.registry_cache_ttl_s = 600
     test_registry_config = {
-        "url": "test_url",
         "name": "test_name",
-        "namespace": "test_namespace"
+        "url": "test_url"
+    }
+    test_cached_repos = ["test_url/test_repo:latest"]
+    test_cache = {
+        "url": "test_url",
+        "namespace": "",
+        "updated_at": registry.time.time(),
+        "repos": test_cached_repos
     }
-
-    test_repo_endpoint_url = "test_repo_endpoint_url"
-    mock__get_repo_endpoint_url.return_value = test_repo_endpoint_url
-
-    mock_response = MagicMock()
-    mock_response.status_code = requests.codes.ok
-
-    mock_requests_get.return_value = mock_response
-    test_exception_text = "test_exception_text"
-    mock_response.json.side_effect = Exception(test_exception_text)
 
     test_registry = HelperRegistry(test_registry_config)
-    test_registry.config_file.http_request_timeout_s = 10
+    test_registry.use_cache(test_cache)
 
     # Run unit under test
-    for _ in test_registry._list_repos():
-        pass
+    actual_repos = test_registry.repos
 
     # Check expectations
-    mock_requests_get.assert_called_once_with(test_repo_endpoint_url, 
-                                               timeout=test_registry.config_file.http_request_timeout_s)
-    mock_response.json.assert_called_once()
-    mock_user_output.error.assert_called_once_with(test_exception_text)
-    mock_user_output.msg.assert_called_once_with(f"Skipping [bold]{test_registry_config['name']}[/bold].")
+    assert actual_repos == test_cached_repos
+    assert actual_repos is not test_cached_repos
 
-@patch.object(registry.Core, "user_output")
-@patch.object(registry.Registry, "_list_repos")
-@patch.object(registry.Registry, "__init__")
-def test_Registry_repos(mock___init_: MagicMock, mock__list_repos: MagicMock, 
-                        mock_user_output: MagicMock):
-    # Test setup
-    mock___init_.return_value = None
+    mock__list_repos.assert_not_called()
+    mock_user_output.status_generator.assert_not_called()
 
-    test_registry_config = {}
+@patch.object(registry.Core, "config_file")
+def test_Registry__is_cache_fresh(mock_config_file: MagicMock):
+    # Test setup
+    mock_config_file.registry_cache_ttl_s = 600
+    test_registry = HelperRegistry({"name": "test_name", "url": "test_url"})
+    test_registry_with_ttl = HelperRegistry({"name": "test_name", "url": "test_url", 
+                                             "cache_ttl_s": 10})
+    test_cache = {
+        "updated_at": registry.time.time() - 60,
+        "repos": []
+    }
+    test_registry.cache = test_cache
+    test_registry_with_ttl.cache = test_cache
 
-    mock__repos = MagicMock()
+    # Run unit under test and check expectations
+    assert test_registry._is_cache_fresh() is True
+    assert test_registry_with_ttl._is_cache_fresh() is False
 
-    mock_generator = MagicMock()
-    mock__list_repos.return_value = mock_generator
+    test_registry.cache = {"updated_at": registry.time.time()}
+    assert test_registry._is_cache_fresh() is False
 
-    test_registry = HelperRegistry(test_registry_config)
-    test_registry._repos = mock__repos
+def test_Registry_use_cache_other_registry():
+    # Test setup
+    test_registry = HelperRegistry({"name": "test_name", "url": "test_url", 
+                                    "namespace": "test_namespace"})
+    test_cache = {
+        "url": "other_url",
+        "namespace": "test_namespace",
+        "repos": ["other_url/test_repo:latest"]
+    }
 
     # Run unit under test
-    actual_repos = test_registry.repos
+    test_registry.use_cache(test_cache)
 
     # Check expectations
-    assert actual_repos is mock__repos
-
-    mock___init_.assert_called_once()
-    mock__list_repos.assert_called_once()
-    mock_user_output.status_generator.assert_called_once_with(mock_generator)
+    assert test_cache == {
+        "url": "test_url",
+        "namespace": "test_namespace"
+    }
+    assert test_registry.cache is test_cache
 
 def test_DockerHub_invalid_registry_config() -> None:
     # Test setup
@@ -444,6 +592,26 @@ def test_DockerHub__get_tag_endpoint_url():
     assert expected_endpoint_url == actual_endpoint_url
 
 
+def test_DockerHub__get_next_page_url() -> None:
+    # Test setup
+    test_registry_config = {
+        "url": "test_url",
+        "name": "test_name",
+        "namespace": "test_namespace"
+    }
+    test_next_page_url = "test_url/v2/namespaces/test_namespace/repositories?page=2&page_size=100"
+
+    test_docker_hub = registry.DockerHub(test_registry_config)
+
+    # Run unit under test
+    actual_next_page_url = test_docker_hub._get_next_page_url(MagicMock(), 
+                                                              {"next": test_next_page_url})
+    actual_last_page_url = test_docker_hub._get_next_page_url(MagicMock(), {"next": None})
+
+    # Check expectations
+    assert actual_next_page_url == test_next_page_url
+    assert actual_last_page_url is None
+
 @patch.object(registry.Registry, "__init__")
 def test_DockerRegistry__append_repo_with_tag(mock___init__: MagicMock) -> None:
     # Test setup
@@ -506,6 +674,47 @@ def test_DockerRegistry__get_tag_endpoint_url():
     expected_endpoint_url = f"{test_registry_config['url']}/v2/{test_repo.split('/')[1]}/tags/list"
     assert expected_endpoint_url == actual_endpoint_url
 
+
+def test_DockerRegistry__get_next_page_url() -> None:
+    # Test setup
+    test_registry_config = {
+        "url": "http://localhost:5000",
+        "name": "test_name"
+    }
+    mock_response = MagicMock()
+    mock_response.url = "http://localhost:5000/v2/_catalog?n=100"
+    mock_response.links = {
+        "next": {
+            "url": "/v2/_catalog?last=test_repo&n=100",
+            "rel": "next"
+        }
+    }
+
+    test_docker_registry = registry.DockerRegistry(test_registry_config)
+
+    # Run unit under test
+    actual_next_page_url = test_docker_registry._get_next_page_url(mock_response, {})
+
+    # Check expectations
+    assert actual_next_page_url == "http://localhost:5000/v2/_catalog?last=test_repo&n=100"
+
+def test_DockerRegistry__get_next_page_url_last_page() -> None:
+    # Test setup
+    test_registry_config = {
+        "url": "http://localhost:5000",
+        "name": "test_name"
+    }
+    mock_response = MagicMock()
+    mock_response.links = {}
+
+    test_docker_registry = registry.DockerRegistry(test_registry_config)
+
+    # Run unit under test
+    actual_next_page_url = test_docker_registry._get_next_page_url(mock_response, {})
+
+    # Check expectations
+    assert actual_next_page_url is None
+
 @patch.object(registry.Core, "config_file")
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
@@ -539,11 +748,12 @@ def test_Registries(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock,
     mock_DockerHub.assert_called_once_with(mock_config_file.registries[0])
     mock_DockerRegistry.assert_called_once_with(mock_config_file.registries[1])
 
+@patch("dem.core.registry.RegistryCacheJSON")
 @patch.object(registry.Core, "config_file")
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
 def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock,
-                               mock_config_file: MagicMock) -> None:
+                               mock_config_file: MagicMock, mock_RegistryCacheJSON: MagicMock) -> None:
     # Test setup
     mock_config_file.registries = [
         {
@@ -571,6 +781,9 @@ def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: M
 
     test_registries = registry.Registries()
 
+    mock_registry_cache_json = MagicMock()
+    mock_RegistryCacheJSON.get_shared.return_value = mock_registry_cache_json
+
     # Run unit under test
     actual_repos = test_registries.list_repos([])
 
@@ -578,6 +791,40 @@ def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: M
     expected_repos = [*test_repos * 2]
     assert expected_repos == actual_repos
 
+    mock_registry_cache_json.get_entry.assert_has_calls([
+        call(mock_docker_hub._name), 
+        call(mock_docker_registry._name)
+    ])
+    mock_docker_hub.use_cache.assert_called_once_with(mock_registry_cache_json.get_entry.return_value)
+    mock_docker_registry.use_cache.assert_called_once_with(mock_registry_cache_json.get_entry.return_value)
+    mock_registry_cache_json.flush.assert_called_once()
+
+@patch("dem.core.registry.RegistryCacheJSON")
+@patch.object(registry.Core, "config_file")
+def test_Registries_invalidate_cache(mock_config_file: MagicMock, 
+                                     mock_RegistryCacheJSON: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registries = [
+        {
+            "name": "test_registry1",
+            "url": "https://registry_url1.io"
+        },
+        {
+            "name": "test_registry2",
+            "url": "https://registry_url2.io"
+        }
+    ]
+    mock_registry_cache_json = MagicMock()
+    mock_RegistryCacheJSON.get_shared.return_value = mock_registry_cache_json
+
+    test_registries = registry.Registries()
+
+    # Run unit under test
+    test_registries.invalidate_cache(["test_registry2"])
+
+    # Check expectations
+    mock_registry_cache_json.delete_entry.assert_called_once_with("test_registry2")
+
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.Registries, "_add_registry_instance")
 def test_Registries_add_registry(mock__add_registry_instance: MagicMock, 
@@ -618,8 +865,10 @@ def test_Registries_list_registry_configs(mock_config_file: MagicMock) -> None:
     # Check expectations
     assert actual_registry_list is mock_config_file.registries
 
+@patch("dem.core.registry.RegistryCacheJSON")
 @patch.object(registry.Core, "config_file")
-def test_Registries_delete_registry(mock_config_file: MagicMock) -> None:
+def test_Registries_delete_registry(mock_config_file: MagicMock, 
+                                    mock_RegistryCacheJSON: MagicMock) -> None:
     # Test setup
     mock_config_file.registries = [{
         "name": "test_registry_name",
@@ -636,4 +885,6 @@ def test_Registries_delete_registry(mock_config_file: MagicMock) -> None:
     assert not mock_config_file.registries
     assert not test_registries.registries
 
-    mock_config_file.flush.assert_called_once()
\ No newline at end of file
+    mock_config_file.flush.assert_called_once()
+    mock_RegistryCacheJSON.get_shared.return_value.delete_entry.assert_called_once_with("test_registry_name")
+    mock_RegistryCacheJSON.get_shared.return_value.flush.assert_called_once()
\ No newline at end of file
@@ -36,6 +36,26 @@ def test_cli_success(mock_Platform: MagicMock, mock_cli_main: MagicMock, mock_Co
     mock_platform.config_file.update.assert_called_once()
     mock_cli_main.typer_cli.assert_called_once_with(prog_name=__command__)
 
+@patch.dict("dem.__main__.os.environ", {"_DEM_COMPLETE": "complete_bash"})
+@patch("dem.__main__.NameIndexJSON")
+@patch("dem.__main__.dem.cli.main")
+@patch("dem.__main__.Platform")
+def test_cli_completion(mock_Platform: MagicMock, mock_cli_main: MagicMock, 
+                        mock_NameIndexJSON: MagicMock) -> None:
+    # Test setup
+    mock_name_index = MagicMock()
+    mock_NameIndexJSON.return_value = mock_name_index
+
+    # Run unit under test
+    __main__.main()
+
+    # Check expectations
+    assert mock_cli_main.name_index is mock_name_index
+
+    mock_Platform.assert_not_called()
+    mock_name_index.update.assert_called_once()
+    mock_cli_main.typer_cli.assert_called_once_with(prog_name=__command__)
+
 @patch("dem.__main__.stderr.print")
 @patch("dem.__main__.TUIUserOutput")
 @patch("dem.__main__.Core")